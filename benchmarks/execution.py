@@ -0,0 +1,112 @@
+"""
+Compares graphql-core's executor with compiled execution plans.
+
+    python benchmarks/execution.py [--items 1000] [--repeat 5]
+
+A query returning `--items` objects (with scalar, nested object, argument
+and list fields) is executed from an already parsed document, so only
+execution is measured.
+"""
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from time import perf_counter
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import graphql  # noqa: E402
+
+import gqltype  # noqa: E402
+from gqltype.execution import ExecutionContext, get_compiled_query  # noqa: E402
+
+QUERY = """
+query($prefix: String!) {
+    itemsList {
+        id
+        name
+        price
+        tags
+        label(prefix: $prefix)
+        owner { id name }
+    }
+}
+"""
+
+
+@dataclass
+class Owner:
+    id: int
+    name: str
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    price: float
+    tags: List[str]
+    owner: Owner
+
+    def resolve_label(self, prefix: str) -> str:
+        return f"{prefix}{self.name}"
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        fn()
+        timings.append(perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    owner = Owner(id=1, name="owner")
+    items = [
+        Item(id=i, name=f"item {i}", price=i / 10, tags=["a", "b"], owner=owner)
+        for i in range(args.items)
+    ]
+
+    def items_list() -> List[Item]:
+        return items
+
+    schema = gqltype.Schema(queries=[items_list]).build()
+    document = graphql.parse(QUERY)
+    variables = {"prefix": "#"}
+
+    def execute_standard():
+        result = graphql.execute(
+            schema,
+            document,
+            variable_values=variables,
+            execution_context_class=ExecutionContext,
+        )
+        assert result.errors is None, result.errors
+        return result
+
+    compiled_query = get_compiled_query(schema, document)
+    assert compiled_query is not None
+
+    def execute_compiled():
+        result = compiled_query(variable_values=variables)
+        assert result.errors is None, result.errors
+        return result
+
+    assert execute_standard().data == execute_compiled().data
+
+    standard = best_of(args.repeat, execute_standard) * 1000
+    compiled = best_of(args.repeat, execute_compiled) * 1000
+    print(f"{'executor':>10} {'ms':>8}")
+    print(f"{'standard':>10} {standard:>8.1f}")
+    print(f"{'compiled':>10} {compiled:>8.1f}  ({standard / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
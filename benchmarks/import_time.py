@@ -0,0 +1,65 @@
+"""
+Measures `import gqltype` time in fresh interpreters.
+
+    python benchmarks/import_time.py [--runs 20] [--module gqltype] [--max-ms 100]
+
+With `--max-ms` the script exits with non-zero status if the median import time
+exceeds the limit (to catch regressions in CI).
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+CODE = """
+import time
+started = time.perf_counter()
+import {module}
+print(time.perf_counter() - started)
+"""
+
+
+def measure(module: str) -> float:
+    output = subprocess.check_output(
+        [sys.executable, "-c", CODE.format(module=module)], universal_newlines=True
+    )
+    return float(output.strip().splitlines()[-1])
+
+
+def loaded_modules(module: str, prefixes=("graphql", "aniso8601")) -> list:
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], universal_newlines=True
+    )
+    return sorted(
+        {
+            name.split(".")[0]
+            for name in output.split()
+            if name.split(".")[0] in prefixes
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--module", default="gqltype")
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    timings = sorted(measure(args.module) * 1000 for _ in range(args.runs))
+    median = statistics.median(timings)
+
+    print(f"import {args.module} ({args.runs} runs)")
+    print(f"  min:    {timings[0]:.2f} ms")
+    print(f"  median: {median:.2f} ms")
+    print(f"  max:    {timings[-1]:.2f} ms")
+    print(f"  heavy dependencies loaded: {loaded_modules(args.module) or 'none'}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"Median import time exceeds {args.max_ms} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compares JSON codecs of the views on large list responses.
+
+    python benchmarks/json_codec.py [--items 50000] [--repeat 5]
+
+A response with `--items` objects (strings, numbers, nulls, nested objects
+and lists, like results of a list query) is encoded to bytes and parsed
+back by every installed codec (see `gqltype.contrib.json_codec`).
+"""
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gqltype.contrib.json_codec import CODECS  # noqa: E402
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        fn()
+        timings.append(perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response = {
+        "data": {
+            "itemsList": [
+                {
+                    "id": str(i),
+                    "name": f"item {i} — ünïcode",
+                    "price": i / 10,
+                    "count": i,
+                    "available": i % 2 == 0,
+                    "description": None,
+                    "tags": ["a", "b", "c"],
+                    "owner": {"id": str(i % 100), "name": f"owner {i % 100}"},
+                }
+                for i in range(args.items)
+            ]
+        }
+    }
+
+    codecs = []
+    for codec_cls in CODECS:
+        try:
+            codecs.append(codec_cls())
+        except ImportError:
+            print(f"{codec_cls.name} is not installed")
+
+    baseline = None
+    print(f"{'codec':>8} {'MB':>6} {'dumps ms':>10} {'loads ms':>10}")
+    for codec in reversed(codecs):  # stdlib first
+        encoded = codec.dumps(response)
+        assert codec.loads(encoded) == response
+
+        dumps = best_of(args.repeat, lambda: codec.dumps(response)) * 1000
+        loads = best_of(args.repeat, lambda: codec.loads(encoded)) * 1000
+        if baseline is None:
+            baseline = dumps
+        print(
+            f"{codec.name:>8} {len(encoded) / 2 ** 20:>6.1f} {dumps:>10.1f} "
+            f"{loads:>10.1f}  ({baseline / dumps:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
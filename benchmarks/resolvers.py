@@ -0,0 +1,98 @@
+"""
+Compares generic and generated (`compile_resolver_wrappers`) resolver wrappers.
+
+    python benchmarks/resolvers.py [--items 10000] [--repeat 5]
+
+Runs a query returning a list of `--items` objects, each of them has a field
+with a resolver accepting special params (`self`, `info`) and an argument with
+a value converter; also measures bare wrapper calls.
+"""
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from time import perf_counter
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import graphql  # noqa: E402
+
+import gqltype  # noqa: E402
+
+
+class Unit(Enum):
+    METER = "meter"
+    INCH = "inch"
+
+
+@dataclass
+class Item:
+    name: str
+    length: float
+
+    def resolve_size(self, info, unit: Unit = Unit.METER, scale: int = 1) -> float:
+        return self.length * scale
+
+
+def _enum_converter(arg_python_type, **kw):
+    if isinstance(arg_python_type, type) and issubclass(arg_python_type, Enum):
+        return arg_python_type
+    return None
+
+
+def build_schema(items_count: int, compiled: bool) -> graphql.GraphQLSchema:
+    items = [Item(name=f"item {i}", length=float(i)) for i in range(items_count)]
+
+    def items_list() -> List[Item]:
+        return items
+
+    return gqltype.Schema(
+        queries=[items_list],
+        compile_resolver_wrappers=compiled,
+        hook__prepare_resolver_param_value_converter=_enum_converter,
+    ).build()
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        fn()
+        timings.append(perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    query = "{ itemsList { name size(unit: INCH, scale: 2) } }"
+
+    print(f"{'wrappers':>10} {'query ms':>10} {'call ns':>9}")
+    for compiled in (False, True):
+        schema = build_schema(args.items, compiled)
+        result = graphql.graphql_sync(schema, query)
+        assert result.errors is None, result.errors
+
+        resolve = schema.get_type("Item").fields["size"].resolve
+        item = Item(name="item", length=1.0)
+        calls = 100000
+
+        def call_resolver():
+            for _ in range(calls):
+                resolve(item, None, unit="inch", scale=2)
+
+        query_time = best_of(args.repeat, lambda: graphql.graphql_sync(schema, query))
+        call_time = best_of(args.repeat, call_resolver)
+        print(
+            f"{'generated' if compiled else 'generic':>10} "
+            f"{query_time * 1000:>10.1f} {call_time / calls * 1e9:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Measures serialization and parsing of gqltype scalars.
+
+    python benchmarks/scalars.py [--items 10000] [--repeat 5]
+
+For DateTime, Date, Time, Duration, Decimal and UUID measures:
+- `serialize` of python values and of strings (where strings are accepted);
+- `parse_value` of strings;
+- a query returning `List[scalar]` of `--items` values, executed with
+  graphql-core's and gqltype's (bulk serialization) execution contexts.
+"""
+import argparse
+import os
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from time import perf_counter
+from typing import List
+from uuid import UUID, uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import graphql  # noqa: E402
+
+import gqltype  # noqa: E402
+from gqltype import graphql_types  # noqa: E402
+from gqltype.execution import ExecutionContext  # noqa: E402
+
+VALUES = {
+    "DateTime": (
+        datetime,
+        lambda i: datetime(2020, 1, 1, tzinfo=timezone.utc)
+        + timedelta(seconds=i * 7919),
+    ),
+    "Date": (date, lambda i: date(2020, 1, 1) + timedelta(days=i % 3000)),
+    "Time": (time, lambda i: time(i % 24, i % 60, i % 60, i % 1000)),
+    "Duration": (
+        timedelta,
+        lambda i: timedelta(seconds=i * 7919, microseconds=i % 10 * 100000),
+    ),
+    "Decimal": (Decimal, lambda i: Decimal(i) / 100),
+    "UUID": (UUID, lambda i: uuid4()),
+}
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        fn()
+        timings.append(perf_counter() - started)
+    return min(timings)
+
+
+def build_schema(py_type, values) -> graphql.GraphQLSchema:
+    def values_list() -> List[py_type]:
+        return values
+
+    return gqltype.Schema(queries=[values_list]).build()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'scalar':>9} {'serialize':>10} {'ser. str':>10} {'parse':>10} "
+        f"{'list ms':>9} {'bulk ms':>9}"
+    )
+    for name, (py_type, make_value) in VALUES.items():
+        scalar = getattr(graphql_types, name)
+        values = [make_value(i) for i in range(args.items)]
+        strings = [scalar.serialize(value) for value in values]
+
+        def per_value_ns(fn, items):
+            return best_of(args.repeat, lambda: [fn(v) for v in items]) / len(items)
+
+        serialize = per_value_ns(scalar.serialize, values) * 1e9
+        if name in ("Time", "Duration"):
+            serialize_str = "-"  # only python values are accepted
+        else:
+            serialize_str = f"{per_value_ns(scalar.serialize, strings) * 1e9:.0f}ns"
+        if name == "Duration":
+            # only the durations with days can be parsed back
+            strings = [s for s in strings if s.startswith("P")]
+        parse = per_value_ns(scalar.parse_value, strings) * 1e9
+
+        schema = build_schema(py_type, values)
+        query = "{ valuesList }"
+
+        def execute(execution_context_class=None):
+            result = graphql.graphql_sync(
+                schema, query, execution_context_class=execution_context_class
+            )
+            assert result.errors is None, result.errors
+
+        list_ms = best_of(args.repeat, execute) * 1000
+        bulk_ms = best_of(args.repeat, lambda: execute(ExecutionContext)) * 1000
+
+        print(
+            f"{name:>9} {serialize:>8.0f}ns {serialize_str:>10} {parse:>8.0f}ns "
+            f"{list_ms:>9.1f} {bulk_ms:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
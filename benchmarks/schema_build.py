@@ -0,0 +1,103 @@
+"""
+Measures how `Schema.build()` scales with the size of the schema.
+
+    python benchmarks/schema_build.py [--sizes 100 1000 10000] [--repeat 3]
+                                      [--report] [--json results.json]
+
+For every size a synthetic schema (see `synthetic.py`) is generated and built:
+
+- build time (best of `--repeat` runs, each run uses freshly generated classes,
+  so introspection caches do not leak between runs);
+- peak memory allocated during the build (measured in a separate run, as
+  `tracemalloc` slows the build down);
+- per-phase breakdown collected with `BuildStats` (a separate profiled run).
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gqltype.profiling import BuildStats  # noqa: E402
+
+from synthetic import generate_schema  # noqa: E402
+
+
+def _build(size: int, **build_kw):
+    schema = generate_schema(size)
+    gc.collect()
+    started = perf_counter()
+    schema.build(**build_kw)
+    return perf_counter() - started, schema
+
+
+def measure_time(size: int, repeat: int) -> float:
+    return min(_build(size)[0] for _ in range(repeat))
+
+
+def measure_memory(size: int) -> int:
+    schema = generate_schema(size)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        schema.build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure_phases(size: int) -> BuildStats:
+    stats = BuildStats()
+    _build(size, profile=stats)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument(
+        "--report", action="store_true", help="print full BuildStats report"
+    )
+    parser.add_argument("--json", help="save results to a json file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'size':>8} {'build ms':>10} {'ms/type':>8} {'peak MB':>9}  phases (ms)")
+    for size in args.sizes:
+        build_time = measure_time(size, args.repeat)
+        peak = None if args.no_memory else measure_memory(size)
+        stats = measure_phases(size)
+        phases = {name: t.total * 1000 for name, t in stats.phases.items()}
+
+        results.append(
+            {
+                "size": size,
+                "build_ms": build_time * 1000,
+                "peak_memory_bytes": peak,
+                "phases_ms": phases,
+                "transform_calls": sum(t.calls for t in stats.types.values()),
+                "types": len(stats.types),
+            }
+        )
+        print(
+            f"{size:>8} {build_time * 1000:>10.1f} {build_time * 1000 / size:>8.3f} "
+            f"{'-' if peak is None else f'{peak / 2 ** 20:.1f}':>9}  "
+            + ", ".join(f"{name}: {ms:.1f}" for name, ms in phases.items())
+        )
+        if args.report:
+            print(stats.report())
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Generator of synthetic schemas for benchmarks.
+
+A schema of size `n` has `n` object dataclasses implementing interfaces
+(`abc.ABC` bases), plus enums, input types, unions, `Connection(...)` types
+and resolvers with many arguments, roughly proportional to `n`.
+"""
+from abc import ABC
+from dataclasses import make_dataclass
+from enum import Enum
+from typing import List, Optional, Union
+
+import gqltype
+from gqltype.contrib.connection import Connection
+
+
+def _function(name: str, annotations: dict, defaults=(), method=False):
+    """Creates a function with given signature (as if it was defined in code)"""
+    params = [p for p in annotations if p != "return"]
+    if method:
+        params.insert(0, "self")
+    namespace = {}
+    exec(f"def {name}({', '.join(params)}):\n    return None", namespace)
+
+    fn = namespace[name]
+    fn.__defaults__ = tuple(defaults) or None
+    fn.__annotations__ = dict(annotations)
+    return fn
+
+
+def generate_schema(n: int, **options) -> gqltype.Schema:
+    n_interfaces = n // 20 + 1
+    n_enums = n // 10 + 1
+    n_inputs = n // 10 + 1
+    n_unions = n // 10 + 1
+
+    enums = [
+        Enum(f"Enum{i}", {f"VALUE_{v}": f"value-{v}" for v in range(5)})
+        for i in range(n_enums)
+    ]
+
+    inputs = [
+        make_dataclass(
+            f"Filter{i}",
+            [
+                ("query", Optional[str]),
+                ("kind", Optional[enums[i % n_enums]]),
+                ("ids", Optional[List[str]]),
+                ("min_count", Optional[int]),
+            ],
+        )
+        for i in range(n_inputs)
+    ]
+
+    interfaces = [
+        make_dataclass(
+            f"Interface{i}",
+            [("id", str), (f"label_{i}", str)],
+            bases=(ABC,),
+        )
+        for i in range(n_interfaces)
+    ]
+
+    objects = []
+    for i in range(n):
+        kind = enums[i % n_enums]
+        related = objects[i - 1] if objects else None
+        namespace = {}
+
+        if related is not None:
+            namespace["resolve_related"] = _function(
+                "resolve_related",
+                {
+                    "first": Optional[int],
+                    "after": Optional[str],
+                    "last": Optional[int],
+                    "before": Optional[str],
+                    "filter": inputs[i % n_inputs],
+                    "kind": kind,
+                    "include_hidden": bool,
+                    "return": Connection(related, prefix=f"Object{i}Related"),
+                },
+                defaults=(None, None, None, None, None, list(kind)[0], False),
+                method=True,
+            )
+            namespace["resolve_parent"] = _function(
+                "resolve_parent", {"return": Optional[related]}, method=True
+            )
+
+        objects.append(
+            make_dataclass(
+                f"Object{i}",
+                [
+                    ("name", str),
+                    ("count", int),
+                    ("rank", Optional[float]),
+                    ("kind", kind),
+                    ("tags", List[str]),
+                ],
+                bases=(interfaces[i % n_interfaces],),
+                namespace=namespace,
+            )
+        )
+
+    unions = [
+        Union[tuple(objects[(i + k) % n] for k in range(3))] for i in range(n_unions)
+    ]
+
+    queries = []
+    for i, obj in enumerate(objects[::10]):
+        queries.append(
+            _function(
+                f"get_object_{i}",
+                {"id": str, "filter": inputs[i % n_inputs], "return": obj},
+            )
+        )
+    for i, union in enumerate(unions):
+        queries.append(
+            _function(
+                f"search_{i}",
+                {"query": str, "limit": Optional[int], "return": List[union]},
+            )
+        )
+    for i, interface in enumerate(interfaces):
+        queries.append(
+            _function(f"get_interface_{i}", {"id": str, "return": interface})
+        )
+
+    mutations = [
+        _function(
+            f"update_object_{i}",
+            {"id": str, "data": inputs[i % n_inputs], "return": obj},
+        )
+        for i, obj in enumerate(objects[::20])
+    ]
+
+    return gqltype.Schema(
+        queries=queries, mutations=mutations, types=objects, **options
+    )
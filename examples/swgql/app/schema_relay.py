@@ -14,6 +14,7 @@ from gqltype.contrib.connection import (
     with_connection_pagination,
 )
 from gqltype.contrib.starlette import GraphQLApp
+from gqltype.utils.type_resolver import by_id_prefix
 
 from starlette.applications import Starlette
 from starlette.routing import Route
@@ -71,11 +72,20 @@ class Person(Node):
         data = await storage.get_objects("films", self["films"])
         return prepare_connection_slice(data, pagination_params=kwargs)
 
-    async def resolve_homeworld(self) -> Planet:
-        return await storage.get_object("planets", self["homeworld"])
-
-    async def resolve_species(self) -> List[Species]:
-        return await storage.get_objects("species", self["species"])
+    async def resolve_homeworld(self, loaders) -> Planet:
+        # homeworlds of all people in a response are loaded at once
+        return await loaders[storage.load_planets].load(self["homeworld"])
+
+    @gqltype.batch_resolver
+    async def resolve_species(sources: List[Person]) -> List[List[Species]]:
+        # species of all people in a list are requested at once
+        ids = [species_id for person in sources for species_id in person["species"]]
+        items = await storage.get_objects("species", ids)
+        species = {item["id"]: item for item in items}
+        return [
+            [species[storage.url_to_id(species_id)] for species_id in person["species"]]
+            for person in sources
+        ]
 
     def resolve_mass(self) -> Optional[float]:
         try:
@@ -84,18 +94,7 @@ class Person(Node):
             return None
 
 
-def resolve_node_type(value, info, interface_type):
-    id_prefix = value["id"].split(":", 1)[0]
-    return {
-        "people": Person,
-        "planets": Planet,
-        "species": Species,
-        "starships": Starship,
-        "films": Film,
-    }.get(id_prefix)
-
-
-async def node(id: str) -> gqltype.T(Node, resolve_type=resolve_node_type):
+async def node(id: str) -> Node:
     obj_type = id.split(":", 1)[0]
     return await storage.get_object(obj_type, id)
 
@@ -110,4 +109,16 @@ async def people(**params) -> Connection(Person):
     return prepare_connection_slice(data, params)
 
 
-schema = gqltype.Schema(queries=[node, person, people])
+schema = gqltype.Schema(
+    queries=[node, person, people],
+    # objects are dicts, their types are defined by id prefixes (e.g. "people:1")
+    type_discriminator=by_id_prefix(
+        {
+            "people": Person,
+            "planets": Planet,
+            "species": Species,
+            "starships": Starship,
+            "films": Film,
+        }
+    ),
+)
@@ -68,5 +68,11 @@ class Storage:
         items = await self.get_objects(objects_type, ids=[object_id])
         return next(iter(items))
 
+    async def load_planets(self, ids: List[str]) -> List[Optional[dict]]:
+        """Batch function for `DataLoader`: planets in the order of `ids`"""
+        items = await self.get_objects("planets", ids)
+        planets = {item["id"]: item for item in items}
+        return [planets.get(self.url_to_id(planet_id)) for planet_id in ids]
+
 
 storage = Storage()
@@ -1,36 +1,61 @@
-from .decorators import query, resolver, mutation, subscription, schema_options
+import sys
+
+from .decorators import (
+    query,
+    resolver,
+    batch_resolver,
+    mutation,
+    subscription,
+    schema_options,
+)
 from .utils import (
     extend_params_definition,
     override_params_definition,
 )
-from .graphql_types import (
-    ID,
-    UUID,
-    Bool,
-    Int,
-    Float,
-    Decimal,
-    String,
-    Date,
-    Time,
-    Duration,
-    DateTime,
-)
-from .schema import Schema
 from .transform.type_container import T
 
+# `Schema` and scalars require graphql-core (and scalars' own dependencies),
+# `DataLoader` requires asyncio, they are imported on first access,
+# so `import gqltype` stays cheap.
+_SCALARS = (
+    "ID",
+    "UUID",
+    "Bool",
+    "Int",
+    "Float",
+    "Decimal",
+    "String",
+    "Date",
+    "Time",
+    "DateTime",
+    "Duration",
+)
+
+
+def __getattr__(name):
+    if name in _SCALARS:
+        from . import graphql_types
+
+        value = T(getattr(graphql_types, name))
+    elif name == "Schema":
+        from .schema import Schema as value
+    elif name == "DataLoader":
+        from .dataloader import DataLoader as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_SCALARS, "Schema", "DataLoader"})
+
+
+if sys.version_info < (3, 7):  # no module `__getattr__` (PEP 562)
+    for _name in (*_SCALARS, "Schema", "DataLoader"):
+        __getattr__(_name)
 
-ID = T(ID)
-UUID = T(UUID)
-Bool = T(Bool)
-Int = T(Int)
-Float = T(Float)
-Decimal = T(Decimal)
-String = T(String)
-Date = T(Date)
-Time = T(Time)
-DateTime = T(DateTime)
-Duration = T(Duration)
 
 from typing import Union as PyUnion
 
@@ -0,0 +1,296 @@
+"""
+Caching of field values.
+
+A field declares its cache policy with `T(...)` (or dataclass field metadata):
+
+    class Person:
+        def resolve_homeworld(self) -> T(Planet, cache_ttl=60, cache_tags=["pl"]):
+            ...
+
+    @gqltype.mutation
+    def rename_planet(id: str, name: str) -> T(Planet, invalidate_cache_tags=["pl"]):
+        ...
+
+- `cache_ttl` - seconds a value is kept;
+- `cache_scope` - "public" (shared by all requests, the default) or "private"
+  (values are kept per client, `user` of the request context, which is set
+  by the views from `get_user(request)` option; see `get_private_scope_key`);
+- `cache_tags` - tags of cached values, a list or a function receiving
+  the source value and field arguments;
+- `invalidate_cache_tags` - tags invalidated when a (mutation) field is resolved.
+
+Values are cached per field, source value (by its `id`, see `get_source_key`)
+and arguments. Values of sources without `id` and of unhashable arguments are
+not cached ("bypasses" of the stats).
+
+The cache backend is `Schema(field_cache=...)` (an `InMemoryCache` by default),
+its hit/miss counters are available via `schema.field_cache.stats`. Policies
+are also available as `extensions["cache"]` of graphql fields.
+"""
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from functools import wraps
+import inspect
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+import graphql
+
+from .utils import MISSING
+
+CachePolicy = namedtuple("CachePolicy", ["ttl", "scope", "tags"])
+
+PUBLIC = "public"
+PRIVATE = "private"
+
+
+class CacheStats:
+    """Counters of a cache backend"""
+
+    __slots__ = ("hits", "misses", "bypasses", "evictions", "invalidations")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            **{name: getattr(self, name) for name in self.__slots__},
+            "hit_rate": self.hit_rate,
+        }
+
+    def __repr__(self):
+        return f"<CacheStats {self.as_dict()}>"
+
+
+class CacheBackend:
+    """
+    Interface of cache backends.
+
+    `get` returns `MISSING` for unknown (or expired) keys, `invalidate` drops
+    values having any of the tags. Backends count hits/misses in `stats`.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key) -> Any:
+        raise NotImplementedError
+
+    def set(self, key, value, ttl: float, tags: Iterable[str] = ()) -> None:
+        raise NotImplementedError
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryCache(CacheBackend):
+    """In-process LRU cache with expiration of values"""
+
+    def __init__(self, max_size: int = 10000, clock: Callable[[], float] = monotonic):
+        super().__init__()
+        self.max_size = max_size
+        self.clock = clock
+        # key -> (expires_at, value, tags)
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._tags: Dict[str, Set[Any]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<InMemoryCache max_size={self.max_size}>"
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[1]
+            self._remove(key)
+
+        self.stats.misses += 1
+        return MISSING
+
+    def set(self, key, value, ttl, tags=()):
+        if key in self._entries:
+            self._remove(key)
+
+        tags = frozenset(tags)
+        self._entries[key] = (self.clock() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def invalidate(self, tags):
+        removed = 0
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+
+        self.stats.invalidations += removed
+        return removed
+
+    def clear(self):
+        self._entries.clear()
+        self._tags.clear()
+
+    def _remove(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+def get_source_key(source):
+    """
+    Identifies source values by their `id` (`None` for root fields), returns
+    `MISSING` for values without `id`, such values are not cached (they're
+    usually created per request, so they would never be hit).
+    """
+    if source is None:
+        return None
+    if isinstance(source, Mapping):
+        id_ = source.get("id")
+    else:
+        id_ = getattr(source, "id", None)
+    return MISSING if id_ is None else ("id", id_)
+
+
+def get_private_scope_key(info):
+    """
+    Identifies the client of private values: `user` of the request context
+    (the views set it with their `get_user` option), values of anonymous
+    clients (`None`) are not cached.
+    """
+    context = info.context
+    if isinstance(context, Mapping):
+        return context.get("user")
+    return getattr(context, "user", None)
+
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+    return value
+
+
+def _get_tags(tags, source, args) -> Iterable[str]:
+    return tags(source, args) if callable(tags) else tags
+
+
+def _cache_resolver(resolve_fn, cache, field_key, policy, ctx):
+    get_scope_key = ctx.private_cache_scope_key
+    get_source = ctx.cache_source_key
+
+    def store(key, value, source, args):
+        cache.set(key, value, policy.ttl, _get_tags(policy.tags, source, args))
+        return value
+
+    async def resolve_async(key, result, source, args):
+        return store(key, await result, source, args)
+
+    @wraps(resolve_fn)
+    def resolve(source, info, **args):
+        scope_key = None
+        if policy.scope == PRIVATE:
+            scope_key = get_scope_key(info)
+            if scope_key is None:  # anonymous clients are not cached
+                cache.stats.bypasses += 1
+                return resolve_fn(source, info, **args)
+
+        source_key = get_source(source)
+        if source_key is MISSING:
+            cache.stats.bypasses += 1
+            return resolve_fn(source, info, **args)
+
+        key = (field_key, scope_key, source_key, _freeze(args))
+        try:
+            value = cache.get(key)
+        except TypeError:  # unhashable arguments
+            cache.stats.bypasses += 1
+            return resolve_fn(source, info, **args)
+
+        if value is not MISSING:
+            return value
+
+        result = resolve_fn(source, info, **args)
+        if inspect.isawaitable(result):
+            return resolve_async(key, result, source, args)
+        return store(key, result, source, args)
+
+    return resolve
+
+
+def _invalidating_resolver(resolve_fn, cache, tags):
+    def invalidate(result, source, args):
+        cache.invalidate(_get_tags(tags, source, args))
+        return result
+
+    async def resolve_async(result, source, args):
+        return invalidate(await result, source, args)
+
+    @wraps(resolve_fn)
+    def resolve(source, info, **args):
+        result = resolve_fn(source, info, **args)
+        if inspect.isawaitable(result):
+            return resolve_async(result, source, args)
+        return invalidate(result, source, args)
+
+    return resolve
+
+
+def prepare_cached_field_resolver(ctx, field_key, resolve_fn, field_kw):
+    """
+    Wraps the field resolver according to cache options of the field
+    (values of the field are cached and/or resolving it invalidates tags).
+
+    The cache policy is recorded to `extensions["cache"]` of the field
+    as a hint (e.g. for HTTP caching of responses).
+    """
+    cache: Optional[CacheBackend] = ctx.field_cache
+    ttl = field_kw.get("cache_ttl")
+    invalidate_tags = field_kw.get("invalidate_cache_tags")
+    if cache is None or not (ttl or invalidate_tags):
+        return resolve_fn
+
+    if resolve_fn is None:
+        resolve_fn = graphql.default_field_resolver
+
+    if invalidate_tags:
+        resolve_fn = _invalidating_resolver(resolve_fn, cache, invalidate_tags)
+
+    if ttl:
+        policy = CachePolicy(
+            ttl=ttl,
+            scope=field_kw.get("cache_scope", PUBLIC),
+            tags=field_kw.get("cache_tags", ()),
+        )
+        if policy.scope not in (PUBLIC, PRIVATE):
+            raise ValueError(f"Unknown cache scope of {field_key}: {policy.scope!r}")
+        resolve_fn = _cache_resolver(resolve_fn, cache, field_key, policy, ctx)
+        field_kw["extensions"] = {**(field_kw.get("extensions") or {}), "cache": policy}
+
+    return resolve_fn
@@ -1,9 +1,10 @@
-from collections import ChainMap, namedtuple
+from collections import namedtuple
 from functools import partial
 import inspect
 import logging
 import operator
 from typing import Tuple
+from weakref import WeakSet
 
 from .utils.resolver import (
     prepare_field_resolver,
@@ -16,24 +17,55 @@ from .utils.resolver import (
     prepare_default_interface_type_resolver,
     prepare_input_object_type_out_type,
 )
+from .cache import (
+    get_private_scope_key,
+    get_source_key,
+    prepare_cached_field_resolver,
+)
+from .dataloader import get_loaders
 from .utils.camel_case import to_camel_case
+from .utils.type_resolver import by_key
 
 logger = logging.getLogger(__name__)
 
 
 class Context:
-    _context: ChainMap
+    """
+    Container of options.
 
-    def __init__(self, parent_context=None, **kw):
-        parent_context = parent_context._context if parent_context else ChainMap()
-        self._context = parent_context.new_child(kw)
+    Options are stored flat in the instance `__dict__`, so reading an option is
+    a regular attribute lookup (options shadow class level defaults and methods).
+    A derived context (`ctx(**kw)`) copies options of its parent and overlays
+    them with `kw`. Changes made to a context later on are propagated to derived
+    contexts, unless they define the option themselves.
+    """
 
-    def __getattribute__(self, name):
-        try:
-            ctx = super().__getattribute__("_context")
-            return ctx[name]
-        except (KeyError, AttributeError):
-            return super().__getattribute__(name)
+    __slots__ = ("__dict__", "__weakref__", "_own", "_children")
+
+    def __init__(self, parent_context=None, **kw):
+        object.__setattr__(self, "_own", kw)
+        object.__setattr__(self, "_children", None)
+
+        if parent_context is not None:
+            self.__dict__.update(parent_context.__dict__)
+            parent_context._add_child(self)
+        self.__dict__.update(kw)
+
+    def _add_child(self, ctx):
+        if self._children is None:
+            object.__setattr__(self, "_children", WeakSet())
+        self._children.add(ctx)
+
+    def _set_option(self, name, val):
+        self._own[name] = val
+        self._inherit_option(name, val)
+
+    def _inherit_option(self, name, val):
+        self.__dict__[name] = val
+        if self._children:
+            for child in list(self._children):
+                if name not in child._own:
+                    child._inherit_option(name, val)
 
     def __getitem__(self, name):
         try:
@@ -43,23 +75,21 @@ class Context:
 
     def get(self, name, *default):
         if default:
-            return self._context.get(name, default[0])
-        return self._context.get(name)
+            return self.__dict__.get(name, default[0])
+        return self.__dict__.get(name)
 
     def __setattr__(self, name, val):
-        if name == "_context":
-            super().__setattr__(name, val)
-        else:
-            self._context[name] = val
+        self._set_option(name, val)
 
     def __contains__(self, name):
-        return name in self._context
+        return name in self.__dict__
 
     def __call__(self, **kw):
         return self.__class__(self, **kw)
 
     def update(self, kw):
-        self._context.update(kw)
+        for name, val in kw.items():
+            self._set_option(name, val)
 
 
 class HooksContext(Context):
@@ -87,7 +117,8 @@ class PresetsContext(HooksContext):
 
     def _extract_options_and_presets(self, options: dict) -> Tuple[dict, dict]:
         presets = {k: v for k, v in options.items() if k.startswith("preset__")}
-        options = {k: v for k, v in options.items() if k not in presets}
+        if presets:
+            options = {k: v for k, v in options.items() if k not in presets}
         return options, presets
 
     def _handle_presets(self, presets: dict):
@@ -100,7 +131,7 @@ class PresetsContext(HooksContext):
             fn(val)
 
     def register_preset(self, name: str, fn) -> None:
-        self._context["preset__{}".format(name)] = fn
+        self._set_option("preset__{}".format(name), fn)
 
     def __setattr__(self, name, val):
         if name.startswith("preset__"):
@@ -135,9 +166,16 @@ class RootContext(PresetsContext):
     preprocess_resolver_params: bool = True
     source_param_names = ("obj", "self")
     info_param_names = ("info",)
+    # name of the param receiving a list of source values in batch resolvers
+    batch_source_param_names = ("sources",)
     extra_special_params = {
-        "request": lambda call_ctx: call_ctx.info.context["request"]
+        "request": lambda call_ctx: call_ctx.info.context["request"],
+        # per-request registry of data loaders, see `gqltype.dataloader`
+        "loaders": lambda call_ctx: get_loaders(call_ctx.info.context),
     }
+    # Generate a specialized wrapper for every resolver at build time
+    # (instead of generic wrappers inspecting params on every call)
+    compile_resolver_wrappers: bool = True
 
     hook__prepare_field_resolver = prepare_field_resolver
     hook__prepare_default_field_resolver = prepare_default_field_resolver
@@ -145,6 +183,13 @@ class RootContext(PresetsContext):
     hook__prepare_union_type_resolver = prepare_union_type_resolver
     hook__prepare_default_union_type_resolver = prepare_default_union_type_resolver
 
+    # How to resolve types of union/interface values which classes are unknown
+    # (e.g. dicts), see `gqltype.utils.type_resolver`
+    type_discriminator = by_key("__typename")
+    # Limit interface implementations to the types used in the schema
+    # (otherwise every subclass of an interface is transformed when needed)
+    restrict_implementations_to_schema: bool = False
+
     hook__prepare_interface_type_resolver = prepare_interface_type_resolver
     hook__prepare_default_interface_type_resolver = (
         prepare_default_interface_type_resolver
@@ -152,6 +197,12 @@ class RootContext(PresetsContext):
 
     hook__prepare_input_object_type_out_type = prepare_input_object_type_out_type
 
+    # Cache of field values (`Schema` creates an in-memory one), see `gqltype.cache`
+    field_cache = None
+    cache_source_key = staticmethod(get_source_key)
+    private_cache_scope_key = staticmethod(get_private_scope_key)
+    hook__prepare_cached_field_resolver = prepare_cached_field_resolver
+
     # Convertion of param values passed to resolver
     preprocess_resolver_params_values: bool = True
     hook__prepare_resolver_param_value_converter = (
@@ -176,3 +227,11 @@ class RootContext(PresetsContext):
 class TransformContext(RootContext):
     transformer: "Transformer"
     types_cache: dict
+
+    # `BuildStats` instance when the build is being profiled
+    build_stats = None
+
+    def __call__(self, **kw):
+        if self.build_stats is not None:
+            self.build_stats.context_cloned()
+        return super().__call__(**kw)
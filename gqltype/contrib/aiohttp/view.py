@@ -1,51 +1,212 @@
 from aiohttp import web
-import graphql
+import asyncio
+import inspect
 import logging
+from typing import Any, Callable, Mapping, Optional, Tuple
 
 from gqltype.schema import Schema
+from gqltype.contrib.batching import (
+    NO_QUERY_ERROR,
+    get_batch_error,
+    get_operation_error,
+)
 from gqltype.contrib.graphiql_page import render_graphiql
+from gqltype.contrib.json_codec import JSONCodec, get_json_codec, iter_json_chunks
+from gqltype.contrib.persisted_queries import PersistedQueries
+from gqltype.dataloader import Loaders
+from gqltype.exceptions import GeneralError, PersistedQueryNotFound
+from gqltype.execution import (
+    ComplexityLimits,
+    DocumentCache,
+    ExecutionContext,
+    execute_query,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
 async def graphql_view(request):
-    query = operation_name = variables = None
+    data = {}
 
     if "text/html" in request.headers["accept"]:
         return web.Response(text=render_graphiql(), content_type="text/html")
 
+    json_codec = request.app.get("graphql_json_codec") or get_json_codec()
+
     if request.content_type == "application/json":
-        _data = await request.json()
-        query = _data.get("query")
-        operation_name = _data.get("operationName")
-        variables = _data.get("variables")
+        try:
+            data = json_codec.loads(await request.read())
+        except ValueError:
+            return web.Response(text="Invalid JSON", status=400)
 
     elif request.content_type == "application/graphql":
-        query = await request.text()
+        data = {"query": await request.text()}
+
+    elif request.method == "GET":
+        data = dict(request.query)
+        if "variables" in data:
+            try:
+                data["variables"] = json_codec.loads(data["variables"])
+            except ValueError:
+                return web.Response(text="Invalid JSON", status=400)
+
+    # loaders are created on the first use by resolvers
+    context = {"request": request, "loaders": Loaders()}
+    get_user = request.app.get("graphql_get_user")
+    if get_user is not None:
+        user = get_user(request)
+        context["user"] = await user if inspect.isawaitable(user) else user
+
+    if isinstance(data, list):
+        return await graphql_batch_view(request, data, context, json_codec)
+
+    response_data, status = await execute_operation(request, data, context)
+    if response_data is None:
+        response_data = {"errors": [{"message": NO_QUERY_ERROR}]}
+    return await json_response(request, json_codec, response_data, status=status)
+
+
+async def graphql_batch_view(request, operations: list, context: dict, json_codec):
+    """
+    Executes a batch of operations (JSON array) concurrently, operations share
+    the request context (so loaders and other per-request caches are shared).
+
+    The response is an array of results in the same order (with 200 status,
+    errors of operations are reported in their results).
+    """
+    error = get_batch_error(operations, request.app.get("graphql_max_batch_size", 0))
+    if error is not None:
+        return await json_response(
+            request, json_codec, {"errors": [{"message": error}]}, status=400
+        )
+
+    results = await asyncio.gather(
+        *(execute_operation(request, data, context) for data in operations)
+    )
+    return await json_response(
+        request,
+        json_codec,
+        [
+            {"errors": [{"message": NO_QUERY_ERROR}]}
+            if response_data is None
+            else response_data
+            for response_data, _status in results
+        ],
+    )
+
+
+async def json_response(request, json_codec: JSONCodec, data, status: int = 200):
+    chunk_size = request.app.get("graphql_stream_chunk_size")
+    if not chunk_size:
+        return web.Response(
+            body=json_codec.dumps(data), status=status, content_type="application/json"
+        )
+
+    # chunks are encoded as they are sent, so the encoded response
+    # takes about `chunk_size` of memory
+    chunks = iter_json_chunks(data, json_codec, chunk_size)
+    # the first chunk is encoded before the response is started, so errors
+    # of encoding it (or a whole response smaller than a chunk) are raised
+    # as they are without streaming, instead of truncating the response
+    first_chunk = next(chunks, b"")
+    response = web.StreamResponse(status=status)
+    response.content_type = "application/json"
+    await response.prepare(request)
+    await response.write(first_chunk)
+    for chunk in chunks:
+        await response.write(chunk)
+    await response.write_eof()
+    return response
+
+
+async def execute_operation(
+    request, data: Mapping[str, Any], context: dict
+) -> Tuple[Optional[dict], int]:
+    """
+    Returns the response data of an operation and its status code
+    (or `None` data, if there's no query in the operation).
+    """
+    if not isinstance(data, Mapping):
+        return None, 400
+    error = get_operation_error(data)
+    if error is not None:
+        return {"errors": [{"message": error}]}, 400
+
+    query = data.get("query")
+
+    persisted_queries = request.app.get("graphql_persisted_queries")
+    if persisted_queries is not None:
+        try:
+            query = persisted_queries.resolve(query, data.get("extensions"))
+        except PersistedQueryNotFound as e:
+            # clients expect "not found" errors with 200 to send the query text
+            return {"errors": [e.formatted]}, 200
+        except GeneralError as e:
+            return {"errors": [e.formatted]}, 400
+
+    if query is None:
+        return None, 400
 
-    result = await graphql.graphql(
+    result = await execute_query(
         request.app["graphql_schema"],
-        source=query,
-        operation_name=operation_name,
-        variable_values=variables,
-        context_value={"request": request},
+        query,
+        document_cache=request.app.get("graphql_document_cache"),
+        operation_name=data.get("operationName"),
+        variable_values=data.get("variables"),
+        context_value=context,
+        execution_context_class=ExecutionContext,
+        compiled=request.app.get("graphql_compile_queries", False),
+        complexity_limits=request.app.get("graphql_complexity_limits"),
     )
 
     if result.errors:
-        data = {"errors": [e.formatted for e in result.errors]}
+        response_data = {"errors": [e.formatted for e in result.errors]}
         for err in result.errors:
             if err.original_error:
                 logger.exception(err.original_error, exc_info=err.original_error)
     else:
-        data = {"data": result.data}
+        response_data = {"data": result.data}
+    if result.extensions:
+        response_data["extensions"] = result.extensions
 
-    return web.json_response(data=data)
+    return response_data, 200
 
 
-def init_graphql(app, schema: Schema, url: str = '/graphql'):
+def init_graphql(
+    app,
+    schema: Schema,
+    url: str = '/graphql',
+    document_cache_size: int = 1000,
+    persisted_queries: Optional[PersistedQueries] = None,
+    compile_queries: bool = False,
+    complexity_limits: Optional[ComplexityLimits] = None,
+    max_batch_size: int = 10,
+    json_codec: Optional[JSONCodec] = None,
+    stream_chunk_size: int = 0,
+    get_user: Optional[Callable[[web.Request], Any]] = None,
+):
     if not "graphql_schema" in app:
         app["graphql_schema"] = schema.build()
+    if persisted_queries is not None:
+        app["graphql_persisted_queries"] = persisted_queries
+    # execute supported queries by compiled plans (see `gqltype.execution`)
+    app["graphql_compile_queries"] = compile_queries
+    # reject (or report) too complex operations before execution
+    if complexity_limits is not None:
+        app["graphql_complexity_limits"] = complexity_limits
+    # max number of operations in a batch (JSON array), `0` disables batching
+    app["graphql_max_batch_size"] = max_batch_size
+    # parses requests and encodes responses (the fastest installed by default)
+    app["graphql_json_codec"] = get_json_codec() if json_codec is None else json_codec
+    # send responses in chunks of the size while encoding them (`0` disables)
+    app["graphql_stream_chunk_size"] = stream_chunk_size
+    # identifies clients (`user` of the context), e.g. for private cached values
+    if get_user is not None:
+        app["graphql_get_user"] = get_user
+    # parsed and validated queries (`document_cache_size=0` disables the cache)
+    if document_cache_size and "graphql_document_cache" not in app:
+        app["graphql_document_cache"] = DocumentCache(max_size=document_cache_size)
 
     app.router.add_route("get", url, graphql_view)
     app.router.add_route("post", url, graphql_view)
@@ -0,0 +1,36 @@
+"""
+Batched operations: a JSON array of operations is sent in one HTTP request,
+operations are executed concurrently and an array of their results (in the
+same order) is returned.
+
+    [{"query": "{ a }"}, {"query": "query($id: ID!) { b(id: $id) }", ...}]
+
+The status of a batch response is 200, even if some operations are invalid
+or fail (unlike responses of single operations, which are 400 then): every
+operation has its own result, and errors are reported in `errors` of it.
+Only batches which cannot be executed at all (empty, too large or with
+batching disabled) are rejected with 400.
+"""
+from typing import Mapping, Optional
+
+NO_QUERY_ERROR = "No GraphQL query found in the operation"
+
+
+def get_batch_error(operations: list, max_batch_size: int) -> Optional[str]:
+    """Returns the error message if the batch cannot be executed"""
+    if not max_batch_size:
+        return "Batched operations are not supported"
+    if not operations or len(operations) > max_batch_size:
+        return f"Batch must contain from 1 to {max_batch_size} operations"
+    return None
+
+
+def get_operation_error(operation: Mapping) -> Optional[str]:
+    """Returns the error message if values of the operation have invalid types"""
+    if not isinstance(operation.get("query"), (str, type(None))):
+        return "Query must be a string"
+    if not isinstance(operation.get("variables"), (Mapping, type(None))):
+        return "Variables must be an object"
+    if not isinstance(operation.get("operationName"), (str, type(None))):
+        return "Operation name must be a string"
+    return None
@@ -112,5 +112,7 @@ def with_connection_pagination(fn):
             },
         ),
     )
+    # the number of edges is limited by `first`/`last` (see query complexity)
+    gqltype.schema_options(multiplier_arg=("first", "last"))(fn)
 
     return fn
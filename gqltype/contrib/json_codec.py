@@ -0,0 +1,163 @@
+"""
+JSON codecs used by the views to parse requests and encode responses.
+
+The fastest installed library is used by default (`orjson`, then `ujson`
+5 or newer, stdlib `json` otherwise), responses are encoded to bytes:
+
+    app = GraphQLApp(schema, json_codec=get_json_codec("json"))
+
+Values which are not supported by JSON natively (`Decimal`, `UUID`, dates
+and times, enums, sets) are encoded by `json_default`.
+
+Very large responses can be encoded incrementally by `iter_json_chunks`,
+so the encoded response is never kept in memory as a whole.
+"""
+from datetime import date, datetime, time
+from decimal import Decimal
+import enum
+import json
+from typing import Any, Iterator, Optional, Union
+from uuid import UUID
+
+
+def json_default(obj):
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Raises `ValueError` if the data is not a valid JSON"""
+        return json.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        # stdlib encodes to str only
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=json_default
+        ).encode()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        # datetimes and UUIDs are encoded natively (the same way)
+        return self._orjson.dumps(obj, default=json_default)
+
+
+class UjsonCodec(JSONCodec):
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        # `default` is supported since ujson 5
+        if int(ujson.__version__.split(".")[0]) < 5:
+            raise ImportError(f"ujson>=5 is required, found {ujson.__version__}")
+        self._ujson = ujson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False, default=json_default).encode()
+
+
+CODECS = (OrjsonCodec, UjsonCodec, JSONCodec)
+
+
+def get_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Returns the codec by its name ("orjson", "ujson" or "json")
+    or the fastest installed one.
+    """
+    for codec_cls in CODECS:
+        if name is not None and codec_cls.name != name:
+            continue
+        try:
+            return codec_cls()
+        except ImportError:
+            if name is not None:
+                raise
+    raise ValueError(f"Unknown JSON codec: {name!r}")
+
+
+# lists longer than that are encoded item by item (when streaming)
+LARGE_LIST_SIZE = 100
+
+
+def iter_json_chunks(
+    obj, json_codec: JSONCodec, chunk_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """
+    Encodes `obj` incrementally, yields chunks of about `chunk_size` bytes.
+
+    Large lists (and dicts containing them) are encoded item by item,
+    everything else (e.g. items of large lists) is encoded at once.
+    """
+    buffer = bytearray()
+    for part in _iter_json(obj, json_codec.dumps):
+        buffer += part
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _iter_json(obj, dumps) -> Iterator[bytes]:
+    if isinstance(obj, (list, tuple)) and len(obj) > LARGE_LIST_SIZE:
+        yield b"["
+        for i, item in enumerate(obj):
+            if i:
+                yield b","
+            yield dumps(item)
+        yield b"]"
+
+    elif isinstance(obj, (dict, list, tuple)) and _has_large_lists(obj):
+        if isinstance(obj, dict):
+            yield b"{"
+            for i, (key, value) in enumerate(obj.items()):
+                yield b"," + dumps(key) + b":" if i else dumps(key) + b":"
+                yield from _iter_json(value, dumps)
+            yield b"}"
+        else:
+            yield b"["
+            for i, item in enumerate(obj):
+                if i:
+                    yield b","
+                yield from _iter_json(item, dumps)
+            yield b"]"
+
+    else:
+        yield dumps(obj)
+
+
+def _has_large_lists(obj) -> bool:
+    values = obj.values() if isinstance(obj, dict) else obj
+    for value in values:
+        if isinstance(value, (list, tuple)) and len(value) > LARGE_LIST_SIZE:
+            return True
+        if isinstance(value, (dict, list, tuple)) and _has_large_lists(value):
+            return True
+    return False
@@ -0,0 +1,138 @@
+"""
+Automatic persisted queries.
+
+Clients send a sha256 hash of a query instead of the query text:
+
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "<hash>"}}}
+
+If the hash is unknown, the response has `PERSISTED_QUERY_NOT_FOUND` error and
+the client repeats the request with both the hash and the query text, then
+the query is registered for the next requests.
+
+In the allowlist mode only pre-registered queries (passed to the constructor
+or stored in the file) are executed, queries are never registered by clients.
+
+    persisted_queries = PersistedQueries(path="queries.json")
+    app = GraphQLApp(schema, persisted_queries=persisted_queries)
+    ...
+    persisted_queries.save()  # e.g. on shutdown
+"""
+from collections import OrderedDict
+from collections.abc import Mapping
+import hashlib
+import json
+import os
+import pathlib
+from typing import Dict, Optional, Union
+
+from ..exceptions import (
+    PersistedQueryInvalid,
+    PersistedQueryNotAllowed,
+    PersistedQueryNotFound,
+)
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+class PersistedQueries:
+    """
+    Store of queries by their hashes.
+
+    Queries registered by clients are kept in memory, only the recently used
+    ones (up to `max_size`). Pre-registered queries (`queries` and the JSON
+    file at `path`, if it's set) are always kept. The file is written only
+    by an explicit `save()` call (e.g. on shutdown), so registered queries
+    survive restarts, but requests never wait for the disk.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        path: Union[str, pathlib.Path, None] = None,
+        allowlist: bool = False,
+        queries: Optional[Dict[str, str]] = None,
+    ):
+        self.max_size = max_size
+        self.path = None if path is None else pathlib.Path(path)
+        self.allowlist = allowlist
+
+        self._recent: "OrderedDict[str, str]" = OrderedDict()
+        self._stored: Dict[str, str] = {}
+        for query in (queries or {}).values():
+            self._stored[get_query_hash(query)] = query
+        if self.path is not None and self.path.exists():
+            with self.path.open("r") as f:
+                saved = json.load(f)
+            if allowlist:
+                self._stored.update(saved)
+            else:  # previously registered by clients
+                for query_hash, query in saved.items():
+                    self._remember(query_hash, query)
+
+    def get(self, query_hash: str) -> Optional[str]:
+        query = self._stored.get(query_hash)
+        if query is not None:
+            return query
+
+        query = self._recent.get(query_hash)
+        if query is not None:
+            self._recent.move_to_end(query_hash)
+        return query
+
+    def register(self, query_hash: str, query: str) -> None:
+        if get_query_hash(query) != query_hash:
+            raise PersistedQueryInvalid("provided sha does not match query")
+
+        self._remember(query_hash, query)
+
+    def save(self) -> None:
+        """Writes pre-registered and recently used queries to the file"""
+        # write to a temporary file first, so readers never see a partial file
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump({**self._recent, **self._stored}, f)
+        os.replace(tmp_path, self.path)
+
+    def resolve(self, query: Optional[str], extensions) -> Optional[str]:
+        """
+        Returns the query text of a request (by the hash from `extensions`),
+        registers new queries or raises an error (`PersistedQuery...` errors
+        of `gqltype.exceptions`).
+        """
+        if isinstance(extensions, str):  # query params of GET requests
+            try:
+                extensions = json.loads(extensions)
+            except ValueError:
+                extensions = None
+
+        persisted_query = None
+        if isinstance(extensions, Mapping):
+            persisted_query = extensions.get("persistedQuery")
+        if not isinstance(persisted_query, Mapping):
+            if self.allowlist:
+                raise PersistedQueryNotAllowed("Only persisted queries are allowed")
+            return query
+
+        query_hash = persisted_query.get("sha256Hash")
+        if persisted_query.get("version") != 1 or not isinstance(query_hash, str):
+            raise PersistedQueryInvalid("Unsupported persisted query")
+
+        stored_query = self.get(query_hash)
+        if stored_query is not None:
+            return stored_query
+
+        if self.allowlist:
+            raise PersistedQueryNotAllowed("PersistedQueryNotAllowed")
+        if not query:
+            raise PersistedQueryNotFound("PersistedQueryNotFound")
+
+        self.register(query_hash, query)
+        return query
+
+    def _remember(self, query_hash: str, query: str) -> None:
+        self._recent[query_hash] = query
+        self._recent.move_to_end(query_hash)
+        while len(self._recent) > self.max_size:
+            self._recent.popitem(last=False)
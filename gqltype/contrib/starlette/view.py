@@ -1,22 +1,89 @@
+import asyncio
 import logging
+import inspect
+from typing import Any, Callable, Mapping, Optional, Tuple
 
 import graphql
 import gqltype
+from gqltype.contrib.batching import (
+    NO_QUERY_ERROR,
+    get_batch_error,
+    get_operation_error,
+)
 from gqltype.contrib.graphiql_page import render_graphiql
+from gqltype.contrib.json_codec import JSONCodec, get_json_codec, iter_json_chunks
+from gqltype.contrib.persisted_queries import PersistedQueries
+from gqltype.dataloader import Loaders
+from gqltype.exceptions import GeneralError, PersistedQueryNotFound
+from gqltype.execution import (
+    ComplexityLimits,
+    DocumentCache,
+    ExecutionContext,
+    execute_query,
+)
 from starlette import status
 from starlette.background import BackgroundTasks
 from starlette.requests import Request
-from starlette.responses import Response, HTMLResponse
-from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
+from starlette.responses import (
+    HTMLResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.types import Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
 class GraphQLApp:
-    def __init__(self, schema: gqltype.Schema, enable_graphiql: bool = True,) -> None:
+    def __init__(
+        self,
+        schema: gqltype.Schema,
+        enable_graphiql: bool = True,
+        document_cache_size: int = 1000,
+        persisted_queries: Optional[PersistedQueries] = None,
+        compile_queries: bool = False,
+        complexity_limits: Optional[ComplexityLimits] = None,
+        max_batch_size: int = 10,
+        json_codec: Optional[JSONCodec] = None,
+        stream_chunk_size: int = 0,
+        get_user: Optional[Callable[[Request], Any]] = None,
+    ) -> None:
+        self.schema = schema
         self.graphql_schema = schema.build()
         self.enable_graphiql = enable_graphiql
+        self.persisted_queries = persisted_queries
+        # execute supported queries by compiled plans (see `gqltype.execution`)
+        self.compile_queries = compile_queries
+        # reject (or report) too complex operations before execution
+        self.complexity_limits = complexity_limits
+        # max number of operations in a batch (JSON array), `0` disables batching
+        self.max_batch_size = max_batch_size
+        # parses requests and encodes responses (the fastest installed by default)
+        self.json_codec = get_json_codec() if json_codec is None else json_codec
+        # send responses in chunks of the size while encoding them (`0` disables)
+        self.stream_chunk_size = stream_chunk_size
+        # identifies clients (`user` of the context), e.g. for private cached values
+        self.get_user = get_user
+        # parsed and validated queries (`document_cache_size=0` disables the cache)
+        self.document_cache = (
+            DocumentCache(max_size=document_cache_size) if document_cache_size else None
+        )
+
+    def update_schema(self, graphql_schema: graphql.GraphQLSchema = None) -> None:
+        """
+        Replaces the schema used to execute requests.
+
+        By default, it rebuilds `gqltype.Schema` (e.g. after registering new objects,
+        only new types are transformed). Requests being executed keep using
+        the previous schema, new requests use the new one.
+        """
+        if graphql_schema is None:
+            graphql_schema = self.schema.build()
+        self.graphql_schema = graphql_schema
+        if self.document_cache is not None:
+            # documents are cached per schema, entries of the previous one are useless
+            self.document_cache.clear()
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         request = Request(scope, receive=receive)
@@ -32,19 +99,34 @@ class GraphQLApp:
                     )
                 return await self.handle_graphiql(request)
 
-            data = request.query_params  # type: typing.Mapping[str, typing.Any]
+            try:
+                data = self.get_query_params_data(request)
+            except ValueError:
+                return PlainTextResponse(
+                    "Invalid JSON", status_code=status.HTTP_400_BAD_REQUEST
+                )
 
         elif request.method == "POST":
             content_type = request.headers.get("Content-Type", "")
 
             if "application/json" in content_type:
-                data = await request.json()
+                try:
+                    data = self.json_codec.loads(await request.body())
+                except ValueError:
+                    return PlainTextResponse(
+                        "Invalid JSON", status_code=status.HTTP_400_BAD_REQUEST
+                    )
             elif "application/graphql" in content_type:
                 body = await request.body()
                 text = body.decode()
                 data = {"query": text}
             elif "query" in request.query_params:
-                data = request.query_params
+                try:
+                    data = self.get_query_params_data(request)
+                except ValueError:
+                    return PlainTextResponse(
+                        "Invalid JSON", status_code=status.HTTP_400_BAD_REQUEST
+                    )
             else:
                 return PlainTextResponse(
                     "Unsupported Media Type",
@@ -56,18 +138,90 @@ class GraphQLApp:
                 "Method Not Allowed", status_code=status.HTTP_405_METHOD_NOT_ALLOWED
             )
 
-        try:
-            query = data["query"]
-            variables = data.get("variables")
-            operation_name = data.get("operationName")
-        except KeyError:
+        background = BackgroundTasks()
+        # loaders are created on the first use by resolvers
+        context = {"request": request, "background": background, "loaders": Loaders()}
+        if self.get_user is not None:
+            user = self.get_user(request)
+            context["user"] = await user if inspect.isawaitable(user) else user
+
+        if isinstance(data, list):
+            return await self.handle_batch(data, context)
+
+        response_data, status_code = await self.execute_operation(data, context)
+        if response_data is None:
             return PlainTextResponse(
                 "No GraphQL query found in the request",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        background = BackgroundTasks()
-        context = {"request": request, "background": background}
+        return self.json_response(
+            response_data, status_code=status_code, background=background
+        )
+
+    def get_query_params_data(self, request: Request) -> dict:
+        """Returns the operation of query params (`ValueError` on invalid JSON)"""
+        data = dict(request.query_params)
+        if "variables" in data:
+            data["variables"] = self.json_codec.loads(data["variables"])
+        return data
+
+    async def handle_batch(self, operations: list, context: dict) -> Response:
+        """
+        Executes a batch of operations (JSON array) concurrently, operations share
+        the request context (so loaders and other per-request caches are shared).
+
+        The response is an array of results in the same order (with 200 status,
+        errors of operations are reported in their results).
+        """
+        error = get_batch_error(operations, self.max_batch_size)
+        if error is not None:
+            return self.json_response(
+                {"errors": [{"message": error}]},
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = await asyncio.gather(
+            *(self.execute_operation(data, context) for data in operations)
+        )
+        return self.json_response(
+            [
+                {"errors": [{"message": NO_QUERY_ERROR}]}
+                if response_data is None
+                else response_data
+                for response_data, _status_code in results
+            ],
+            background=context["background"],
+        )
+
+    async def execute_operation(
+        self, data: Mapping[str, Any], context: dict
+    ) -> Tuple[Optional[dict], int]:
+        """
+        Returns the response data of an operation and its status code
+        (or `None` data, if there's no query in the operation).
+        """
+        if not isinstance(data, Mapping):
+            return None, status.HTTP_400_BAD_REQUEST
+        error = get_operation_error(data)
+        if error is not None:
+            return {"errors": [{"message": error}]}, status.HTTP_400_BAD_REQUEST
+
+        query = data.get("query")
+        variables = data.get("variables")
+        operation_name = data.get("operationName")
+
+        if self.persisted_queries is not None:
+            try:
+                query = self.persisted_queries.resolve(query, data.get("extensions"))
+            except PersistedQueryNotFound as e:
+                # clients expect "not found" errors with 200 to send the query text
+                return {"errors": [e.formatted]}, status.HTTP_200_OK
+            except GeneralError as e:
+                return {"errors": [e.formatted]}, status.HTTP_400_BAD_REQUEST
+
+        if query is None:
+            return None, status.HTTP_400_BAD_REQUEST
 
         result = await self.execute(
             query, variables=variables, context=context, operation_name=operation_name
@@ -76,6 +230,8 @@ class GraphQLApp:
         response_data = {"data": result.data}
         if error_data:
             response_data["errors"] = error_data
+        if result.extensions:
+            response_data["extensions"] = result.extensions
         status_code = (
             status.HTTP_400_BAD_REQUEST if result.errors else status.HTTP_200_OK
         )
@@ -87,20 +243,51 @@ class GraphQLApp:
                 else:
                     logger.error(err.message)
 
-        return JSONResponse(
-            response_data, status_code=status_code, background=background
-        )
+        return response_data, status_code
 
     async def execute(  # type: ignore
         self, query, variables=None, context=None, operation_name=None
     ):
-        return await graphql.graphql(
+        return await execute_query(
             self.graphql_schema,
-            source=query,
+            query,
+            document_cache=self.document_cache,
             operation_name=operation_name,
             variable_values=variables,
             context_value=context,
+            execution_context_class=ExecutionContext,
+            compiled=self.compile_queries,
+            complexity_limits=self.complexity_limits,
         )
 
+    def json_response(
+        self, data, status_code: int = status.HTTP_200_OK, background=None
+    ) -> Response:
+        if self.stream_chunk_size:
+            chunks = iter_json_chunks(data, self.json_codec, self.stream_chunk_size)
+            # the first chunk is encoded before the response is started, so errors
+            # of encoding it (or a whole response smaller than a chunk) are raised
+            # as they are without streaming, instead of truncating the response
+            first_chunk = next(chunks, b"")
+            return StreamingResponse(
+                self._iter_json_chunks(first_chunk, chunks),
+                status_code=status_code,
+                media_type="application/json",
+                background=background,
+            )
+        return Response(
+            self.json_codec.dumps(data),
+            status_code=status_code,
+            media_type="application/json",
+            background=background,
+        )
+
+    async def _iter_json_chunks(self, first_chunk, chunks):
+        # chunks are encoded as they are sent, so the encoded response
+        # takes about `stream_chunk_size` of memory
+        yield first_chunk
+        for chunk in chunks:
+            yield chunk
+
     async def handle_graphiql(self, request: Request) -> Response:
         return HTMLResponse(render_graphiql(endpoint=request.url.path))
@@ -0,0 +1,196 @@
+"""
+Batching and caching of data loading within a request.
+
+A `DataLoader` collects keys requested by resolvers during one tick of
+the event loop and loads them with a single call of the batch function.
+Loaded values are cached by keys, so every key is loaded once per loader.
+
+    async def load_planets(ids: List[str]) -> List[dict]:
+        planets = await storage.get_objects("planets", ids)
+        ...  # values must be in the order of `ids`
+
+    class Person:
+        async def resolve_homeworld(self, loaders) -> Planet:
+            return await loaders[load_planets].load(self["homeworld"])
+
+Loaders are created lazily per request by the `loaders` registry, which is
+passed to resolvers as a special parameter (see `extra_special_params` of
+`RootContext`).
+"""
+import asyncio
+from collections.abc import MutableMapping
+from functools import partial
+import inspect
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+from .utils import MISSING
+
+
+class DataLoader:
+    """
+    Loads values by keys in batches.
+
+    `batch_load_fn` receives a list of keys and returns (or is a coroutine
+    function returning) a list of values in the same order. If a value is
+    an exception instance, it's raised for the corresponding key.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Callable[[List[Any]], Any],
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+        get_cache_key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self.get_cache_key = get_cache_key
+
+        self._cache: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[tuple] = []
+        # references to running batches (tasks may be garbage collected otherwise)
+        self._tasks: Set[asyncio.Future] = set()
+
+    def load(self, key) -> asyncio.Future:
+        """Returns a future of the value, the key is loaded with the next batch"""
+        cache_key = key if self.get_cache_key is None else self.get_cache_key(key)
+        if self.cache:
+            try:
+                return self._cache[cache_key]
+            except KeyError:
+                pass
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        if self.cache:
+            self._cache[cache_key] = future
+
+        if not self._queue:
+            # keys requested during the current tick are loaded together
+            loop.call_soon(self._dispatch)
+        self._queue.append((key, future))
+        return future
+
+    async def load_many(self, keys: Iterable) -> list:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key, value) -> None:
+        """Puts the value to the cache (if the key is not loaded yet)"""
+        if not self.cache:
+            return
+        cache_key = key if self.get_cache_key is None else self.get_cache_key(key)
+        if cache_key not in self._cache:
+            future = asyncio.get_event_loop().create_future()
+            _set_result(future, value)
+            self._cache[cache_key] = future
+
+    def clear(self, key=MISSING) -> None:
+        """Forgets the cached value of the key (or all values)"""
+        if key is MISSING:
+            self._cache.clear()
+        else:
+            cache_key = key if self.get_cache_key is None else self.get_cache_key(key)
+            self._cache.pop(cache_key, None)
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        size = self.max_batch_size or len(queue)
+        for start in range(0, len(queue), size):
+            batch = queue[start : start + size]
+            task = asyncio.ensure_future(self._load_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(partial(self._batch_done, batch))
+
+    def _batch_done(self, batch: List[tuple], task: asyncio.Future) -> None:
+        self._tasks.discard(task)
+        # the task failed or was cancelled before the values were set
+        error = None if task.cancelled() else task.exception()
+        for key, future in batch:
+            if not future.done():
+                self.clear(key)
+                if error is None:
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+
+    async def _load_batch(self, batch: List[tuple]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            values = self.batch_load_fn(keys)
+            if inspect.isawaitable(values):
+                values = await values
+            values = list(values)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"DataLoader batch function must return a list of the same "
+                    f"length as the keys: {len(keys)} keys, {len(values)} values."
+                )
+        except Exception as e:
+            for key, future in batch:
+                self.clear(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), value in zip(batch, values):
+            if not future.done():
+                _set_result(future, value)
+
+
+def _set_result(future: asyncio.Future, value) -> None:
+    if isinstance(value, Exception):
+        future.set_exception(value)
+    else:
+        future.set_result(value)
+
+
+class Loaders:
+    """
+    Registry of data loaders of a request.
+
+    A loader is created on the first access by its batch function, so
+    requests which do not use a loader do not pay for it.
+    """
+
+    def __init__(self, **options):
+        self.options = options
+        self._loaders: Dict[Callable, DataLoader] = {}
+
+    def get(self, batch_load_fn: Callable, **options) -> DataLoader:
+        try:
+            return self._loaders[batch_load_fn]
+        except KeyError:
+            pass
+
+        loader = self._loaders[batch_load_fn] = DataLoader(
+            batch_load_fn, **{**self.options, **options}
+        )
+        return loader
+
+    __getitem__ = get
+
+    def __contains__(self, batch_load_fn) -> bool:
+        return batch_load_fn in self._loaders
+
+    def clear(self) -> None:
+        for loader in self._loaders.values():
+            loader.clear()
+
+
+def get_loaders(context) -> Loaders:
+    """Returns loaders of the request (creates them on the first access)"""
+    if isinstance(context, MutableMapping):
+        loaders = context.get("loaders")
+        if loaders is None:
+            loaders = context["loaders"] = Loaders()
+        return loaders
+
+    if context is None:
+        raise TypeError("Loaders require a context of the request (e.g. a dict)")
+
+    loaders = getattr(context, "loaders", None)
+    if loaders is None:
+        loaders = Loaders()
+        setattr(context, "loaders", loaders)
+    return loaders
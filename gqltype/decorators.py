@@ -9,6 +9,20 @@ def is_query(func):
     return getattr(func, "__graphql_query__", False)
 
 
+def batch_resolver(func):
+    """
+    Marks a resolver which is called once for all source values of a field
+    (instead of once per value): it receives them as a list (`sources` param)
+    and returns a list of field values in the same order.
+    """
+    func.__graphql_batch__ = True
+    return func
+
+
+def is_batch_resolver(func):
+    return getattr(func, "__graphql_batch__", False)
+
+
 def mutation(func):
     func.__graphql_mutation__ = True
     return func
@@ -39,3 +39,15 @@ class UserInputError(GeneralError):
         if err.fields is not None:
             data["fields"] = err.fields
         return data
+
+
+class PersistedQueryNotFound(GeneralError):
+    code: str = "PERSISTED_QUERY_NOT_FOUND"
+
+
+class PersistedQueryNotAllowed(GeneralError):
+    code: str = "PERSISTED_QUERY_NOT_ALLOWED"
+
+
+class PersistedQueryInvalid(GeneralError):
+    code: str = "PERSISTED_QUERY_INVALID"
@@ -0,0 +1,124 @@
+"""
+Execution helpers on top of graphql-core.
+
+    result = await graphql.graphql(
+        schema, source, execution_context_class=gqltype.execution.ExecutionContext
+    )
+
+    # or with parsed documents (and compiled plans of queries) cached
+    result = await execute_query(
+        schema, source, document_cache=DocumentCache(), compiled=True
+    )
+"""
+import inspect
+
+import graphql
+
+from .complexity import ComplexityLimits, QueryComplexity, analyze_query
+from .compiler import CompiledQuery, get_compiled_query
+from .document_cache import DocumentCache, ParsedDocument, parse_and_validate
+
+
+class ExecutionContext(graphql.ExecutionContext):
+    """
+    Execution context with bulk serialization of scalar lists.
+
+    Lists of scalars which implement `serialize_many` (see
+    `gqltype.graphql_types.scalar.GraphQLScalarType`) are serialized at once,
+    instead of completing every item separately. If serialization fails (or
+    the list contains nulls which are not allowed), the list is completed
+    by graphql-core as usual, so errors are reported the standard way.
+    """
+
+    def complete_list_value(self, return_type, field_nodes, info, path, result):
+        item_type = return_type.of_type
+        is_non_null = graphql.is_non_null_type(item_type)
+        scalar_type = item_type.of_type if is_non_null else item_type
+        serialize_many = getattr(scalar_type, "serialize_many", None)
+
+        if serialize_many is not None and isinstance(result, (list, tuple)):
+            try:
+                serialized = serialize_many(result)
+            except Exception:
+                pass
+            else:
+                if not (is_non_null and None in serialized) and (
+                    graphql.INVALID not in serialized
+                ):
+                    return serialized
+
+        return super().complete_list_value(
+            return_type, field_nodes, info, path, result
+        )
+
+
+async def execute_query(
+    schema: graphql.GraphQLSchema,
+    query: str,
+    *,
+    document_cache: DocumentCache = None,
+    variable_values=None,
+    operation_name=None,
+    context_value=None,
+    root_value=None,
+    execution_context_class=ExecutionContext,
+    compiled: bool = False,
+    complexity_limits: ComplexityLimits = None,
+) -> graphql.ExecutionResult:
+    """
+    The same as `graphql.graphql`, but the parsed and validated document
+    is taken from `document_cache` (if it's passed).
+
+    If `compiled` is set, supported queries are executed by compiled plans
+    (see `gqltype.execution.compiler`), which are cached with documents,
+    so it makes sense along with `document_cache` only.
+
+    Operations above `complexity_limits` are rejected (or reported in
+    `extensions` of the result), see `gqltype.execution.complexity`.
+    """
+    if document_cache is None:
+        parsed = parse_and_validate(schema, query)
+    else:
+        parsed = document_cache.get(schema, query)
+
+    if parsed.errors:
+        return graphql.ExecutionResult(data=None, errors=parsed.errors)
+
+    extensions = None
+    if complexity_limits is not None:
+        errors, extensions = complexity_limits.apply(
+            schema, parsed.document, variable_values, operation_name
+        )
+        if errors:
+            return graphql.ExecutionResult(data=None, errors=errors)
+
+    if compiled:
+        compiled_query = get_compiled_query(
+            schema, parsed.document, operation_name, parsed.compiled_queries
+        )
+        if compiled_query is not None:
+            result = compiled_query(
+                root_value=root_value,
+                context_value=context_value,
+                variable_values=variable_values,
+            )
+            return _with_extensions(result, extensions)
+
+    result = graphql.execute(
+        schema,
+        parsed.document,
+        root_value=root_value,
+        context_value=context_value,
+        variable_values=variable_values,
+        operation_name=operation_name,
+        execution_context_class=execution_context_class,
+    )
+    if inspect.isawaitable(result):
+        result = await result
+    return _with_extensions(result, extensions)
+
+
+def _with_extensions(result: graphql.ExecutionResult, extensions):
+    if extensions:
+        result.extensions = {**(result.extensions or {}), **extensions}
+    return result
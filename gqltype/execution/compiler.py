@@ -0,0 +1,504 @@
+"""
+Compiled execution plans.
+
+A validated query is compiled once into a tree of closures specialized for
+its selections: fragments are merged and fields are collected, arguments
+without variables are coerced, completion of values is chosen by field types
+and plain attribute fields are read without building `GraphQLResolveInfo`.
+Executing a plan only resolves and completes values.
+
+A subset of queries is compiled, `get_compiled_query` returns `None` for
+others (they should be executed by graphql-core):
+- query operations (no mutations and subscriptions);
+- no directives, no introspection fields (except `__typename`);
+- object types only (no unions and interfaces in selections);
+- sync resolvers only (no async and batch resolvers, nor resolvers
+  with `loaders`, which return futures of data loaders).
+
+    parsed = document_cache.get(schema, query)  # plans are cached with documents
+    compiled_query = get_compiled_query(
+        schema, parsed.document, compiled_queries=parsed.compiled_queries
+    )
+    if compiled_query is not None:
+        result = compiled_query(context_value=context, variable_values=variables)
+"""
+from collections.abc import Iterable, Mapping
+import enum
+import inspect
+from typing import Any, Callable, Dict, List, Optional
+
+import graphql
+from graphql.execution.values import get_argument_values, get_variable_values
+from graphql.pyutils import Path, is_awaitable
+
+from ..decorators import is_batch_resolver
+
+
+class _Unsupported(Exception):
+    """The query cannot be executed by a plan"""
+
+
+class _Execution:
+    """State of an execution of a plan"""
+
+    __slots__ = (
+        "schema",
+        "fragments",
+        "root_value",
+        "operation",
+        "variables",
+        "context",
+        "errors",
+        "args",
+    )
+
+    def __init__(self, schema, fragments, root_value, operation, variables, context):
+        self.schema = schema
+        self.fragments = fragments
+        self.root_value = root_value
+        self.operation = operation
+        self.variables = variables
+        self.context = context
+        self.errors: List[graphql.GraphQLError] = []
+        # arguments depending on variables, by field
+        self.args: Dict[int, Dict[str, Any]] = {}
+
+
+def _is_async_resolver(resolve) -> bool:
+    fn = inspect.unwrap(resolve)
+    return (
+        inspect.iscoroutinefunction(fn)
+        or inspect.isasyncgenfunction(fn)
+        or is_batch_resolver(fn)
+        or "loaders" in _get_param_names(fn)  # see `gqltype.dataloader`
+    )
+
+
+def _get_param_names(fn):
+    try:
+        return inspect.signature(fn).parameters
+    except (TypeError, ValueError):  # not inspectable callables
+        return ()
+
+
+def _is_shareable(args: dict) -> bool:
+    # resolvers get a copy of `args`, but may mutate values (e.g. lists or input
+    # objects), such values are coerced for every call
+    return all(
+        value is None or isinstance(value, (str, int, float, enum.Enum))
+        for value in args.values()
+    )
+
+
+def _has_variables(node) -> bool:
+    if isinstance(node, graphql.VariableNode):
+        return True
+    if isinstance(node, graphql.ListValueNode):
+        return any(map(_has_variables, node.values))
+    if isinstance(node, graphql.ObjectValueNode):
+        return any(_has_variables(field.value) for field in node.fields)
+    return False
+
+
+class CompiledQuery:
+    """
+    Execution plan of a query operation.
+
+    Calling it returns `ExecutionResult`. Resolvers which may return awaitables
+    are not compiled, if one still returns an awaitable, it's reported as
+    an error of the field and the plan is disabled (the query is executed
+    by graphql-core next times).
+    """
+
+    def __init__(self, schema, document, operation_name=None):
+        self.schema = schema
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, graphql.FragmentDefinitionNode)
+        }
+        self.operation = self._get_operation(document, operation_name)
+        self.enabled = True
+        self._args_count = 0
+
+        root_type = schema.query_type
+        self._execute_root_fields = self._compile_fields(
+            root_type, [self.operation.selection_set]
+        )
+
+    def __call__(
+        self, root_value=None, context_value=None, variable_values=None
+    ) -> graphql.ExecutionResult:
+        variables = {}
+        if self.operation.variable_definitions:
+            variables = get_variable_values(
+                self.schema, self.operation.variable_definitions, variable_values or {}
+            )
+            if isinstance(variables, list):  # errors
+                return graphql.ExecutionResult(data=None, errors=variables)
+
+        execution = _Execution(
+            self.schema,
+            self.fragments,
+            root_value,
+            self.operation,
+            variables,
+            context_value,
+        )
+        try:
+            data = self._execute_root_fields(execution, root_value, None)
+        except graphql.GraphQLError as error:
+            execution.errors.append(error)
+            data = None
+
+        return graphql.ExecutionResult(data=data, errors=execution.errors or None)
+
+    def _get_operation(self, document, operation_name):
+        operations = [
+            definition
+            for definition in document.definitions
+            if isinstance(definition, graphql.OperationDefinitionNode)
+        ]
+        if operation_name is None:
+            if len(operations) != 1:
+                raise _Unsupported("operation name is required")
+            operation = operations[0]
+        else:
+            named = [op for op in operations if op.name]
+            operation = next(
+                (op for op in named if op.name.value == operation_name), None
+            )
+            if operation is None:
+                raise _Unsupported(f"unknown operation {operation_name}")
+
+        if operation.operation != graphql.OperationType.QUERY:
+            raise _Unsupported("only queries are compiled")
+        if operation.directives:
+            raise _Unsupported("directives")
+        return operation
+
+    def _fragment_applies(self, object_type, type_condition) -> bool:
+        if type_condition is None:
+            return True
+        condition_type = graphql.type_from_ast(self.schema, type_condition)
+        if condition_type is object_type:
+            return True
+        if graphql.is_abstract_type(condition_type):
+            return self.schema.is_sub_type(condition_type, object_type)
+        return False
+
+    def _collect_fields(self, object_type, selection_set, fields, visited):
+        for selection in selection_set.selections:
+            if selection.directives:
+                raise _Unsupported("directives")
+
+            if isinstance(selection, graphql.FieldNode):
+                key = (selection.alias or selection.name).value
+                fields.setdefault(key, []).append(selection)
+
+            elif isinstance(selection, graphql.InlineFragmentNode):
+                if self._fragment_applies(object_type, selection.type_condition):
+                    self._collect_fields(
+                        object_type, selection.selection_set, fields, visited
+                    )
+
+            elif isinstance(selection, graphql.FragmentSpreadNode):
+                name = selection.name.value
+                if name in visited:
+                    continue
+                visited.add(name)
+
+                fragment = self.fragments[name]
+                if fragment.directives:
+                    raise _Unsupported("directives")
+                if self._fragment_applies(object_type, fragment.type_condition):
+                    self._collect_fields(
+                        object_type, fragment.selection_set, fields, visited
+                    )
+
+    def _compile_fields(self, object_type, selection_sets) -> Callable:
+        if object_type.is_type_of is not None:
+            raise _Unsupported("is_type_of")
+
+        fields: Dict[str, List[graphql.FieldNode]] = {}
+        visited = set()
+        for selection_set in selection_sets:
+            self._collect_fields(object_type, selection_set, fields, visited)
+
+        field_plans = tuple(
+            (key, self._compile_field(object_type, key, field_nodes))
+            for key, field_nodes in fields.items()
+        )
+
+        def execute_fields(execution, source, path):
+            data = {}
+            for key, execute_field in field_plans:
+                data[key] = execute_field(execution, source, path)
+            return data
+
+        return execute_fields
+
+    def _compile_field(self, parent_type, key, field_nodes) -> Callable:
+        name = field_nodes[0].name.value
+        type_name = parent_type.name
+
+        if name == "__typename":
+            return lambda execution, source, path: type_name
+        if name.startswith("__"):
+            raise _Unsupported("introspection")
+
+        field_def = parent_type.fields[name]
+        return_type = field_def.type
+        is_non_null = graphql.is_non_null_type(return_type)
+        resolve = field_def.resolve
+        if resolve is not None and _is_async_resolver(resolve):
+            raise _Unsupported("async resolver")
+
+        complete = self._compile_value(return_type, field_nodes, parent_type, name)
+
+        node = field_nodes[0]
+        static_args = None
+        if not any(_has_variables(arg.value) for arg in node.arguments):
+            try:
+                args = get_argument_values(field_def, node)
+            except graphql.GraphQLError as e:
+                raise _Unsupported("invalid arguments") from e
+            if _is_shareable(args):
+                static_args = args
+        args_index = self._args_count
+        self._args_count += 1
+
+        def get_args(execution):
+            if static_args is not None:
+                return static_args
+            try:
+                return execution.args[args_index]
+            except KeyError:
+                pass
+            args = get_argument_values(field_def, node, execution.variables)
+            if _is_shareable(args):
+                execution.args[args_index] = args
+            return args
+
+        def get_info(execution, path):
+            return graphql.GraphQLResolveInfo(
+                name,
+                field_nodes,
+                return_type,
+                parent_type,
+                path,
+                execution.schema,
+                execution.fragments,
+                execution.root_value,
+                execution.operation,
+                execution.variables,
+                execution.context,
+                is_awaitable,
+            )
+
+        def handle_error(execution, raw_error, path):
+            error = graphql.located_error(raw_error, field_nodes, path.as_list())
+            if is_non_null:
+                raise error
+            execution.errors.append(error)
+            return None
+
+        if resolve is None:
+            # a plain attribute (the same as `graphql.default_field_resolver`)
+            def execute_field(execution, source, parent_path):
+                path = Path(parent_path, key, type_name)
+                try:
+                    if isinstance(source, Mapping):
+                        value = source.get(name)
+                    else:
+                        value = getattr(source, name, None)
+                    if callable(value):
+                        info = get_info(execution, path)
+                        value = value(info, **get_args(execution))
+                        if is_awaitable(value):
+                            self._reject_awaitable(value, type_name, name)
+                    return complete(execution, value, path)
+                except Exception as raw_error:
+                    return handle_error(execution, raw_error, path)
+
+        else:
+
+            def execute_field(execution, source, parent_path):
+                path = Path(parent_path, key, type_name)
+                try:
+                    info = get_info(execution, path)
+                    value = resolve(source, info, **get_args(execution))
+                    if is_awaitable(value):
+                        self._reject_awaitable(value, type_name, name)
+                    return complete(execution, value, path)
+                except Exception as raw_error:
+                    return handle_error(execution, raw_error, path)
+
+        return execute_field
+
+    def _reject_awaitable(self, value, type_name, field_name):
+        # the query is not executed again by graphql-core (resolvers called
+        # so far would be called twice), next executions are not compiled
+        _close(value)
+        self.enabled = False
+        raise TypeError(
+            f"Resolver of '{type_name}.{field_name}' returned an awaitable,"
+            " which is not supported by compiled queries."
+        )
+
+    def _compile_value(self, type_, field_nodes, parent_type, field_name) -> Callable:
+        """Returns a function completing values of the type"""
+        if graphql.is_non_null_type(type_):
+            return self._compile_non_null(
+                type_, field_nodes, parent_type, field_name
+            )
+        if graphql.is_list_type(type_):
+            return self._compile_list(type_, field_nodes, parent_type, field_name)
+        if graphql.is_leaf_type(type_):
+            return _compile_leaf(type_)
+        if graphql.is_object_type(type_):
+            return _compile_object(
+                self._compile_fields(
+                    type_, [node.selection_set for node in field_nodes]
+                )
+            )
+        raise _Unsupported("abstract types")
+
+    def _compile_non_null(self, type_, field_nodes, parent_type, field_name):
+        complete_inner = self._compile_value(
+            type_.of_type, field_nodes, parent_type, field_name
+        )
+        message = (
+            "Cannot return null for non-nullable field"
+            f" {parent_type.name}.{field_name}."
+        )
+
+        def complete(execution, result, path):
+            completed = complete_inner(execution, result, path)
+            if completed is None:
+                raise TypeError(message)
+            return completed
+
+        return complete
+
+    def _compile_list(self, type_, field_nodes, parent_type, field_name):
+        item_type = type_.of_type
+        is_non_null_item = graphql.is_non_null_type(item_type)
+        complete_item = self._compile_value(
+            item_type, field_nodes, parent_type, field_name
+        )
+        nullable_item_type = graphql.get_nullable_type(item_type)
+        serialize_many = getattr(nullable_item_type, "serialize_many", None)
+        # paths of leaf values are needed for errors only
+        is_leaf_item = graphql.is_leaf_type(nullable_item_type)
+        message = (
+            "Expected Iterable, but did not find one for field"
+            f" '{parent_type.name}.{field_name}'."
+        )
+
+        def complete(execution, result, path):
+            if isinstance(result, Exception):
+                raise result
+            if result is None or result is graphql.INVALID:
+                return None
+            if not isinstance(result, Iterable) or isinstance(result, str):
+                raise graphql.GraphQLError(message)
+
+            if serialize_many is not None and isinstance(result, (list, tuple)):
+                # see `gqltype.execution.ExecutionContext.complete_list_value`
+                try:
+                    serialized = serialize_many(result)
+                except Exception:
+                    pass
+                else:
+                    if not (is_non_null_item and None in serialized) and (
+                        graphql.INVALID not in serialized
+                    ):
+                        return serialized
+
+            completed = []
+            append = completed.append
+            for index, item in enumerate(result):
+                item_path = None if is_leaf_item else Path(path, index, None)
+                try:
+                    append(complete_item(execution, item, item_path))
+                except Exception as raw_error:
+                    item_path = Path(path, index, None)
+                    error = graphql.located_error(
+                        raw_error, field_nodes, item_path.as_list()
+                    )
+                    if is_non_null_item:
+                        raise error
+                    execution.errors.append(error)
+                    append(None)
+            return completed
+
+        return complete
+
+
+def _compile_leaf(type_):
+    serialize = type_.serialize
+
+    def complete(execution, result, path):
+        if isinstance(result, Exception):
+            raise result
+        if result is None or result is graphql.INVALID:
+            return None
+        serialized = serialize(result)
+        if serialized is graphql.INVALID:
+            raise TypeError(
+                f"Expected a value of type '{graphql.pyutils.inspect(type_)}'"
+                f" but received: {graphql.pyutils.inspect(result)}"
+            )
+        return serialized
+
+    return complete
+
+
+def _compile_object(execute_fields):
+    def complete(execution, result, path):
+        if isinstance(result, Exception):
+            raise result
+        if result is None or result is graphql.INVALID:
+            return None
+        return execute_fields(execution, result, path)
+
+    return complete
+
+
+def _close(value) -> None:
+    # avoid "coroutine was never awaited" warnings
+    close = getattr(value, "close", None)
+    if close is not None:
+        close()
+
+
+def compile_query(schema, document, operation_name=None) -> Optional[CompiledQuery]:
+    """Returns the plan of the operation (or `None` if it's not supported)"""
+    try:
+        return CompiledQuery(schema, document, operation_name)
+    except _Unsupported:
+        return None
+
+
+def get_compiled_query(
+    schema, document, operation_name=None, compiled_queries: Optional[dict] = None
+) -> Optional[CompiledQuery]:
+    """
+    Returns the plan of the operation, plans are cached in `compiled_queries`
+    by operation names (e.g. in `compiled_queries` of `ParsedDocument`
+    of a `DocumentCache`, which are specific to a schema).
+    """
+    if compiled_queries is None:
+        return compile_query(schema, document, operation_name)
+
+    try:
+        compiled_query = compiled_queries[operation_name]
+    except KeyError:
+        compiled_query = compiled_queries[operation_name] = compile_query(
+            schema, document, operation_name
+        )
+
+    if compiled_query is not None and not compiled_query.enabled:
+        return None
+    return compiled_query
@@ -0,0 +1,379 @@
+"""
+Static analysis of query complexity (depth, number of fields and aliases,
+estimated cost), so expensive operations are rejected before execution.
+
+Every field costs `default_cost` (1), fields of a selection set under a list
+field are counted as many times as the list may have items. The cost and
+the argument limiting the number of items are declared per field:
+
+    FriendsList = T(List[Person], cost=2, multiplier_arg="first")
+
+    def resolve_friends(self, first: int = 10) -> FriendsList:
+        ...
+
+Fields of `with_connection_pagination` resolvers are limited by `first`/`last`
+arguments by default. The hints are stored in `extensions["cost"]` of fields.
+
+    limits = ComplexityLimits(max_depth=10, max_cost=1000)
+    result = await execute_query(schema, query, complexity_limits=limits)
+
+    # or as a validation rule
+    graphql.validate(schema, document, [*graphql.specified_rules, limits.rule()])
+"""
+from collections import namedtuple
+import logging
+from typing import Dict, List, Optional, Tuple, Type
+
+import graphql
+
+logger = logging.getLogger(__name__)
+
+# `cost` is None if the default one is used,
+# the multiplier is the value of the first passed argument of `multiplier_args`
+FieldCost = namedtuple("FieldCost", ["cost", "multiplier_args"])
+
+QueryComplexity = namedtuple("QueryComplexity", ["depth", "fields", "aliases", "cost"])
+
+# (option name, `QueryComplexity` attribute, name in error messages)
+_LIMITS = (
+    ("max_depth", "depth", "depth"),
+    ("max_fields", "fields", "number of fields"),
+    ("max_aliases", "aliases", "number of aliases"),
+    ("max_cost", "cost", "cost"),
+)
+
+
+def get_field_cost(field_kw) -> Optional[FieldCost]:
+    """
+    Returns cost hints of a field from its options (`cost`, `multiplier_arg`),
+    argument names are converted to the names of GraphQL arguments.
+    """
+    cost = field_kw.get("cost")
+    multiplier_arg = field_kw.get("multiplier_arg")
+    if cost is None and multiplier_arg is None:
+        return None
+
+    if isinstance(multiplier_arg, str):
+        multiplier_arg = (multiplier_arg,)
+    arg_names = {
+        arg.out_name or name: name for name, arg in (field_kw.get("args") or {}).items()
+    }
+    return FieldCost(
+        cost=cost,
+        multiplier_args=tuple(arg_names.get(arg, arg) for arg in multiplier_arg or ()),
+    )
+
+
+class _LimitExceeded(Exception):
+    pass
+
+
+class _Analyzer:
+    """
+    Measures an operation. Results of fragments are memoized per parent type,
+    so every fragment is measured once, however many times it's spread.
+
+    Running totals are updated as fields are visited, if `limits` are passed,
+    the walk stops as soon as any of them is exceeded.
+    """
+
+    def __init__(
+        self, schema, fragments, variables, default_cost, default_multiplier, limits
+    ):
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables or {}
+        self.default_cost = default_cost
+        self.default_multiplier = default_multiplier
+        self.limits = limits
+        self.memo: Dict[tuple, tuple] = {}
+        self.total = dict(depth=0, fields=0, aliases=0, cost=0)
+
+    def analyze(self, operation: graphql.OperationDefinitionNode) -> QueryComplexity:
+        try:
+            root_type = graphql.get_operation_root_type(self.schema, operation)
+        except graphql.GraphQLError:  # reported by validation
+            return QueryComplexity(depth=0, fields=0, aliases=0, cost=0)
+
+        try:
+            depth, cost, fields, aliases = self.selection_set(
+                root_type, operation.selection_set, 0, 1, ()
+            )
+        except _LimitExceeded:
+            return QueryComplexity(**self.total)
+        return QueryComplexity(depth=depth, fields=fields, aliases=aliases, cost=cost)
+
+    def add(self, depth, cost, fields, aliases) -> None:
+        total = self.total
+        total["depth"] = max(total["depth"], depth)
+        total["cost"] += cost
+        total["fields"] += fields
+        total["aliases"] += aliases
+
+        limits = self.limits
+        if limits is None:
+            return
+        for option, attr, _title in _LIMITS:
+            limit = getattr(limits, option)
+            if limit is not None and total[attr] > limit:
+                raise _LimitExceeded
+
+    def selection_set(self, parent_type, selection_set, depth, scale, fragment_names):
+        """
+        Returns (depth, cost, fields, aliases) of the selection set, the depth is
+        relative to the selection set, the cost is not multiplied by `scale`
+        (the product of multipliers of parent fields).
+        """
+        result = [0, 0, 0, 0]
+
+        for selection in selection_set.selections:
+            type_ = parent_type
+            names = fragment_names
+
+            if isinstance(selection, graphql.FieldNode):
+                part = self.field(parent_type, selection, depth, scale)
+
+            else:
+                memo_key = None
+                if isinstance(selection, graphql.FragmentSpreadNode):
+                    name = selection.name.value
+                    fragment = self.fragments.get(name)
+                    if fragment is None or name in fragment_names:  # invalid documents
+                        continue
+                    names = (*fragment_names, name)
+                    selection = fragment
+
+                if selection.type_condition is not None:
+                    type_ = self.schema.get_type(selection.type_condition.name.value)
+                if type_ is None:
+                    continue
+
+                if names is not fragment_names:
+                    memo_key = (names[-1], parent_type.name)
+                    part = self.memo.get(memo_key)
+                    if part is not None:
+                        self.add(depth + part[0], scale * part[1], part[2], part[3])
+
+                if memo_key is None or part is None:
+                    part = self.selection_set(
+                        type_, selection.selection_set, depth, scale, names
+                    )
+                    if memo_key is not None:
+                        self.memo[memo_key] = part
+
+            result[0] = max(result[0], part[0])
+            result[1] += part[1]
+            result[2] += part[2]
+            result[3] += part[3]
+
+        return tuple(result)
+
+    def field(self, parent_type, node: graphql.FieldNode, depth, scale):
+        name = node.name.value
+        if name.startswith("__"):  # introspection
+            return 0, 0, 0, 0
+
+        fields = getattr(parent_type, "fields", None) or {}
+        field = fields.get(name)
+        if field is None:
+            return 0, 0, 0, 0
+
+        aliases = 0 if node.alias is None else 1
+
+        hint: Optional[FieldCost] = (field.extensions or {}).get("cost")
+        cost = self.default_cost
+        if hint is not None and hint.cost is not None:
+            cost = hint.cost
+
+        self.add(depth + 1, scale * cost, 1, aliases)
+        if node.selection_set is None:
+            return 1, cost, 1, aliases
+
+        multiplier = self.multiplier(field, node, hint)
+        child_depth, child_cost, child_fields, child_aliases = self.selection_set(
+            graphql.get_named_type(field.type),
+            node.selection_set,
+            depth + 1,
+            scale * multiplier,
+            (),
+        )
+        return (
+            1 + child_depth,
+            cost + multiplier * child_cost,
+            1 + child_fields,
+            aliases + child_aliases,
+        )
+
+    def multiplier(self, field, node: graphql.FieldNode, hint) -> int:
+        if hint is None or not hint.multiplier_args:
+            return 1
+
+        arg_nodes = {arg.name.value: arg.value for arg in node.arguments or ()}
+        for arg_name in hint.multiplier_args:
+            arg = field.args.get(arg_name)
+            if arg is None:
+                continue
+            value = graphql.INVALID
+            if arg_name in arg_nodes:
+                value = graphql.value_from_ast(
+                    arg_nodes[arg_name], arg.type, self.variables
+                )
+            if value is graphql.INVALID:
+                value = arg.default_value
+            if isinstance(value, int) and not isinstance(value, bool):
+                return max(value, 0)
+
+        return self.default_multiplier
+
+
+def analyze_query(
+    schema: graphql.GraphQLSchema,
+    document: graphql.DocumentNode,
+    variable_values: Optional[Dict] = None,
+    operation_name: Optional[str] = None,
+    default_cost: int = 1,
+    default_multiplier: int = 10,
+) -> Optional[QueryComplexity]:
+    """
+    Returns complexity of the operation of the document (None if the operation
+    cannot be found). `default_multiplier` is used for fields with multiplier
+    arguments, when none of them is passed (and they have no default values).
+    """
+    operation = graphql.get_operation_ast(document, operation_name)
+    if operation is None:
+        return None
+    return _analyze_operation(
+        schema, document, operation, variable_values, default_cost, default_multiplier
+    )
+
+
+def _analyze_operation(
+    schema,
+    document,
+    operation,
+    variable_values,
+    default_cost,
+    default_multiplier,
+    limits=None,
+):
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, graphql.FragmentDefinitionNode)
+    }
+    analyzer = _Analyzer(
+        schema, fragments, variable_values, default_cost, default_multiplier, limits
+    )
+    return analyzer.analyze(operation)
+
+
+class ComplexityLimits:
+    """
+    Thresholds of query complexity (None means unlimited).
+
+    Operations above the thresholds are rejected, in the `report_only` mode
+    they are executed, but logged as warnings and complexity is reported
+    in `extensions` of results.
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        max_cost: Optional[int] = None,
+        max_fields: Optional[int] = None,
+        max_aliases: Optional[int] = None,
+        report_only: bool = False,
+        default_cost: int = 1,
+        default_multiplier: int = 10,
+    ):
+        self.max_depth = max_depth
+        self.max_cost = max_cost
+        self.max_fields = max_fields
+        self.max_aliases = max_aliases
+        self.report_only = report_only
+        self.default_cost = default_cost
+        self.default_multiplier = default_multiplier
+
+    def analyze(
+        self, schema, document, variable_values=None, operation_name=None
+    ) -> Optional[QueryComplexity]:
+        """
+        Returns complexity of the operation. Unless in the `report_only` mode,
+        the analysis stops as soon as a threshold is exceeded (the returned
+        values are partial then).
+        """
+        operation = graphql.get_operation_ast(document, operation_name)
+        if operation is None:
+            return None
+        return _analyze_operation(
+            schema,
+            document,
+            operation,
+            variable_values,
+            self.default_cost,
+            self.default_multiplier,
+            limits=None if self.report_only else self,
+        )
+
+    def check(
+        self, complexity: QueryComplexity, nodes=None
+    ) -> List[graphql.GraphQLError]:
+        """Returns errors for every exceeded threshold"""
+        errors = []
+        for option, attr, title in _LIMITS:
+            limit = getattr(self, option)
+            value = getattr(complexity, attr)
+            if limit is not None and value > limit:
+                errors.append(
+                    graphql.GraphQLError(
+                        f"Query {title} {value} exceeds the maximum of {limit}",
+                        nodes,
+                        extensions={
+                            "code": "QUERY_TOO_COMPLEX",
+                            "complexity": complexity._asdict(),
+                        },
+                    )
+                )
+        return errors
+
+    def apply(
+        self, schema, document, variable_values=None, operation_name=None
+    ) -> Tuple[List[graphql.GraphQLError], Optional[Dict]]:
+        """
+        Returns errors rejecting the operation and extensions of its result
+        (according to the `report_only` mode).
+        """
+        complexity = self.analyze(schema, document, variable_values, operation_name)
+        if complexity is None:
+            return [], None
+
+        errors = self.check(complexity)
+        if not self.report_only:
+            return errors, None
+
+        for error in errors:
+            logger.warning(error.message)
+        return [], {"complexity": complexity._asdict()}
+
+    def rule(self, variable_values=None) -> Type[graphql.ValidationRule]:
+        """
+        Returns a validation rule reporting operations above the thresholds
+        (operations are measured with `variable_values`, if they're known).
+        """
+        limits = self
+
+        class QueryComplexityRule(graphql.ValidationRule):
+            def enter_operation_definition(self, node, *_args):
+                complexity = _analyze_operation(
+                    self.context.schema,
+                    self.context.document,
+                    node,
+                    variable_values,
+                    limits.default_cost,
+                    limits.default_multiplier,
+                    limits=limits,
+                )
+                for error in limits.check(complexity, nodes=[node]):
+                    self.report_error(error)
+
+        return QueryComplexityRule
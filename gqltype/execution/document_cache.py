@@ -0,0 +1,101 @@
+"""
+Cache of parsed and validated documents.
+
+Clients usually send a handful of distinct documents, so parsing and
+validation of a query text is done once (per schema), later requests
+with the same text go straight to execution:
+
+    document_cache = DocumentCache(max_size=1000)
+    result = await execute_query(schema, query, document_cache=document_cache)
+    print(document_cache.stats)
+"""
+from collections import OrderedDict, namedtuple
+from typing import List, Optional
+
+import graphql
+
+# `document` is None if the query text cannot be parsed, `compiled_queries`
+# are plans of its operations by names (see `gqltype.execution.compiler`)
+ParsedDocument = namedtuple(
+    "ParsedDocument", ["document", "errors", "compiled_queries"]
+)
+
+
+class DocumentCacheStats:
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def __repr__(self):
+        return (
+            f"<DocumentCacheStats hits={self.hits} misses={self.misses} "
+            f"evictions={self.evictions} hit_rate={self.hit_rate:.2f}>"
+        )
+
+
+class DocumentCache:
+    """
+    LRU cache of parsing and validation results keyed on schema and query text.
+
+    Invalid documents are cached as well (with their errors). The least
+    recently used documents are evicted when there're more than `max_size`
+    of them, so documents of replaced schemas are dropped eventually.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self.stats = DocumentCacheStats()
+        self._documents: "OrderedDict[tuple, ParsedDocument]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def get(self, schema: graphql.GraphQLSchema, query: str) -> ParsedDocument:
+        """Returns the parsed document and errors of parsing or validation"""
+        if not isinstance(query, str):  # e.g. unhashable values of JSON requests
+            return parse_and_validate(schema, query)
+
+        key = (schema, query)
+        try:
+            parsed = self._documents[key]
+        except KeyError:
+            pass
+        else:
+            self._documents.move_to_end(key)
+            self.stats.hits += 1
+            return parsed
+
+        self.stats.misses += 1
+        parsed = self._documents[key] = parse_and_validate(schema, query)
+        while len(self._documents) > self.max_size:
+            self._documents.popitem(last=False)
+            self.stats.evictions += 1
+        return parsed
+
+    def clear(self) -> None:
+        self._documents.clear()
+
+
+def parse_and_validate(schema: graphql.GraphQLSchema, query: str) -> ParsedDocument:
+    errors: List[graphql.GraphQLError] = graphql.validate_schema(schema)
+    if errors:
+        return ParsedDocument(None, errors, {})
+
+    if not isinstance(query, str):
+        error = graphql.GraphQLError("Query must be a string")
+        return ParsedDocument(None, [error], {})
+
+    try:
+        document: Optional[graphql.DocumentNode] = graphql.parse(query)
+    except graphql.GraphQLError as error:
+        return ParsedDocument(None, [error], {})
+
+    return ParsedDocument(document, graphql.validate(schema, document), {})
@@ -1,27 +1,52 @@
 from datetime import date as PyDate
+import re
 
-import aniso8601
 import graphql
 from graphql.language import ast
 
+from .scalar import GraphQLScalarType
+
+
+# `fromisoformat` is available since Python 3.7
+_fromisoformat = getattr(PyDate, "fromisoformat", None)
+# the format of `isoformat()`, others are parsed by aniso8601 (newer Pythons
+# accept more formats by `fromisoformat`, which are not valid for aniso8601)
+_ISO_FORMAT = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse(value: str) -> PyDate:
+    if (
+        _fromisoformat is not None
+        and isinstance(value, str)
+        and _ISO_FORMAT.fullmatch(value)
+    ):
+        try:
+            return _fromisoformat(value)
+        except (TypeError, ValueError):
+            pass
+
+    from aniso8601 import parse_date
+
+    return parse_date(value)
+
 
 def serialize(value: PyDate):
     if not isinstance(value, PyDate):
-        value = aniso8601.parse_date(value)
+        value = _parse(value)
     return value.isoformat()
 
 
 def coerce(value: str):
-    return aniso8601.parse_date(value)
+    return _parse(value)
 
 
 def parse_literal(ast_node, _variables=None):
     if isinstance(ast_node, ast.StringValueNode):
-        return aniso8601.parse_date(ast_node.value)
+        return _parse(ast_node.value)
     return graphql.INVALID
 
 
-GraphQLDate = graphql.GraphQLScalarType(
+GraphQLDate = GraphQLScalarType(
     name="Date",
     description="The `Date` scalar type represents ISO 8601 date.",
     serialize=serialize,
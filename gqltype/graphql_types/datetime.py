@@ -1,27 +1,54 @@
 from datetime import datetime as PyDateTime
+import re
 
-import aniso8601
 import graphql
 from graphql.language import ast
 
+from .scalar import GraphQLScalarType
+
+
+# `fromisoformat` is available since Python 3.7
+_fromisoformat = getattr(PyDateTime, "fromisoformat", None)
+# the format of `isoformat()`, others are parsed by aniso8601 (newer Pythons
+# accept more formats by `fromisoformat`, which are not valid for aniso8601)
+_ISO_FORMAT = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d{3}(\d{3})?)?)?([+-]\d{2}:\d{2})?"
+)
+
+
+def _parse(value: str) -> PyDateTime:
+    if (
+        _fromisoformat is not None
+        and isinstance(value, str)
+        and _ISO_FORMAT.fullmatch(value)
+    ):
+        try:
+            return _fromisoformat(value)
+        except (TypeError, ValueError):
+            pass
+
+    from aniso8601 import parse_datetime
+
+    return parse_datetime(value)
+
 
 def serialize(value: PyDateTime):
     if not isinstance(value, PyDateTime):
-        value = aniso8601.parse_datetime(value)
+        value = _parse(value)
     return value.isoformat()
 
 
 def coerce(value: str):
-    return aniso8601.parse_datetime(value)
+    return _parse(value)
 
 
 def parse_literal(ast_node, _variables=None):
     if isinstance(ast_node, ast.StringValueNode):
-        return aniso8601.parse_datetime(ast_node.value)
+        return _parse(ast_node.value)
     return graphql.INVALID
 
 
-GraphQLDateTime = graphql.GraphQLScalarType(
+GraphQLDateTime = GraphQLScalarType(
     name="DateTime",
     description="The `DateTime` scalar type represents ISO 8601 datetime.",
     serialize=serialize,
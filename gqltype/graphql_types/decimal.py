@@ -3,6 +3,8 @@ from decimal import Decimal as PyDecimal
 import graphql
 from graphql.language import ast
 
+from .scalar import GraphQLScalarType
+
 
 def serialize(value):
     if not isinstance(value, PyDecimal):
@@ -22,7 +24,7 @@ def parse_literal(ast_node, _variables=None):
     return graphql.INVALID
 
 
-GraphQLDecimal = graphql.GraphQLScalarType(
+GraphQLDecimal = GraphQLScalarType(
     name="Decimal",
     description="The `Decimal` scalar type.",
     serialize=serialize,
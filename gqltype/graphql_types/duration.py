@@ -1,32 +1,58 @@
 from datetime import timedelta as PyDuration
+import re
 
-import aniso8601
 import graphql
 from graphql.language import ast
 
+from .scalar import GraphQLScalarType
+
+
+# Durations in the simple format: P1DT2H3M4.5S
+_SIMPLE_DURATION_RE = re.compile(
+    r"P(?:(\d+)D)?(?:T(?=\d)(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)(?:\.(\d{1,6}))?S)?)?"
+)
+
+
+def _parse(value: str) -> PyDuration:
+    match = _SIMPLE_DURATION_RE.fullmatch(value) if isinstance(value, str) else None
+    if match is not None and any(match.groups()):
+        days, hours, minutes, seconds, fraction = match.groups()
+        return PyDuration(
+            days=int(days or 0),
+            hours=int(hours or 0),
+            minutes=int(minutes or 0),
+            seconds=int(seconds or 0),
+            microseconds=int(fraction.ljust(6, "0")) if fraction else 0,
+        )
+
+    from aniso8601 import parse_duration
+
+    return parse_duration(value)
+
 
 def format_simple_iso8601_duration(value: PyDuration) -> str:
-    seconds = value.total_seconds()
-    minutes, seconds = divmod(seconds, 60)
+    # `timedelta` keeps normalized days, seconds and microseconds,
+    # so the calculations are done with integers
+    days = value.days
+    minutes, seconds = divmod(value.seconds, 60)
     hours, minutes = divmod(minutes, 60)
-    days, hours = divmod(hours, 24)
-    seconds = round(seconds, 6)
+    microseconds = value.microseconds
 
     parts = []
 
     if days:
-        parts.append(f"P{days:.0f}D")
+        parts.append(f"P{days}D")
 
-    if any((hours, minutes, seconds)):
+    if hours or minutes or seconds or microseconds:
         parts.append("T")
 
     if hours:
-        parts.append(f"{hours:.0f}H")
+        parts.append(f"{hours}H")
     if minutes:
-        parts.append(f"{minutes:.0f}M")
-    if seconds:
-        if seconds.is_integer():
-            seconds = int(seconds)
+        parts.append(f"{minutes}M")
+    if microseconds:
+        parts.append(f"{round(seconds + microseconds / 1_000_000, 6)}S")
+    elif seconds:
         parts.append(f"{seconds}S")
 
     return "".join(parts)
@@ -37,16 +63,16 @@ def serialize(value: PyDuration):
 
 
 def coerce(value: str):
-    return aniso8601.parse_duration(value)
+    return _parse(value)
 
 
 def parse_literal(ast_node, _variables=None):
     if isinstance(ast_node, ast.StringValueNode):
-        return aniso8601.parse_duration(ast_node.value)
+        return _parse(ast_node.value)
     return graphql.INVALID
 
 
-GraphQLDuration = graphql.GraphQLScalarType(
+GraphQLDuration = GraphQLScalarType(
     name="Duration",
     description="The `Duration` scalar type represents ISO8601 duration.",
     serialize=serialize,
@@ -0,0 +1,14 @@
+import graphql
+
+
+class GraphQLScalarType(graphql.GraphQLScalarType):
+    """
+    Scalar type which can serialize lists of values at once.
+
+    `serialize_many` is used by `gqltype.execution.ExecutionContext` for fields
+    of `List[scalar]` type (instead of completing every item separately).
+    """
+
+    def serialize_many(self, values):
+        serialize = self.serialize
+        return [None if value is None else serialize(value) for value in values]
@@ -1,25 +1,50 @@
 from datetime import time as PyTime
+import re
 
-import aniso8601
 import graphql
 from graphql.language import ast
 
+from .scalar import GraphQLScalarType
+
+
+# `fromisoformat` is available since Python 3.7
+_fromisoformat = getattr(PyTime, "fromisoformat", None)
+# the format of `isoformat()`, others are parsed by aniso8601 (newer Pythons
+# accept more formats by `fromisoformat`, which are not valid for aniso8601)
+_ISO_FORMAT = re.compile(r"\d{2}:\d{2}(:\d{2}(\.\d{3}(\d{3})?)?)?([+-]\d{2}:\d{2})?")
+
+
+def _parse(value: str) -> PyTime:
+    if (
+        _fromisoformat is not None
+        and isinstance(value, str)
+        and _ISO_FORMAT.fullmatch(value)
+    ):
+        try:
+            return _fromisoformat(value)
+        except (TypeError, ValueError):
+            pass
+
+    from aniso8601 import parse_time
+
+    return parse_time(value)
+
 
 def serialize(value: PyTime):
     return value.isoformat()
 
 
 def coerce(value: str):
-    return aniso8601.parse_time(value)
+    return _parse(value)
 
 
 def parse_literal(ast_node, _variables=None):
     if isinstance(ast_node, ast.StringValueNode):
-        return aniso8601.parse_time(ast_node.value)
+        return _parse(ast_node.value)
     return graphql.INVALID
 
 
-GraphQLTime = graphql.GraphQLScalarType(
+GraphQLTime = GraphQLScalarType(
     name="Time",
     description="The `Time` scalar type represents ISO 8601 time.",
     serialize=serialize,
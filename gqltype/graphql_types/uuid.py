@@ -3,6 +3,8 @@ from uuid import UUID as PyUUID
 import graphql
 from graphql.language import ast
 
+from .scalar import GraphQLScalarType
+
 
 def serialize(value: PyUUID):
     if not isinstance(value, PyUUID):
@@ -20,7 +22,7 @@ def parse_literal(ast_node, _variables=None):
     return graphql.INVALID
 
 
-GraphQLUUID = graphql.GraphQLScalarType(
+GraphQLUUID = GraphQLScalarType(
     name="UUID",
     description="The `UUID` scalar type.",
     serialize=serialize,
@@ -0,0 +1,152 @@
+"""
+Schema build instrumentation.
+
+Usage:
+
+    schema = gqltype.Schema(queries=[...])
+    schema.build(profile=True)
+    print(schema.build_stats.report())
+"""
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+import inspect
+import sys
+from time import perf_counter
+from typing import Dict, List
+
+
+def _name(obj) -> str:
+    if inspect.isclass(obj):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    return repr(obj)
+
+
+class Timing:
+    """Aggregated timing of a measured item"""
+
+    __slots__ = ("calls", "total", "own")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.own = 0.0
+
+    def __repr__(self):
+        return (
+            f"<Timing calls={self.calls} total={self.total:.6f} own={self.own:.6f}>"
+        )
+
+
+class BuildStats:
+    """
+    Timings and counters collected during `Schema.build(profile=...)`.
+
+    - `types` - per type: how many times `Transformer.transform` was entered,
+      inclusive and own (excluding nested transformations) time;
+    - `transformations` - time spent in each transformation module;
+    - `introspection` - time spent introspecting each class;
+    - `cache_hits`/`cache_misses` - `cache_type` counters per cached function
+      ("types_cache" counts hits of the transformer's fast path);
+    - `context_clones` - number of derived transform contexts.
+    """
+
+    def __init__(self):
+        self.types: Dict[str, Timing] = defaultdict(Timing)
+        self.transformations: Dict[str, Timing] = defaultdict(Timing)
+        self.introspection: Dict[str, Timing] = defaultdict(Timing)
+        self.phases: Dict[str, Timing] = defaultdict(Timing)
+        self.cache_hits: Counter = Counter()
+        self.cache_misses: Counter = Counter()
+        self.context_clones = 0
+
+        # time spent in nested measurements, used to calculate own time
+        self._nested: List[float] = []
+
+    @contextmanager
+    def _measure(self, timing: Timing):
+        self._nested.append(0.0)
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - started
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+
+            timing.calls += 1
+            timing.total += elapsed
+            timing.own += elapsed - nested
+
+    def measure_type(self, t):
+        return self._measure(self.types[_name(t)])
+
+    def measure_transformation(self, transformation):
+        return self._measure(self.transformations[transformation.__name__])
+
+    def measure_introspection(self, cls):
+        return self._measure(self.introspection[_name(cls)])
+
+    @contextmanager
+    def measure_phase(self, name: str):
+        # phases are not nested into other measurements
+        timing = self.phases[name]
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            timing.calls += 1
+            timing.total += perf_counter() - started
+
+    def cache_hit(self, fn_name: str):
+        self.cache_hits[fn_name] += 1
+
+    def cache_miss(self, fn_name: str):
+        self.cache_misses[fn_name] += 1
+
+    def context_cloned(self):
+        self.context_clones += 1
+
+    def report(self, limit: int = 20, sort_by: str = "own") -> str:
+        """Returns a text report with tables sorted by "own", "total" or "calls"."""
+
+        def table(title, timings):
+            rows = sorted(
+                timings.items(), key=lambda i: getattr(i[1], sort_by), reverse=True
+            )
+            lines = [
+                f"{title} (top {limit} by {sort_by}):",
+                f"  {'calls':>8} {'total ms':>10} {'own ms':>10}  name",
+            ]
+            for name, timing in rows[:limit]:
+                lines.append(
+                    f"  {timing.calls:>8} {timing.total * 1000:>10.3f} "
+                    f"{timing.own * 1000:>10.3f}  {name}"
+                )
+            return lines
+
+        lines = ["Schema build stats"]
+        for name, timing in self.phases.items():
+            lines.append(f"  {name}: {timing.total * 1000:.3f} ms")
+        lines.append(
+            f"  transform calls: {sum(t.calls for t in self.types.values())}"
+            f" ({len(self.types)} types)"
+        )
+        lines.append(f"  context clones: {self.context_clones}")
+        for fn_name in sorted(set(self.cache_hits) | set(self.cache_misses)):
+            lines.append(
+                f"  cache {fn_name}: {self.cache_hits[fn_name]} hits, "
+                f"{self.cache_misses[fn_name]} misses"
+            )
+
+        lines.append("")
+        lines.extend(table("Types", self.types))
+        lines.append("")
+        lines.extend(table("Transformations", self.transformations))
+        lines.append("")
+        lines.extend(table("Class introspection", self.introspection))
+
+        return "\n".join(lines)
+
+    def dump(self, file=None, **kw) -> None:
+        print(self.report(**kw), file=file or sys.stdout)
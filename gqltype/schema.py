@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Optional
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional, Union
 
 import graphql
 
@@ -11,9 +12,13 @@ from .decorators import (
     is_query,
     is_subscription,
 )
+from .cache import CacheBackend, InMemoryCache
 from .transform import Transformer
 from .utils import is_class, get_name
 from .context import RootContext
+from .profiling import BuildStats
+from .snapshot import load_snapshot, save_snapshot
+from .variant import SchemaVariant, TypesFilter
 
 
 def generate_root_type(objs, name=None):
@@ -28,9 +33,27 @@ def generate_root_type(objs, name=None):
     return type(name or "RootType", tuple(bases), attrs)
 
 
+@contextmanager
+def _no_measure():
+    # `contextlib.nullcontext` is not available on Python 3.6
+    yield
+
+
+@dataclass
+class _RootType:
+    """Accumulated state of a root type between builds"""
+
+    objs: set = field(default_factory=set)
+    fields: dict = field(default_factory=dict)
+    interfaces: list = field(default_factory=list)
+    description: Optional[str] = None
+    gql_type: Optional[graphql.GraphQLObjectType] = None
+
+
 class Schema:
     default_options = {"preset__camel_case": True}
     root_context_class = RootContext
+    build_stats: Optional[BuildStats] = None
 
     def __init__(
         self, queries=None, mutations=None, subscriptions=None, types=None, **options
@@ -39,12 +62,25 @@ class Schema:
         self._mutations = mutations or []
         self._subscriptions = subscriptions or []
         self._types = types or []
-        self._root_context = self.root_context_class(
-            **{**self.default_options, **options}
-        )
+        self._options = {**self.default_options, **options}
+        self._root_context = self.root_context_class(**self._options)
+        if self._root_context.field_cache is None:
+            self._root_context.field_cache = InMemoryCache()
         self.transformer = Transformer(self._root_context)
+        self._root_types = {}
+
+    @property
+    def field_cache(self) -> CacheBackend:
+        """Cache of field values, e.g. to invalidate tags or read stats"""
+        return self._root_context.field_cache
 
     def register(self, *objs):
+        """
+        Registers queries, mutations, subscriptions or extra types.
+
+        Objects can be registered after the schema was built: the next `build()`
+        transforms only new objects and reuses already transformed types and fields.
+        """
         for obj in objs:
             if is_query(obj):
                 self._queries.append(obj)
@@ -55,31 +91,188 @@ class Schema:
             elif is_class(obj):
                 self._types.append(obj)
 
-    def build(self, **options):
-        self._root_context.update(options)
-        queries = list(map(query, self._queries))
-        mutations = list(map(mutation, self._mutations))
-        subscriptions = list(map(subscription, self._subscriptions))
+    def save_snapshot(self, path: str) -> None:
+        """Persists introspection results collected while building the schema."""
+        save_snapshot(path, options=self._options)
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Reuses introspection results saved by `save_snapshot`.
+
+        Returns `False` if there's no snapshot or it is outdated.
+        """
+        return load_snapshot(path, options=self._options)
+
+    def build(
+        self,
+        *,
+        snapshot: Optional[str] = None,
+        profile: Union[bool, BuildStats] = False,
+        **options,
+    ):
+        """
+        Generates `graphql.GraphQLSchema`.
+
+        If `snapshot` path is passed, introspection results are loaded from the file
+        (or saved to it, if the file is missing or outdated).
+
+        If `profile` is set (`True` or a `BuildStats` instance to accumulate stats
+        of several builds), timings and counters are collected to `self.build_stats`.
+        """
+        if options:
+            self._options.update(options)
+            self._root_context.update(options)
+            # root fields have to be regenerated with new options
+            self._root_types.clear()
+
+        if not profile:
+            return self._build_with_snapshot(snapshot)
+
+        stats = self.build_stats = BuildStats() if profile is True else profile
+        self.transformer.stats = stats
+        self.transformer.ctx.build_stats = stats
+        try:
+            with stats.measure_phase("build"):
+                return self._build_with_snapshot(snapshot)
+        finally:
+            self.transformer.stats = None
+            self.transformer.ctx.build_stats = None
+
+    def _build_with_snapshot(self, snapshot: Optional[str]):
+        snapshot_loaded = snapshot is not None and self.load_snapshot(snapshot)
+
+        schema = self._build()
+
+        if snapshot is not None and not snapshot_loaded:
+            self.save_snapshot(snapshot)
 
-        extra_types = [
-            self.transformer.transform(t, allow_null=True) for t in self._types
-        ]
+        return schema
 
-        return graphql.GraphQLSchema(
-            query=self.transformer.transform(
-                generate_root_type(queries, name="Query"), allow_null=True
+    def _phase(self, name: str):
+        if self.transformer.stats is None:
+            return _no_measure()
+        return self.transformer.stats.measure_phase(name)
+
+    def _build_root_type(self, objs, name, root_types):
+        """
+        Returns root type (Query, Mutation or Subscription).
+
+        Fields of the root type are accumulated between builds: only objects
+        registered since the previous build get transformed.
+        """
+        if not objs:
+            return None
+
+        root = root_types.get(name)
+        if root is None:
+            root = root_types[name] = _RootType()
+
+        new_objs = [obj for obj in objs if obj not in root.objs]
+        if new_objs:
+            root_cls = generate_root_type(new_objs, name=name)
+            gql_t = graphql.get_nullable_type(
+                self.transformer.transform(root_cls, allow_null=True)
             )
-            if queries
-            else None,
-            mutation=self.transformer.transform(
-                generate_root_type(mutations, name="Mutation"), allow_null=True
+            # the class is temporary, no need to keep it in cache
+            self.transformer.types_cache.pop(root_cls, None)
+
+            root.objs.update(new_objs)
+            root.fields.update(gql_t.fields)
+            root.interfaces.extend(
+                i for i in gql_t.interfaces if i not in root.interfaces
             )
-            if mutations
-            else None,
-            subscription=self.transformer.transform(
-                generate_root_type(subscriptions, name="Subscription"), allow_null=True
+            if root.description is None:
+                root.description = gql_t.description
+            root.gql_type = None
+
+        if root.gql_type is None:
+            root.gql_type = graphql.GraphQLObjectType(
+                name=name,
+                fields=dict(root.fields),
+                interfaces=list(root.interfaces),
+                description=root.description,
             )
-            if subscriptions
-            else None,
-            types=extra_types,
+
+        return root.gql_type
+
+    def _build(self):
+        return self._build_schema(
+            queries=self._queries,
+            mutations=self._mutations,
+            subscriptions=self._subscriptions,
+            types=self._types,
+            root_types=self._root_types,
+        )
+
+    def _build_schema(
+        self,
+        queries,
+        mutations,
+        subscriptions,
+        types,
+        root_types,
+        types_filter: Optional[TypesFilter] = None,
+    ):
+        # classes could have been defined since the previous build
+        self.transformer.subclass_index.clear()
+
+        queries = list(map(query, queries))
+        mutations = list(map(mutation, mutations))
+        subscriptions = list(map(subscription, subscriptions))
+
+        with self._phase("transform"):
+            extra_types = [
+                self.transformer.transform(t, allow_null=True) for t in types
+            ]
+            query_type = self._build_root_type(queries, "Query", root_types)
+            mutation_type = self._build_root_type(mutations, "Mutation", root_types)
+            subscription_type = self._build_root_type(
+                subscriptions, "Subscription", root_types
+            )
+
+        if types_filter is not None:
+            with self._phase("filter"):
+                roots = [
+                    t for t in (query_type, mutation_type, subscription_type) if t
+                ]
+                types_filter.prepare([*roots, *extra_types], roots=roots)
+                query_type = types_filter.map(query_type)
+                mutation_type = types_filter.map(mutation_type)
+                subscription_type = types_filter.map(subscription_type)
+                extra_types = [
+                    types_filter.map(t)
+                    for t in extra_types
+                    if not types_filter.is_excluded(t)
+                ]
+
+        with self._phase("graphql schema"):
+            return graphql.GraphQLSchema(
+                query=query_type,
+                mutation=mutation_type,
+                subscription=subscription_type,
+                types=extra_types,
+            )
+
+    def variant(
+        self,
+        queries=None,
+        mutations=None,
+        subscriptions=None,
+        types=None,
+        type_filter=None,
+        field_filter=None,
+    ) -> SchemaVariant:
+        """
+        Creates a variant of the schema (see `gqltype.variant.SchemaVariant`).
+
+        All variants share already transformed types with the schema.
+        """
+        return SchemaVariant(
+            self,
+            queries=queries,
+            mutations=mutations,
+            subscriptions=subscriptions,
+            types=types,
+            type_filter=type_filter,
+            field_filter=field_filter,
         )
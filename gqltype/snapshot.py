@@ -0,0 +1,194 @@
+"""
+Snapshot of expensive introspection results.
+
+Building a schema spends most of its time introspecting classes and functions
+(`typing.get_type_hints`, `inspect.getfullargspec`, etc). A snapshot persists
+those results to a local file, so the next process start can reuse them and
+only construct graphql-core objects.
+
+A snapshot is bound to a fingerprint: schema options (see `_options_key`) and
+modification time/size of every module which introspected objects come from.
+If anything changed, the snapshot is ignored (and can be saved again).
+
+Objects are pickled by reference, so only entries defined at module level can
+be persisted; everything else is silently skipped and introspected as usual.
+"""
+import hashlib
+import importlib.util
+import inspect
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Dict, Optional
+
+from .utils import MISSING
+from .utils.camel_case import converted_names
+from .utils.cls import iter_introspected_classes, restore_class_introspection
+from .utils.func import iter_inspected_functions, restore_function_introspection
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Changes in these modules affect introspection results
+_INTROSPECTION_MODULES = ("gqltype.utils.cls", "gqltype.utils.func")
+
+
+def _option_key(value):
+    """
+    Returns a key of the option value, which is the same in every process
+    (`MISSING` for values without such key, i.e. arbitrary objects).
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        items = value.items() if isinstance(value, dict) else value
+        keys = [_option_key(item) for item in items]
+        if MISSING in keys:
+            return MISSING
+        if isinstance(value, (set, frozenset, dict)):
+            keys.sort(key=repr)
+        return (type(value).__name__, tuple(keys))
+    if inspect.isfunction(value) or inspect.isclass(value):
+        # by reference (values of the same name in every process)
+        return ("ref", value.__module__, value.__qualname__)
+    return MISSING
+
+
+def _options_key(options: dict) -> str:
+    """
+    Fingerprint of the options: values of plain types and references to
+    functions and classes. Other objects (e.g. cache backends) do not affect
+    introspection results and are not a part of it.
+    """
+    keys = []
+    for name, value in sorted(options.items()):
+        key = _option_key(value)
+        if key is not MISSING:
+            keys.append((name, key))
+    key = repr((SNAPSHOT_VERSION, sys.version, keys))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _module_stamp(module_name: str) -> Optional[tuple]:
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if path is None:
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            return None
+        path = spec.origin if spec else None
+
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _dumps(obj) -> Optional[bytes]:
+    try:
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:  # not every object can be pickled (e.g. local classes)
+        return None
+
+
+def save_snapshot(path: str, options: dict) -> None:
+    """Saves introspection results collected in the current process"""
+    modules: Dict[str, Any] = {}
+    classes = []
+    functions = []
+
+    for info in iter_introspected_classes():
+        data = _dumps((info.cls, info.annotations, info.definitions))
+        if data is not None:
+            classes.append(data)
+            modules[info.cls.__module__] = None
+
+    for fn, type_hints, params_definition in iter_inspected_functions():
+        data = _dumps((fn, type_hints, params_definition))
+        if data is not None:
+            functions.append(data)
+            modules[fn.__module__] = None
+
+    modules.update(dict.fromkeys(_INTROSPECTION_MODULES))
+    modules = {name: _module_stamp(name) for name in modules}
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "key": _options_key(options),
+        "modules": modules,
+        "classes": classes,
+        "functions": functions,
+        "names": dict(converted_names),
+    }
+
+    # Write to a temporary file first, so concurrent workers never
+    # read a partially written snapshot
+    dir_name = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".gqltype-snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    logger.debug(
+        "[SNAPSHOT] Saved %d classes and %d functions to %s",
+        len(classes),
+        len(functions),
+        path,
+    )
+
+
+def load_snapshot(path: str, options: dict) -> bool:
+    """
+    Loads introspection results if the snapshot matches current sources and options.
+
+    Returns `True` if the snapshot was applied.
+    """
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return False
+    except Exception:
+        logger.warning("[SNAPSHOT] Cannot read %s, ignoring it.", path, exc_info=True)
+        return False
+
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != SNAPSHOT_VERSION
+        or snapshot.get("key") != _options_key(options)
+    ):
+        logger.debug("[SNAPSHOT] %s was made for different options.", path)
+        return False
+
+    for module_name, stamp in snapshot["modules"].items():
+        if stamp is None or _module_stamp(module_name) != stamp:
+            logger.debug("[SNAPSHOT] %s is outdated (%s).", path, module_name)
+            return False
+
+    for data in snapshot["functions"]:
+        try:
+            fn, type_hints, params_definition = pickle.loads(data)
+        except Exception:
+            continue
+        restore_function_introspection(fn, type_hints, params_definition)
+
+    for data in snapshot["classes"]:
+        try:
+            cls, annotations, definitions = pickle.loads(data)
+        except Exception:
+            continue
+        restore_class_introspection(cls, annotations, definitions)
+
+    converted_names.update(snapshot["names"])
+
+    logger.debug("[SNAPSHOT] Loaded %s", path)
+    return True
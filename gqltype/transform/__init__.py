@@ -1 +1,14 @@
-from .transformer import Transformer
+import sys
+
+
+def __getattr__(name):
+    # the transformer pulls in graphql-core, `T` container does not need it
+    if name == "Transformer":
+        from .transformer import Transformer
+
+        return Transformer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):  # no module `__getattr__` (PEP 562)
+    from .transformer import Transformer
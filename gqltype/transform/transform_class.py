@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from dataclasses import is_dataclass, fields as dataclass_fields
+import dataclasses
 import enum
 import inspect
 import logging
@@ -8,16 +8,23 @@ from functools import partial, wraps
 import graphql
 
 from ..context import TransformContext
-from ..decorators import is_query, is_subscription, is_mutation
+from ..decorators import (
+    get_extra_schema_options,
+    is_batch_resolver,
+    is_mutation,
+    is_query,
+    is_subscription,
+)
+from ..execution.complexity import get_field_cost
 from ..graphql_types import ID
 from ..utils import (
     cache_type,
     get_name,
     get_doc,
-    get_attr_definitions,
+    inspect_class,
     is_class,
     is_interface,
-    get_interfaces,
+    is_typing_type,
     MISSING,
 )
 from ..utils.func import inspect_function
@@ -27,9 +34,21 @@ from .type_container import T
 logger = logging.getLogger(__name__)
 
 
-def to_field(t, ctx: TransformContext):
+def _get_class_info(cls, ctx: TransformContext):
+    if ctx.build_stats is None:
+        return inspect_class(cls)
+
+    with ctx.build_stats.measure_introspection(cls):
+        return inspect_class(cls)
+
+
+def to_field(t, ctx: TransformContext, extensions=None):
+    # `extensions` are not taken from the context: options of `T(...)` are
+    # inherited by fields of the wrapped type
     params = ("args", "resolve", "subscribe", "description", "deprecation_reason")
-    return graphql.GraphQLField(t, **{k: ctx[k] for k in params if k in ctx})
+    return graphql.GraphQLField(
+        t, extensions=extensions, **{k: ctx[k] for k in params if k in ctx}
+    )
 
 
 def to_input_field(t, ctx: TransformContext):
@@ -72,14 +91,29 @@ def to_graphql_arguments(arguments, ctx: TransformContext):
     return args
 
 
+def _get_batch_item_definition(definition):
+    """Batch resolvers return `List[T]`, where `T` is the type of the field"""
+    container = definition.type_ if isinstance(definition.type_, T) else None
+    type_ = definition.type_.type_ if container else definition.type_
+
+    if not (is_typing_type(type_) and getattr(type_, "_name", None) == "List"):
+        raise TypeError(
+            f"Batch resolver of '{definition.name}' must return List[...], "
+            f"got {type_}"
+        )
+
+    item_type = type_.__args__[0]
+    if container:
+        item_type = container(type_=item_type)
+    return dataclasses.replace(definition, type_=item_type)
+
+
 def iterate_class_attributes_for_output_type(cls, ctx: TransformContext):
     resolve_prefix = ctx.resolve_method_name_prefix
     subscribe_prefix = ctx.subscribe_method_name_prefix
 
-    attrs = [
-        *get_attr_definitions(cls, only_props=True).values(),
-        *get_attr_definitions(cls, only_funcs=True).values(),
-    ]
+    info = inspect_class(cls)
+    attrs = [*info.props, *info.funcs]
 
     names = set()
 
@@ -125,15 +159,23 @@ def iterate_class_attributes_for_output_type(cls, ctx: TransformContext):
 
         # attribute definition
         else:
-            resolve_fn = getattr(cls, f"{resolve_prefix}{name}", None)
+            resolve_fn = info.attributes.get(f"{resolve_prefix}{name}")
             # subscribe_fn = getattr(cls, f"{subscribe_prefix}{name}", None)
 
+        if resolve_fn is definition.value and is_batch_resolver(resolve_fn):
+            # the field type is defined by the return type of the resolver
+            definition = _get_batch_item_definition(definition)
+
         if resolve_fn and subscribe_fn:
             raise TypeError(f"Specified both resolve and subscribe methods for {name}")
 
         if name in names:
             continue
 
+        if resolve_fn is not None:
+            # field options declared on resolvers (e.g. `@schema_options(cost=5)`)
+            field_kw.update(get_extra_schema_options(resolve_fn))
+
         resolve_fn, arguments = ctx.hook__prepare_field_resolver(
             name, definition, resolve_fn
         )
@@ -166,7 +208,9 @@ def _lazy_fields(ctx: TransformContext, lazy_fields):
             if ctx.auto_graphql_id and name == "id" and type_ is str:
                 type_ = ID
             gql_t = ctx.transformer.transform(type_)
-            field = to_field(gql_t, ctx(**field_kw))
+            field = to_field(
+                gql_t, ctx(**field_kw), extensions=field_kw.get("extensions")
+            )
             fields[ctx.hook__convert_name(name, for_type=field)] = field
 
         return fields
@@ -177,10 +221,8 @@ def _lazy_fields(ctx: TransformContext, lazy_fields):
 @cache_type
 def _transform_class_to_output_type(cls, ctx: TransformContext):
     fields = []
-
-    dc_fields = {}
-    if is_dataclass(cls):
-        dc_fields = {f.name: f for f in dataclass_fields(cls)}
+    info = _get_class_info(cls, ctx)
+    dc_fields = info.dataclass_fields
 
     for name, definition, field_kw in iterate_class_attributes_for_output_type(
         cls, ctx
@@ -191,6 +233,14 @@ def _transform_class_to_output_type(cls, ctx: TransformContext):
         if dataclass_field:
             field_kw.update(dataclass_field.metadata)
 
+        field_kw["resolve"] = ctx.hook__prepare_cached_field_resolver(
+            f"{get_name(cls)}.{name}", field_kw.get("resolve"), field_kw
+        )
+        cost = get_field_cost(field_kw)
+        if cost is not None:
+            extensions = field_kw.get("extensions") or {}
+            field_kw["extensions"] = {**extensions, "cost": cost}
+
         fields.append((name, type_, field_kw))
 
     if not fields:
@@ -213,7 +263,7 @@ def _transform_class_to_output_type(cls, ctx: TransformContext):
 
     interfaces = lambda: [
         _transform_class_to_output_type(interface_cls, ctx)
-        for interface_cls in get_interfaces(cls)
+        for interface_cls in info.interfaces
     ]
 
     return graphql.GraphQLObjectType(
@@ -244,9 +294,7 @@ def _lazy_input_fields(ctx: TransformContext, lazy_fields):
 
 
 def iterate_class_attributes_for_input_type(cls, ctx: TransformContext):
-    attrs = [*get_attr_definitions(cls, only_props=True).values()]
-
-    for definition in attrs:
+    for definition in inspect_class(cls).props:
 
         # for now skip all fields without annotation/type
         if not (definition.annotation or definition.type_):
@@ -269,10 +317,7 @@ def iterate_class_attributes_for_input_type(cls, ctx: TransformContext):
 @cache_type
 def _transform_class_to_input_type(cls, ctx: TransformContext):
     fields = []
-
-    dc_fields = {}
-    if is_dataclass(cls):
-        dc_fields = {f.name: f for f in dataclass_fields(cls)}
+    dc_fields = _get_class_info(cls, ctx).dataclass_fields
 
     for name, definition, field_kw in iterate_class_attributes_for_input_type(cls, ctx):
         type_ = definition.type_
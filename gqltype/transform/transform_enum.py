@@ -1,6 +1,7 @@
 import enum
 
 import graphql
+from graphql.language import EnumValueNode
 from graphql.type.definition import GraphQLEnumValue
 
 from ..utils import cache_type, get_annotations, get_name, get_doc, is_class
@@ -12,9 +13,40 @@ class GraphQLEnumType(graphql.GraphQLEnumType):
         self.enum_cls = enum_cls
         super().__init__(*args, **kwargs)
 
+        # Precomputed lookups: enum member / raw value / name -> name
+        # (in order of priority) and name -> enum member
+        self._names = {}
+        self._members = {}
+        for name, value in self.values.items():
+            self._names[value.value] = name
+            self._members[name] = value.value
+        for name, value in self.values.items():
+            if isinstance(value.value, enum.Enum):
+                self._names.setdefault(value.value.value, name)
+        for name in self.values:
+            self._names.setdefault(name, name)
+
     def serialize(self, output_value):
-        # make sure resolved value is of `enum_cls` type
-        return super().serialize(self.enum_cls(output_value))
+        try:
+            return self._names[output_value]
+        except (KeyError, TypeError):
+            # make sure resolved value is of `enum_cls` type
+            return super().serialize(self.enum_cls(output_value))
+
+    def parse_value(self, input_value):
+        try:
+            return self._members[input_value]
+        except (KeyError, TypeError):
+            # let graphql-core report the error
+            return super().parse_value(input_value)
+
+    def parse_literal(self, value_node, _variables=None):
+        if isinstance(value_node, EnumValueNode):
+            try:
+                return self._members[value_node.value]
+            except KeyError:
+                pass
+        return super().parse_literal(value_node, _variables)
 
 
 def _to_enum_value(value, ctx) -> GraphQLEnumValue:
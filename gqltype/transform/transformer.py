@@ -6,7 +6,7 @@ import graphql
 
 from ..context import TransformContext, RootContext
 from ..decorators import get_extra_schema_options
-from ..utils import resolve_thunk, UnwrappedType, MISSING
+from ..utils import resolve_thunk, SubclassIndex, UnwrappedType, MISSING
 from . import (
     transform_graphql_type,
     transform_general_type,
@@ -33,9 +33,29 @@ class Transformer:
             transform_union,
             transform_class,
         ]
-        self.ctx = TransformContext(root_context, transformer=self, types_cache={})
+        self.types_cache = {}
+        # Implementations of interfaces (reset on every schema build)
+        self.subclass_index = SubclassIndex()
+        # `BuildStats` instance when the build is being profiled
+        self.stats = None
+        self.ctx = TransformContext(
+            root_context, transformer=self, types_cache=self.types_cache
+        )
+
+        # Classification cache: maps a type (annotation) to the index of the first
+        # transformation which can handle it. It's bound to a snapshot of
+        # `transformations`, so changing the list invalidates the cache.
+        self._dispatch_cache = {}
+        self._dispatch_transformations = list(self.transformations)
 
     def transform(self, t, *, allow_null=MISSING, **kw):
+        if self.stats is None:
+            return self._transform_type(t, allow_null, kw)
+
+        with self.stats.measure_type(t):
+            return self._transform_type(t, allow_null, kw)
+
+    def _transform_type(self, t, allow_null, kw):
         logger.debug(
             "[TRANSFORM] Try to transform %r with (allow_null=%s, %s)",
             t,
@@ -43,6 +63,14 @@ class Transformer:
             kw,
         )
 
+        # Fast path: the type has been already transformed
+        # (no need to resolve thunks or build a new context)
+        gql_t = self._get_cached_type(t)
+        if gql_t is not None:
+            if self.stats is not None:
+                self.stats.cache_hit("types_cache")
+            return self._handle_nullability(gql_t, allow_null)
+
         t = resolve_thunk(t)
 
         # Unwrap type container
@@ -69,20 +97,57 @@ class Transformer:
 
         return self._handle_nullability(gql_t, allow_null)
 
+    def _get_cached_type(self, t):
+        try:
+            return self.types_cache.get(t)
+        except TypeError:  # unhashable
+            return None
+
+    def _classify(self, t, ctx):
+        """Returns index of the first transformation which can handle `t`"""
+        transformations = self.transformations
+        if transformations != self._dispatch_transformations:
+            self._dispatch_cache.clear()
+            self._dispatch_transformations = list(transformations)
+
+        try:
+            return self._dispatch_cache[t]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable, cannot be cached
+            return self._find_transformation(t, ctx)
+
+        idx = self._dispatch_cache[t] = self._find_transformation(t, ctx)
+        return idx
+
+    def _find_transformation(self, t, ctx, start=0):
+        for idx in range(start, len(self.transformations)):
+            if self.transformations[idx].can_transform(t, ctx=ctx):
+                return idx
+        return None
+
     def _transform(self, t, ctx):
         """Converts regular type to graphql type"""
-        for transformation in self.transformations:
-            if transformation.can_transform(t, ctx=ctx):
-                logger.debug(
-                    "[TRANSFOMR] Applying %s to %s",
-                    transformation.transform.__module__,
-                    t,
-                )
+        idx = self._classify(t, ctx)
+
+        while idx is not None:
+            transformation = self.transformations[idx]
+            logger.debug(
+                "[TRANSFOMR] Applying %s to %s", transformation.transform.__module__, t,
+            )
 
+            if self.stats is None:
                 gql_t = transformation.transform(t, ctx=ctx)
-                if gql_t is not None:
-                    logger.debug("[TRANSFORM] %r transformed to %r", t, gql_t)
-                    return gql_t
+            else:
+                with self.stats.measure_transformation(transformation):
+                    gql_t = transformation.transform(t, ctx=ctx)
+
+            if gql_t is not None:
+                logger.debug("[TRANSFORM] %r transformed to %r", t, gql_t)
+                return gql_t
+
+            # The transformation refused to handle the type, try the next ones
+            idx = self._find_transformation(t, ctx, start=idx + 1)
 
         return t
 
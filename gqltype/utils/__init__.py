@@ -1,10 +1,12 @@
 from .cls import (
     inspect_class,
+    clear_class_introspection_cache,
     get_annotations,
     get_attr_definitions,
     is_class,
     is_interface,
     get_interfaces,
+    SubclassIndex,
 )
 from .func import (
     extend_params_definition,
@@ -1,4 +1,18 @@
+# Converted names are memoized (the same names are converted over and over)
+converted_names = {}
+
+
 def to_camel_case(name: str) -> str:
+    try:
+        return converted_names[name]
+    except KeyError:
+        pass
+
+    converted = converted_names[name] = _to_camel_case(name)
+    return converted
+
+
+def _to_camel_case(name: str) -> str:
     if not name:
         return name
     return name[0] + name.title().replace("_", "")[1:]
@@ -8,10 +8,9 @@ from types import LambdaType
 import typing
 from functools import lru_cache, partial
 import abc
+from weakref import WeakKeyDictionary
 
-import graphql
-from graphql.type.definition import GraphQLEnumValue
-
+from .func import get_function_type_hints
 from .types import MISSING
 
 logger = logging.getLogger(__name__)
@@ -25,13 +24,51 @@ def is_interface(t):
     if not is_class(t):
         return False
 
-    if not issubclass(t, abc.ABC):
-        # currently we do not support abstract classes defined via metaclass
-        return False
-
+    # Currently we do not support abstract classes defined via metaclass.
+    # Note. `issubclass(t, abc.ABC)` is not used here, as it walks through all
+    # subclasses of `abc.ABC` for every new class, which makes big schemas slow.
     return abc.ABC in t.__bases__
 
 
+class SubclassIndex:
+    """
+    Memoized subclasses of classes.
+
+    An index is shared by all interfaces of a schema, so every class hierarchy
+    is walked once (per build).
+    """
+
+    def __init__(self):
+        self._subclasses: typing.Dict[type, tuple] = {}
+
+    def clear(self) -> None:
+        self._subclasses.clear()
+
+    def get_implementations(self, cls, leaves_only: bool = True) -> list:
+        """
+        Returns subclasses of `cls` (excluding `cls` itself), by default only
+        leaf ones (subclasses without own subclasses).
+        """
+        subclasses = self._get_subclasses(cls)
+        if leaves_only:
+            return [c for c in subclasses if not c.__subclasses__()]
+        return list(subclasses)
+
+    def _get_subclasses(self, cls) -> tuple:
+        try:
+            return self._subclasses[cls]
+        except KeyError:
+            pass
+
+        subclasses = {}
+        for subclass in cls.__subclasses__():
+            subclasses[subclass] = None
+            subclasses.update(dict.fromkeys(self._get_subclasses(subclass)))
+
+        self._subclasses[cls] = tuple(subclasses)
+        return self._subclasses[cls]
+
+
 def get_interfaces(cls):
     interfaces = []
     bases = deque(cls.__bases__)
@@ -53,60 +90,79 @@ def get_annotations(obj):
     return typing.get_type_hints(obj)
 
 
+@dataclass
+class AttrDefinition:
+    name: str
+    annotation: typing.Any
+    value: typing.Any
+    type_: typing.Any
+
+    def __hash__(self):
+        return id(self)
+
+
 @dataclass
 class ClassIntrospection:
     cls: typing.Any
     attributes: OrderedDict
     annotations: OrderedDict
+    definitions: OrderedDict
+    interfaces: list
+    dataclass_fields: dict
 
+    @property
+    def props(self) -> typing.List[AttrDefinition]:
+        return [d for d in self.definitions.values() if not _is_func(d.value)]
 
-def inspect_class(cls):
-    return ClassIntrospection(
-        cls=cls,
-        attributes=OrderedDict(inspect.getmembers(cls)),
-        annotations=OrderedDict(get_annotations(cls)),
-    )
+    @property
+    def funcs(self) -> typing.List[AttrDefinition]:
+        return [d for d in self.definitions.values() if _is_func(d.value)]
 
 
-@dataclass
-class AttrDefinition:
-    name: str
-    annotation: typing.Any
-    value: typing.Any
-    type_: typing.Any
+# Introspection records are computed once per class
+_class_introspection_cache: "WeakKeyDictionary[typing.Any, ClassIntrospection]" = (
+    WeakKeyDictionary()
+)
 
-    def __hash__(self):
-        return id(self)
 
+def _is_func(value):
+    return inspect.isfunction(value) or inspect.ismethod(value)
 
-def get_attr_definitions(cls, only_props=False, only_funcs=False):
-    """Returns all attributes except magic methods"""
-    logger.debug(
-        "[INSPECT:%s] Collecting definitions for attributes.", cls.__qualname__
-    )
-    assert is_class(cls)
 
-    info = inspect_class(cls)
-    cls_attributes = info.attributes
-    cls_annotations = info.annotations
+def _get_class_attributes(cls):
+    """
+    Collects class attributes walking MRO over `__dict__`s.
+
+    Unlike `inspect.getmembers` it does not trigger descriptors
+    (except for static and class methods which are unwrapped).
+    """
+    attributes = OrderedDict()
+
+    for klass in reversed(cls.__mro__):
+        if klass is object:
+            continue
+
+        for name, value in vars(klass).items():
+            if isinstance(value, (staticmethod, classmethod)):
+                value = getattr(cls, name)
+            attributes[name] = value
 
-    all_attr_names = set(cls_attributes).union(set(cls_annotations))
+    return attributes
 
+
+def _get_attr_definitions(cls, attributes, annotations):
     graphql_fields = getattr(cls, "__graphql_fields__", MISSING)
     assert graphql_fields is MISSING or isinstance(graphql_fields, (tuple, list))
 
-    attrs = OrderedDict()
+    definitions = OrderedDict()
 
-    for attr in all_attr_names:
+    for attr in [*annotations, *(a for a in attributes if a not in annotations)]:
         # Skip all magic methods/attributes
         if attr.startswith("__") and attr.endswith("__"):
             continue
 
         logger.debug("[INSPECT:%s] Checking '%s' field.", cls.__qualname__, attr)
 
-        value = cls_attributes.get(attr, MISSING)
-        is_func = inspect.isfunction(value) or inspect.ismethod(value)
-
         if graphql_fields is not MISSING and attr not in graphql_fields:
             logger.debug(
                 "[INSPECT:%s] Skip '%s': should be in __graphql_fields__ list.",
@@ -115,20 +171,86 @@ def get_attr_definitions(cls, only_props=False, only_funcs=False):
             )
             continue
 
-        if only_props and is_func:
-            continue
-
-        elif only_funcs and not is_func:
-            continue
-
-        annotation = cls_annotations.get(attr, MISSING)
-        if annotation is MISSING and is_func:
+        value = attributes.get(attr, MISSING)
+        annotation = annotations.get(attr, MISSING)
+        if annotation is MISSING and _is_func(value):
             # getting annotation for returning func value
-            annotation = get_annotations(value).get("return", MISSING)
+            annotation = get_function_type_hints(value).get("return", MISSING)
 
         logger.debug("[INSPECT:%s] Added '%s' field.", cls.__qualname__, attr)
-        attrs[attr] = AttrDefinition(
+        definitions[attr] = AttrDefinition(
             name=attr, value=value, annotation=annotation, type_=annotation,
         )
 
-    return attrs
+    return definitions
+
+
+def _inspect_class(cls, annotations=None, definitions=None):
+    logger.debug("[INSPECT:%s] Collecting class information.", cls.__qualname__)
+
+    attributes = _get_class_attributes(cls)
+    if annotations is None:
+        annotations = OrderedDict(get_annotations(cls))
+    if definitions is None:
+        definitions = _get_attr_definitions(cls, attributes, annotations)
+
+    return ClassIntrospection(
+        cls=cls,
+        attributes=attributes,
+        annotations=annotations,
+        definitions=definitions,
+        interfaces=get_interfaces(cls),
+        dataclass_fields=(
+            {f.name: f for f in dataclass_fields(cls)} if is_dataclass(cls) else {}
+        ),
+    )
+
+
+def inspect_class(cls) -> ClassIntrospection:
+    """Returns (cached) introspection record for the class"""
+    assert is_class(cls)
+
+    try:
+        return _class_introspection_cache[cls]
+    except KeyError:
+        pass
+
+    info = _class_introspection_cache[cls] = _inspect_class(cls)
+    return info
+
+
+def restore_class_introspection(cls, annotations, definitions) -> ClassIntrospection:
+    """
+    Puts previously collected annotations and attribute definitions
+    (e.g. loaded from a snapshot) to the introspection cache.
+    """
+    info = _class_introspection_cache[cls] = _inspect_class(
+        cls, annotations=annotations, definitions=definitions
+    )
+    return info
+
+
+def iter_introspected_classes():
+    return list(_class_introspection_cache.values())
+
+
+def clear_class_introspection_cache(cls=None):
+    """Forgets introspected information (e.g. if a class was changed in runtime)"""
+    if cls is None:
+        _class_introspection_cache.clear()
+    else:
+        _class_introspection_cache.pop(cls, None)
+
+
+def get_attr_definitions(cls, only_props=False, only_funcs=False):
+    """Returns all attributes except magic methods"""
+    info = inspect_class(cls)
+
+    if only_props:
+        attrs = info.props
+    elif only_funcs:
+        attrs = info.funcs
+    else:
+        attrs = info.definitions.values()
+
+    return OrderedDict((attr.name, attr) for attr in attrs)
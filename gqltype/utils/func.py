@@ -1,5 +1,6 @@
 import inspect
 from typing import Any, Dict, List, NamedTuple, get_type_hints
+from weakref import WeakKeyDictionary
 
 PARAMS_DEFINITION_ATTR = "__graphql_params_definition__"
 OVERRIDE_OP = "override"
@@ -21,10 +22,43 @@ def _append_params_operation(fn, op, value):
     setattr(fn, PARAMS_DEFINITION_ATTR, params_ops)
 
 
-def inspect_function(fn, with_redefined_params: bool = True) -> ParamsDefinition:
-    if with_redefined_params and hasattr(fn, PARAMS_DEFINITION_ATTR):
-        return _calc_prams_definition(fn)
+# Introspection results are cached per function object
+_type_hints_cache: "WeakKeyDictionary[Any, Dict[str, Any]]" = WeakKeyDictionary()
+_params_definitions_cache: "WeakKeyDictionary[Any, ParamsDefinition]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_cached(cache, fn, calc):
+    try:
+        return cache[fn]
+    except KeyError:
+        pass
+    except TypeError:  # cannot be weakly referenced
+        return calc(fn)
+
+    ret = cache[fn] = calc(fn)
+    return ret
+
+
+def get_function_type_hints(fn) -> Dict[str, Any]:
+    """Returns (cached) type hints of a function"""
+    return _get_cached(_type_hints_cache, fn, get_type_hints)
+
+
+def iter_inspected_functions():
+    """Yields (fn, type_hints, params_definition) for every inspected function"""
+    for fn, type_hints in list(_type_hints_cache.items()):
+        yield fn, type_hints, _params_definitions_cache.get(fn)
 
+
+def restore_function_introspection(fn, type_hints, params_definition=None):
+    _type_hints_cache[fn] = type_hints
+    if params_definition is not None:
+        _params_definitions_cache[fn] = params_definition
+
+
+def _inspect_function_params(fn) -> ParamsDefinition:
     argspec = inspect.getfullargspec(fn)
     arguments = argspec.args + argspec.kwonlyargs
     defaults = dict(argspec.kwonlydefaults or {})
@@ -33,7 +67,14 @@ def inspect_function(fn, with_redefined_params: bool = True) -> ParamsDefinition
             dict(zip(argspec.args[-len(argspec.defaults) :], argspec.defaults))
         )
 
-    return (arguments, defaults, get_type_hints(fn))
+    return ParamsDefinition(arguments, defaults, get_function_type_hints(fn))
+
+
+def inspect_function(fn, with_redefined_params: bool = True) -> ParamsDefinition:
+    if with_redefined_params and hasattr(fn, PARAMS_DEFINITION_ATTR):
+        return _calc_prams_definition(fn)
+
+    return _get_cached(_params_definitions_cache, fn, _inspect_function_params)
 
 
 def merge_params_definitions(
@@ -1,24 +1,38 @@
+import asyncio
 from collections import namedtuple
+from collections.abc import Mapping
 from functools import partial, wraps
 import inspect
 import enum
+from operator import attrgetter, itemgetter, methodcaller
+from typing import Callable
+from weakref import WeakKeyDictionary
 
+import graphql
+
+from ..dataloader import get_loaders
+from ..decorators import is_batch_resolver
 from . import MISSING
 from .func import inspect_function
+from .type_resolver import TypeResolver
 
 _ResolveCallContext = namedtuple("ResolveCallContext", ["source", "info", "params"])
 
 
-def _wrap_resolver(fn, ctx):
+def _wrap_resolver(fn, ctx, source_param_names):
     spec = inspect.getfullargspec(fn)
     args = frozenset(spec.args + spec.kwonlyargs)
 
-    source_args = frozenset(name for name in ctx.source_param_names if name in args)
+    source_args = frozenset(name for name in source_param_names if name in args)
     info_args = frozenset(name for name in ctx.info_param_names if name in args)
     extra_args = {
         name: fn for name, fn in ctx.extra_special_params.items() if name in args
     }
 
+    if ctx.compile_resolver_wrappers:
+        params = _ResolverParams(fn, spec.args, source_args, info_args, extra_args)
+        return _compile_resolver(params)
+
     @wraps(fn)
     def wrap(source, info, **kwargs):
         if extra_args:
@@ -36,17 +50,96 @@ def _wrap_resolver(fn, ctx):
     return wrap
 
 
+_ResolverParams = namedtuple(
+    "ResolverParams", ["fn", "positional", "source_args", "info_args", "extra_args"]
+)
+
+# generated wrapper -> params it was generated with
+_compiled_resolvers: "WeakKeyDictionary[Callable, _ResolverParams]" = (
+    WeakKeyDictionary()
+)
+
+
+def _compile_resolver(params: _ResolverParams, value_converters=None):
+    """
+    Generates a resolver wrapper specialized for `params.fn`.
+
+    It has the same semantics as generic wrappers (`_wrap_resolver` and
+    `prepare_resolver_with_value_converters` applied together), but all
+    decisions are made at build time: special params are passed directly
+    (positionally when possible) and value converters are inlined, so a call
+    costs a single extra frame.
+    """
+    namespace = {"_fn": params.fn, "_CallContext": _ResolveCallContext}
+    body = []
+
+    for idx, (arg, converter) in enumerate((value_converters or {}).items()):
+        namespace[f"_convert_{idx}"] = converter
+        body.append(f"    if {arg!r} in kwargs:")
+        body.append(f"        kwargs[{arg!r}] = _convert_{idx}(kwargs[{arg!r}])")
+
+    special = {name: "source" for name in params.source_args}
+    special.update((name, "info") for name in params.info_args)
+    if params.extra_args:
+        body.append("    call_ctx = _CallContext(source, info, kwargs)")
+        for idx, (name, get_value) in enumerate(params.extra_args.items()):
+            namespace[f"_extra_{idx}"] = get_value
+            special[name] = f"_extra_{idx}(call_ctx)"
+
+    call_args = []
+    for name in params.positional:
+        if name not in special:
+            break
+        call_args.append(special.pop(name))
+    call_args.extend(f"{name}={value}" for name, value in special.items())
+    call_args.append("**kwargs")
+
+    body.append(f"    return _fn({', '.join(call_args)})")
+    code = "def wrap(source, info, **kwargs):\n" + "\n".join(body)
+    exec(code, namespace)
+
+    wrap = wraps(params.fn)(namespace["wrap"])
+    _compiled_resolvers[wrap] = params
+    return wrap
+
+
+def _get_field_getter(source_type, name):
+    """Returns the fastest way to read `name` from values of `source_type`"""
+    if source_type is dict:
+        return itemgetter(name)
+    if issubclass(source_type, Mapping):
+        return methodcaller("get", name)
+
+    fields = getattr(source_type, "_fields", None)  # NamedTuple
+    if issubclass(source_type, tuple) and fields and name in fields:
+        return itemgetter(fields.index(name))
+
+    # regular classes, dataclasses, classes with __slots__
+    return attrgetter(name)
+
+
 def prepare_default_field_resolver(ctx, name, definition):
     """Generate a field resolver when no resolvers were specified."""
-    if ctx.name_converter:
-        # if there's a name converter, try to access attributes via original names
-        def default_field_resolver(source, info, **args):
-            if isinstance(source, dict):
-                return source.get(name, None)
-            return getattr(source, name, None)
-
-    else:
-        default_field_resolver = None
+    if not ctx.name_converter or ctx.name_converter(name) == name:
+        # graphql-core's default resolver accesses values by field name,
+        # which is the same as the original name
+        return None, ()
+
+    # if there's a name converter, access values via original names
+    # (a getter is chosen once per type of source values)
+    getters = {}
+
+    def default_field_resolver(source, info, **args):
+        try:
+            getter = getters[source.__class__]
+        except KeyError:
+            source_type = source.__class__
+            getter = getters[source_type] = _get_field_getter(source_type, name)
+
+        try:
+            return getter(source)
+        except (AttributeError, KeyError):
+            return None
 
     return default_field_resolver, ()
 
@@ -68,12 +161,16 @@ def prepare_field_resolver(ctx, name, definition, fn):
         return ctx.hook__prepare_default_field_resolver(name, definition)
 
     arguments, defaults, annotations = inspect_function(fn)
+    is_batch = is_batch_resolver(fn)
+    source_param_names = (
+        ctx.batch_source_param_names if is_batch else ctx.source_param_names
+    )
 
     if ctx.preprocess_resolver_params:
-        fn = _wrap_resolver(fn, ctx)
+        fn = _wrap_resolver(fn, ctx, source_param_names)
 
         special_args = (
-            tuple(ctx.source_param_names)
+            tuple(source_param_names)
             + tuple(ctx.info_param_names)
             + tuple(ctx.extra_special_params)
         )
@@ -84,6 +181,9 @@ def prepare_field_resolver(ctx, name, definition, fn):
         # Consider first two args as `source` and `info`
         arguments = arguments[2:]
 
+    if is_batch:
+        fn = _prepare_batch_resolver(fn)
+
     fn_arguments = [
         (arg_name, annotations.get(arg_name, MISSING), defaults.get(arg_name, MISSING))
         for arg_name in arguments
@@ -92,6 +192,56 @@ def prepare_field_resolver(ctx, name, definition, fn):
     return fn, fn_arguments
 
 
+def _prepare_batch_resolver(fn):
+    """
+    Turns a batch resolver into a field resolver.
+
+    Values of the field requested during an event loop tick are enqueued
+    to a per-request loader (see `gqltype.dataloader`) and resolved with
+    a single call per field node of an execution, i.e. per execution level.
+    """
+
+    async def load_field_node(items):
+        _, info, kwargs = items[0]
+        values = fn([source for source, _, _ in items], info, **kwargs)
+        if inspect.isawaitable(values):
+            values = await values
+        values = list(values)
+        if len(values) != len(items):
+            raise ValueError(
+                f"Batch resolver must return a list of the same length as "
+                f"the sources: {len(items)} sources, {len(values)} values."
+            )
+        return values
+
+    async def load(items):
+        # the same field can be requested at different levels within a tick,
+        # operations sharing loaders (e.g. batched ones) can have the same document,
+        # variable values (and so arguments) are distinct per execution
+        field_nodes = {}
+        for item in items:
+            info = item[1]
+            key = (id(info.field_nodes[0]), id(info.variable_values))
+            field_nodes.setdefault(key, []).append(item)
+
+        values = {}
+        results = await asyncio.gather(
+            *map(load_field_node, field_nodes.values()), return_exceptions=True
+        )
+        for field_items, result in zip(field_nodes.values(), results):
+            if isinstance(result, Exception):
+                result = [result] * len(field_items)
+            values.update(zip(map(id, field_items), result))
+        return [values[id(item)] for item in items]
+
+    @wraps(fn)
+    def resolve(source, info, **kwargs):
+        loader = get_loaders(info.context).get(load, cache=False)
+        return loader.load((source, info, kwargs))
+
+    return resolve
+
+
 def prepare_resolver_param_value_converter(
     ctx, resolve_fn, arg_name, arg_default, arg_python_type, arg_gql_type
 ):
@@ -113,6 +263,15 @@ def prepare_resolver_with_value_converters(ctx, resolve_fn, arguments):
             if value_converter:
                 value_converters[arg_name] = value_converter
 
+    if value_converters and ctx.compile_resolver_wrappers:
+        params = _compiled_resolvers.get(resolve_fn)
+        if params is None:
+            # a custom resolver: pass `source` and `info` positionally as is
+            params = _ResolverParams(
+                resolve_fn, ("source", "info"), {"source"}, {"info"}, {}
+            )
+        return _compile_resolver(params, value_converters)
+
     if value_converters:
         _resolve_fn = resolve_fn
 
@@ -128,64 +287,61 @@ def prepare_resolver_with_value_converters(ctx, resolve_fn, arguments):
     return resolve_fn
 
 
-def prepare_union_type_resolver(ctx, type_resolver, name, types_map):
+def _prepare_type_resolver(ctx, types_map):
+    return TypeResolver(
+        types_map,
+        discriminator=ctx.type_discriminator,
+        transform=lambda t: ctx.transformer.transform(t, allow_null=True),
+    )
+
+
+def _wrap_type_resolver(type_resolver, types_resolver):
     @wraps(type_resolver)
-    def wrap(value, info, union_type):
-        ret_type = type_resolver(value, info, union_type)
-        if ret_type in types_map:
-            return types_map[ret_type]
-        return ret_type
+    def wrap(value, info, abstract_type):
+        ret_type = type_resolver(value, info, abstract_type)
+        return types_resolver.resolve_class(ret_type) or ret_type
 
     return wrap
 
 
-def prepare_default_union_type_resolver(ctx, name, types_map):
-    def type_resolver(value, info, union_type):
-        val_type = type(value)
-        return types_map[val_type]
+def prepare_union_type_resolver(ctx, type_resolver, name, types_map):
+    return _wrap_type_resolver(type_resolver, _prepare_type_resolver(ctx, types_map))
+
 
-    return type_resolver
+def prepare_default_union_type_resolver(ctx, name, types_map):
+    return _prepare_type_resolver(ctx, types_map)
 
 
 def _get_interface_implementations_types_map(ctx, cls):
-    interface_implementations = []
-
-    implementations = list(cls.__subclasses__())
-    while implementations:
-        _cls = implementations.pop()
-        _cls_impls = _cls.__subclasses__()
-        if not _cls_impls:
-            interface_implementations.append(_cls)
-        else:
-            implementations.extend(_cls_impls)
+    subclass_index = ctx.transformer.subclass_index
+
+    if ctx.restrict_implementations_to_schema:
+        # only implementations which have been transformed for the schema
+        # (values of other subclasses are resolved to their closest base class)
+        implementations = subclass_index.get_implementations(cls, leaves_only=False)
+        types_cache = ctx.transformer.types_cache
+        types_map = {impl: types_cache.get(impl) for impl in implementations}
+        return {
+            impl: gql_t
+            for impl, gql_t in types_map.items()
+            if graphql.is_object_type(gql_t)
+        }
 
     return {
         impl: ctx.transformer.transform(impl, allow_null=True)
-        for impl in interface_implementations
+        for impl in subclass_index.get_implementations(cls)
     }
 
 
 def prepare_interface_type_resolver(ctx, type_resolver, cls):
-    types_map = _get_interface_implementations_types_map(ctx, cls)
-
-    @wraps(type_resolver)
-    def wrap(value, info, union_type):
-        ret_type = type_resolver(value, info, union_type)
-        if ret_type in types_map:
-            return types_map[ret_type]
-        return ret_type
-
-    return wrap
+    # implementations are discovered on the first type resolution
+    types_map = partial(_get_interface_implementations_types_map, ctx, cls)
+    return _wrap_type_resolver(type_resolver, _prepare_type_resolver(ctx, types_map))
 
 
 def prepare_default_interface_type_resolver(ctx, cls):
-    types_map = _get_interface_implementations_types_map(ctx, cls)
-
-    def type_resolver(value, info, interface_type):
-        val_type = type(value)
-        return types_map[val_type]
-
-    return type_resolver
+    types_map = partial(_get_interface_implementations_types_map, ctx, cls)
+    return _prepare_type_resolver(ctx, types_map)
 
 
 def prepare_input_object_type_out_type(ctx, cls):
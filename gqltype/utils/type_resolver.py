@@ -0,0 +1,155 @@
+"""
+Resolution of runtime types of union and interface values.
+
+A python value is resolved to a graphql object type:
+- by its class: the first class in MRO which is a member of the union (or
+  an implementation of the interface), so subclasses and proxies (objects
+  overriding `__class__`) are resolved as well;
+- by a discriminator, for values which classes are unknown (e.g. dicts).
+  The discriminator extracts a tag from the value, which is looked up
+  among names of graphql types, names of python types and explicitly
+  defined tags.
+
+The resolution path is chosen once per concrete class of values, so
+resolving a value costs a dict lookup and a call.
+
+    schema = gqltype.Schema(
+        queries=[...],
+        type_discriminator=by_id_prefix({"people": Person, "planets": Planet}),
+    )
+"""
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional, Union
+
+from .types import get_name
+
+Discriminator = namedtuple("Discriminator", ["get_tag", "tags"])
+
+
+def by_key(key: str = "__typename", tags: Optional[Dict[Any, Any]] = None):
+    """Takes the tag from `value[key]` of mappings"""
+
+    def get_tag(value):
+        if isinstance(value, Mapping):
+            return value.get(key)
+        return None
+
+    return Discriminator(get_tag, tags or {})
+
+
+def by_attribute(name: str, tags: Optional[Dict[Any, Any]] = None):
+    """Takes the tag from `value.<name>` (or `value[name]` of mappings)"""
+
+    def get_tag(value):
+        if isinstance(value, Mapping):
+            return value.get(name)
+        return getattr(value, name, None)
+
+    return Discriminator(get_tag, tags or {})
+
+
+def by_id_prefix(tags: Dict[str, Any], key: str = "id", separator: str = ":"):
+    """Takes the tag from a prefix of ids, e.g. "people" of "people:1" """
+    get_id = by_attribute(key).get_tag
+
+    def get_tag(value):
+        id_ = get_id(value)
+        if not isinstance(id_, str):
+            return None
+        return id_.partition(separator)[0]
+
+    return Discriminator(get_tag, tags)
+
+
+def _constant(value) -> Callable[[Any], Any]:
+    return lambda _: value
+
+
+class TypeResolver:
+    """
+    `resolve_type` function for unions and interfaces.
+
+    `types_map` maps python types to graphql types (it can be a function
+    returning the mapping, then it's called on the first resolution),
+    `transform` is used for python types defined by discriminator tags which
+    are not in `types_map`.
+    """
+
+    def __init__(
+        self,
+        types_map: Union[Dict[Any, Any], Callable[[], Dict[Any, Any]]],
+        discriminator: Optional[Discriminator] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+    ):
+        self._types_map = types_map
+        self.discriminator = discriminator
+        self.transform = transform
+
+        self._classes: Dict[type, Any] = {}
+        self._resolvers: Dict[type, Callable[[Any], Any]] = {}
+        self._tags: Optional[Dict[Any, Any]] = None
+
+    @property
+    def types_map(self) -> Dict[Any, Any]:
+        if callable(self._types_map):
+            self._types_map = self._types_map()
+        return self._types_map
+
+    def __call__(self, value, info, abstract_type):
+        try:
+            resolve = self._resolvers[value.__class__]
+        except KeyError:
+            cls = value.__class__
+            resolve = self._resolvers[cls] = self._prepare_resolver(cls)
+        return resolve(value)
+
+    def resolve_class(self, cls):
+        """Returns graphql type of the class (or of its closest base class)"""
+        try:
+            return self._classes[cls]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable, e.g. a graphql type name
+            return None
+
+        gql_t = None
+        for base in getattr(cls, "__mro__", (cls,)):
+            gql_t = self.types_map.get(base)
+            if gql_t is not None:
+                break
+
+        self._classes[cls] = gql_t
+        return gql_t
+
+    def _prepare_resolver(self, cls):
+        gql_t = self.resolve_class(cls)
+        if gql_t is not None or self.discriminator is None:
+            return _constant(gql_t)
+
+        tags = self._get_tags()
+        get_tag = self.discriminator.get_tag
+
+        def resolve_by_tag(value):
+            try:
+                return tags.get(get_tag(value))
+            except TypeError:  # unhashable tag
+                return None
+
+        return resolve_by_tag
+
+    def _get_tags(self):
+        if self._tags is None:
+            tags = {}
+            for py_t, gql_t in self.types_map.items():
+                tags[get_name(py_t)] = gql_t
+                tags[gql_t.name] = gql_t
+
+            for tag, t in self.discriminator.tags.items():
+                gql_t = self.resolve_class(t)
+                if gql_t is None and self.transform is not None:
+                    gql_t = self.transform(t)
+                tags[tag] = gql_t
+
+            self._tags = tags
+        return self._tags
@@ -17,15 +17,27 @@ class UnwrappedType:
 NoneType = type(None)
 
 MISSING = type(
-    "MISSING", (), {"__repr__": lambda o: "<MISSING>", "__bool__": lambda o: False}
+    "MISSING",
+    (),
+    {
+        "__repr__": lambda o: "<MISSING>",
+        "__bool__": lambda o: False,
+        # pickled by reference, so it stays a singleton
+        "__reduce__": lambda o: "MISSING",
+    },
 )()
 
 
 def cache_type(func):
     def wrap(obj, ctx):
         cache = ctx["types_cache"]
+        stats = ctx.get("build_stats")
         if obj in cache:
+            if stats is not None:
+                stats.cache_hit(func.__name__)
             return cache[obj]
+        if stats is not None:
+            stats.cache_miss(func.__name__)
         ret = cache[obj] = func(obj, ctx)
         return ret
 
@@ -46,21 +58,25 @@ def get_doc(obj):
 
 def is_typing_type(t):
     """Checks if it's something from `typing` module"""
-    return inspect.getmodule(t) is typing
+    return getattr(t, "__module__", None) == "typing"
 
 
 def filter_out_none_type(types_):
     return [t for t in types_ if t is not NoneType]
 
 
+_VARARGS_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
 def resolve_thunk(type_):
     if isinstance(type_, LambdaType):
-        spec = inspect.getfullargspec(type_)
+        # Check the code object directly: it's much cheaper than building
+        # a full argspec for every function passed through the transformer.
+        code = type_.__code__
         if (
-            spec.args == []
-            and spec.kwonlyargs == []
-            and spec.varkw is None
-            and spec.varargs is None
+            code.co_argcount == 0
+            and code.co_kwonlyargcount == 0
+            and not code.co_flags & _VARARGS_FLAGS
         ):
             type_ = type_()
     return type_
@@ -0,0 +1,289 @@
+"""
+Schema variants.
+
+Several `GraphQLSchema`s (e.g. public and internal ones) can be derived from one
+`gqltype.Schema`. Variants share the schema's transformer, so every type is
+transformed once, and types which are not affected by variant's filters are
+shared between all variants (only filtered types and types referencing them
+are copied).
+
+    schema = gqltype.Schema(queries=[...], types=[...])
+
+    public = schema.variant(
+        queries=[get_person, get_planet],
+        field_filter=lambda type_, name, field: not (field.extensions or {}).get(
+            "internal"
+        ),
+    ).build()
+    internal = schema.variant().build()
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import graphql
+from graphql import (
+    GraphQLField,
+    GraphQLArgument,
+    GraphQLInputField,
+    GraphQLInputObjectType,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLUnionType,
+)
+
+TypeFilter = Callable[[GraphQLNamedType], bool]
+FieldFilter = Callable[[GraphQLNamedType, str, object], bool]
+
+
+class SchemaVariant:
+    """
+    A variant of `gqltype.Schema` with its own root objects and filters.
+
+    - `queries`, `mutations`, `subscriptions`, `types` default to objects
+      registered in the schema;
+    - `type_filter(gql_type)` excludes named types (and fields referencing them);
+    - `field_filter(gql_type, field_name, field)` excludes fields of object,
+      interface and input types.
+    """
+
+    def __init__(
+        self,
+        schema,
+        queries=None,
+        mutations=None,
+        subscriptions=None,
+        types=None,
+        type_filter: Optional[TypeFilter] = None,
+        field_filter: Optional[FieldFilter] = None,
+    ):
+        self.schema = schema
+        self._queries = queries
+        self._mutations = mutations
+        self._subscriptions = subscriptions
+        self._types = types
+        self.type_filter = type_filter
+        self.field_filter = field_filter
+        self._root_types = {}
+
+    def build(self) -> graphql.GraphQLSchema:
+        schema = self.schema
+
+        def _or_default(objs, default):
+            return default if objs is None else objs
+
+        return schema._build_schema(
+            queries=_or_default(self._queries, schema._queries),
+            mutations=_or_default(self._mutations, schema._mutations),
+            subscriptions=_or_default(self._subscriptions, schema._subscriptions),
+            types=_or_default(self._types, schema._types),
+            root_types=self._root_types,
+            types_filter=(
+                TypesFilter(self.type_filter, self.field_filter)
+                if self.type_filter or self.field_filter
+                else None
+            ),
+        )
+
+
+def _named(t) -> GraphQLNamedType:
+    return graphql.get_named_type(t)
+
+
+def _is_builtin(t) -> bool:
+    return graphql.is_introspection_type(t) or graphql.is_specified_scalar_type(t)
+
+
+def _get_references(t) -> Iterable[GraphQLNamedType]:
+    """Named types referenced by a named type"""
+    if isinstance(t, (GraphQLObjectType, GraphQLInterfaceType)):
+        for field in t.fields.values():
+            yield _named(field.type)
+            for arg in field.args.values():
+                yield _named(arg.type)
+        yield from getattr(t, "interfaces", ())
+    elif isinstance(t, GraphQLUnionType):
+        yield from t.types
+    elif isinstance(t, GraphQLInputObjectType):
+        for field in t.fields.values():
+            yield _named(field.type)
+
+
+class TypesFilter:
+    """
+    Applies filters to a graph of graphql types.
+
+    Filtered types are copied, as well as all types referencing them (directly or
+    not), everything else stays shared with the original types.
+    """
+
+    def __init__(
+        self,
+        type_filter: Optional[TypeFilter] = None,
+        field_filter: Optional[FieldFilter] = None,
+    ):
+        self.type_filter = type_filter
+        self.field_filter = field_filter
+
+    def prepare(self, types: List[GraphQLNamedType], roots=()) -> None:
+        """
+        Calculates which of types (and types reachable from them) are filtered.
+
+        Types listed in `roots` are never excluded by `type_filter`.
+        """
+        reachable = self._collect(types)
+        root_names = {t.name for t in roots}
+
+        self._excluded: Set[str] = {
+            name
+            for name, t in reachable.items()
+            if name not in root_names
+            and not _is_builtin(t)
+            and self.type_filter is not None
+            and not self.type_filter(t)
+        }
+        self._kept: Dict[str, dict] = {}
+        self._calc_kept(reachable, root_names)
+        self._changed = self._calc_changed(reachable)
+        self._copies: Dict[str, GraphQLNamedType] = {}
+
+    def is_excluded(self, t: GraphQLNamedType) -> bool:
+        return t.name in self._excluded
+
+    def map(self, t: Optional[GraphQLNamedType]) -> Optional[GraphQLNamedType]:
+        """Returns filtered version of the type (`None` if it is excluded)"""
+        if t is None or self.is_excluded(t):
+            return None
+        return self._map_named(t)
+
+    def _collect(self, types) -> Dict[str, GraphQLNamedType]:
+        reachable = {}
+        stack = list(types)
+        while stack:
+            t = stack.pop()
+            if t.name in reachable:
+                continue
+            reachable[t.name] = t
+            stack.extend(_get_references(t))
+        return reachable
+
+    def _keep_field(self, t, name, field) -> bool:
+        if _named(field.type).name in self._excluded:
+            return False
+        args = getattr(field, "args", None) or {}
+        if any(_named(arg.type).name in self._excluded for arg in args.values()):
+            return False
+        return self.field_filter is None or self.field_filter(t, name, field)
+
+    def _calc_kept(self, reachable, root_names):
+        """Calculates kept fields/members, excluding types which become empty"""
+        changed = True
+        while changed:
+            changed = False
+            for name, t in reachable.items():
+                if name in self._excluded:
+                    continue
+
+                if isinstance(
+                    t, (GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType)
+                ):
+                    kept = {
+                        field_name: field
+                        for field_name, field in t.fields.items()
+                        if self._keep_field(t, field_name, field)
+                    }
+                elif isinstance(t, GraphQLUnionType):
+                    kept = [m for m in t.types if m.name not in self._excluded]
+                else:
+                    continue
+
+                if not kept and name not in root_names:
+                    self._excluded.add(name)
+                    changed = True
+                self._kept[name] = kept
+
+    def _calc_changed(self, reachable) -> Set[str]:
+        changed = set()
+        for name, t in reachable.items():
+            if name in self._excluded or name not in self._kept:
+                continue
+            members = t.types if isinstance(t, GraphQLUnionType) else t.fields
+            interfaces = getattr(t, "interfaces", ())
+            if len(self._kept[name]) != len(members) or any(
+                i.name in self._excluded for i in interfaces
+            ):
+                changed.add(name)
+
+        # types referencing changed types have to be copied as well
+        referrers: Dict[str, Set[str]] = {}
+        for name, t in reachable.items():
+            for ref in _get_references(t):
+                referrers.setdefault(ref.name, set()).add(name)
+
+        stack = list(changed)
+        while stack:
+            for name in referrers.get(stack.pop(), ()):
+                if name not in changed and name not in self._excluded:
+                    changed.add(name)
+                    stack.append(name)
+
+        return changed
+
+    def _map_type(self, t):
+        if isinstance(t, GraphQLNonNull):
+            of_type = self._map_type(t.of_type)
+            return t if of_type is t.of_type else GraphQLNonNull(of_type)
+        if isinstance(t, GraphQLList):
+            of_type = self._map_type(t.of_type)
+            return t if of_type is t.of_type else GraphQLList(of_type)
+        return self._map_named(t)
+
+    def _map_named(self, t):
+        if t.name not in self._changed:
+            return t
+
+        copy = self._copies.get(t.name)
+        if copy is None:
+            copy = self._copies[t.name] = self._copy(t)
+        return copy
+
+    def _copy(self, t):
+        kw = t.to_kwargs()
+        kept = self._kept[t.name]
+
+        if isinstance(t, (GraphQLObjectType, GraphQLInterfaceType)):
+            kw["fields"] = lambda: {
+                name: self._copy_field(field) for name, field in kept.items()
+            }
+            if "interfaces" in kw:
+                kw["interfaces"] = lambda: [
+                    self._map_named(i)
+                    for i in t.interfaces
+                    if i.name not in self._excluded
+                ]
+        elif isinstance(t, GraphQLUnionType):
+            kw["types"] = lambda: [self._map_named(m) for m in kept]
+        elif isinstance(t, GraphQLInputObjectType):
+            kw["fields"] = lambda: {
+                name: GraphQLInputField(
+                    **{**field.to_kwargs(), "type_": self._map_type(field.type)}
+                )
+                for name, field in kept.items()
+            }
+
+        return t.__class__(**kw)
+
+    def _copy_field(self, field):
+        return GraphQLField(
+            **{
+                **field.to_kwargs(),
+                "type_": self._map_type(field.type),
+                "args": {
+                    name: GraphQLArgument(
+                        **{**arg.to_kwargs(), "type_": self._map_type(arg.type)}
+                    )
+                    for name, arg in field.args.items()
+                },
+            }
+        )
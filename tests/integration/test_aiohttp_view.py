@@ -0,0 +1,155 @@
+import asyncio
+import json
+
+from tests.utils import *
+from gqltype import Schema
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from gqltype.contrib.aiohttp import init_graphql
+from gqltype.contrib.aiohttp.view import json_response
+
+
+USED_LOADERS = []
+
+
+def hello(name: str = "World", loaders=None) -> str:
+    USED_LOADERS.append(loaders)
+    return f"Hello, {name}!"
+
+
+def whoami(info) -> Optional[str]:
+    return info.context.get("user")
+
+
+def _request(method, params=None, data=None, **options):
+    """Sends a request to an app with the schema, returns status and JSON data"""
+
+    async def main():
+        app = web.Application()
+        init_graphql(app, Schema(queries=[hello, whoami]), **options)
+        async with TestClient(TestServer(app)) as client:
+            response = await client.request(
+                method,
+                "/graphql",
+                params=params,
+                json=data,
+                headers={"Accept": "application/json"},
+            )
+            text = await response.text()
+            try:
+                return response.status, json.loads(text)
+            except ValueError:
+                return response.status, text
+
+    return asyncio.run(main())
+
+
+def test_get_requests_with_invalid_variables_are_rejected():
+    query = "query($n: String) { hello(name: $n) }"
+    status, data = _request("GET", params={"query": query, "variables": "{"})
+    assert (status, data) == (400, "Invalid JSON")
+
+    status, data = _request(
+        "GET",
+        params={"query": query, "variables": '{"n": "A"}'},
+    )
+    assert (status, data) == (200, {"data": {"hello": "Hello, A!"}})
+
+
+def test_batched_operations_share_request_context():
+    USED_LOADERS.clear()
+    status, data = _request(
+        "POST",
+        data=[
+            {"query": '{ hello(name: "A") }'},
+            {
+                "query": "query($n: String) { hello(name: $n) }",
+                "variables": {"n": "B"},
+            },
+            {"query": "{ unknown }"},
+            {"variables": {}},
+            1,
+            {"query": ["x"]},
+            {"query": "{ hello }", "variables": "oops"},
+        ],
+    )
+
+    assert status == 200
+    assert data[:2] == [
+        {"data": {"hello": "Hello, A!"}},
+        {"data": {"hello": "Hello, B!"}},
+    ]
+    assert "unknown" in data[2]["errors"][0]["message"]
+    # invalid operations have errors in their results, the batch status is 200
+    no_query = {"errors": [{"message": "No GraphQL query found in the operation"}]}
+    assert data[3:5] == [no_query, no_query]
+    assert data[5:] == [
+        {"errors": [{"message": "Query must be a string"}]},
+        {"errors": [{"message": "Variables must be an object"}]},
+    ]
+    assert len(USED_LOADERS) == 2
+    assert USED_LOADERS[0] is USED_LOADERS[1] is not None
+
+
+@pytest.mark.parametrize(
+    "operations, max_batch_size, message",
+    [
+        ([], 2, "Batch must contain from 1 to 2 operations"),
+        (
+            [{"query": "{ hello }"}] * 3,
+            2,
+            "Batch must contain from 1 to 2 operations",
+        ),
+        ([{"query": "{ hello }"}], 0, "Batched operations are not supported"),
+    ],
+)
+def test_batches_are_limited(operations, max_batch_size, message):
+    status, data = _request("POST", data=operations, max_batch_size=max_batch_size)
+
+    assert (status, data) == (400, {"errors": [{"message": message}]})
+
+
+def test_responses_are_streamed():
+    async def unencodable(request):
+        data = {"data": {"value": object()}}
+        return await json_response(request, request.app["graphql_json_codec"], data)
+
+    async def main():
+        app = web.Application()
+        init_graphql(
+            app, Schema(queries=[hello]), max_batch_size=200, stream_chunk_size=256
+        )
+        app.router.add_get("/unencodable", unencodable)
+        async with TestClient(TestServer(app)) as client:
+            operations = [{"query": f'{{ hello(name: "{i}") }}'} for i in range(150)]
+            response = await client.post("/graphql", json=operations)
+            assert response.status == 200
+            assert response.headers["Transfer-Encoding"] == "chunked"
+            assert await response.json() == [
+                {"data": {"hello": f"Hello, {i}!"}} for i in range(150)
+            ]
+
+            # encoding errors are raised before the response is started
+            response = await client.get("/unencodable")
+            assert response.status == 500
+
+    asyncio.run(main())
+
+
+def test_user_is_set_to_the_context():
+    assert _request("POST", data={"query": "{ whoami }"}) == (
+        200,
+        {"data": {"whoami": None}},
+    )
+
+    def get_user(request):
+        return request.headers["Accept"]
+
+    assert _request("POST", data={"query": "{ whoami }"}, get_user=get_user) == (
+        200,
+        {"data": {"whoami": "application/json"}},
+    )
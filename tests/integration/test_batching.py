@@ -0,0 +1,73 @@
+import json
+
+from tests.utils import *
+from gqltype import Schema
+
+pytest.importorskip("starlette")
+
+from gqltype.contrib.starlette import GraphQLApp
+
+
+def _post(app, data):
+    status, _headers, body = call_asgi(
+        app,
+        body=json.dumps(data).encode(),
+        headers=[("content-type", "application/json")],
+    )
+    return status, json.loads(b"".join(body))
+
+
+def test_batched_operations_share_request_context():
+    used_loaders = []
+
+    def hello(name: str, loaders) -> str:
+        used_loaders.append(loaders)
+        return f"Hello, {name}!"
+
+    app = GraphQLApp(Schema(queries=[hello]), max_batch_size=3)
+
+    status, data = _post(
+        app,
+        [
+            {"query": '{ hello(name: "A") }'},
+            {
+                "query": "query($n: String!) { hello(name: $n) }",
+                "variables": {"n": "B"},
+            },
+            {"query": "{ unknown }"},
+        ],
+    )
+    assert status == 200
+    assert data[0] == {"data": {"hello": "Hello, A!"}}
+    assert data[1] == {"data": {"hello": "Hello, B!"}}
+    assert data[2]["data"] is None
+    assert "unknown" in data[2]["errors"][0]["message"]
+    assert used_loaders[0] is used_loaders[1]
+
+    status, data = _post(app, [{"variables": {}}])
+    assert (status, data) == (
+        200,
+        [{"errors": [{"message": "No GraphQL query found in the operation"}]}],
+    )
+
+    # operations with values of invalid types fail on their own
+    status, data = _post(
+        app,
+        [
+            {"query": '{ hello(name: "A") }'},
+            {"query": ["x"]},
+            {"query": '{ hello(name: "A") }', "variables": "oops"},
+        ],
+    )
+    assert status == 200
+    assert data == [
+        {"data": {"hello": "Hello, A!"}},
+        {"errors": [{"message": "Query must be a string"}]},
+        {"errors": [{"message": "Variables must be an object"}]},
+    ]
+
+    status, data = _post(app, [{"query": '{ hello(name: "A") }'}] * 4)
+    assert status == 400
+    assert data == {
+        "errors": [{"message": "Batch must contain from 1 to 3 operations"}]
+    }
@@ -0,0 +1,251 @@
+import asyncio
+
+from tests.utils import *
+from gqltype import Schema, batch_resolver
+from gqltype.execution import (
+    DocumentCache,
+    ExecutionContext,
+    execute_query,
+    get_compiled_query,
+)
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class Planet:
+    name: str
+    population: Optional[int]
+
+
+@dataclass
+class Person:
+    name: str
+    color: Color
+    homeworld: Optional[Planet]
+    tags: List[str]
+
+    def resolve_greeting(self, greeting: str = "Hello") -> str:
+        return f"{greeting}, {self.name}!"
+
+    def resolve_broken(self) -> Optional[str]:
+        raise ValueError("broken")
+
+    def resolve_required(self) -> str:
+        return None
+
+    def resolve_scores(self) -> List[Optional[int]]:
+        return [1, "x", 3]
+
+    async def resolve_slow(self) -> str:
+        return self.name
+
+    def resolve_loaded(self, loaders) -> str:
+        return loaders[_load_names].load(self.name)
+
+    @batch_resolver
+    def resolve_initial(sources) -> List[str]:
+        return [person.name[0] for person in sources]
+
+
+async def _load_names(names):
+    return [name.upper() for name in names]
+
+
+@dataclass
+class Cat:
+    name: str
+
+
+def people(first: int = 10) -> List[Person]:
+    tatooine = Planet(name="Tatooine", population=200000)
+    return [
+        Person(name="Luke", color=Color.GREEN, homeworld=tatooine, tags=["jedi"]),
+        Person(name="Leia", color=Color.RED, homeworld=None, tags=[]),
+    ][:first]
+
+
+def required_people() -> List[Person]:
+    return people()
+
+
+def pets() -> List[Union[Person, Cat]]:
+    return [Cat(name="Tom")]
+
+
+SCHEMA = Schema(queries=[people, required_people, pets]).build()
+
+
+def _execute(query, compiled, **kw):
+    return asyncio.run(
+        execute_query(
+            SCHEMA, query, document_cache=DocumentCache(), compiled=compiled, **kw
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "query, variables",
+    [
+        ("{ people { name color tags homeworld { name population } } }", None),
+        (
+            """
+            query($first: Int!, $greeting: String!) {
+                people(first: $first) {
+                    __typename
+                    hi: greeting(greeting: $greeting)
+                    greeting
+                    ...PersonName
+                    ... on Person { homeworld { name } }
+                    homeworld { population }
+                }
+            }
+            fragment PersonName on Person { name }
+            """,
+            {"first": 1, "greeting": "Hi"},
+        ),
+        ("{ people { name broken scores } }", None),
+        ("{ people { name required } }", None),
+        ("{ requiredPeople { required } }", None),
+        ("query($first: Int!) { people(first: $first) { name } }", {"first": "x"}),
+    ],
+)
+def test_compiled_queries_are_executed_as_by_graphql_core(query, variables):
+    expected = asyncio.run(
+        graphql.graphql(
+            SCHEMA,
+            query,
+            variable_values=variables,
+            execution_context_class=ExecutionContext,
+        )
+    )
+    document = graphql.parse(query)
+    assert get_compiled_query(SCHEMA, document) is not None
+
+    result = _execute(query, compiled=True, variable_values=variables)
+
+    assert result.data == expected.data
+    assert sorted(e.formatted["path"] or [] for e in result.errors or ()) == sorted(
+        e.formatted["path"] or [] for e in expected.errors or ()
+    )
+    assert sorted(e.message for e in result.errors or ()) == sorted(
+        e.message for e in expected.errors or ()
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ people { slow } }",
+        "{ people { loaded } }",
+        "{ people { initial } }",
+        "{ pets { ... on Cat { name } } }",
+        "{ people { name @include(if: true) } }",
+        "{ __schema { queryType { name } } }",
+        "mutation { noop }",
+    ],
+)
+def test_unsupported_queries_are_not_compiled(query):
+    document = graphql.parse(query)
+    assert get_compiled_query(SCHEMA, document) is None
+
+
+def test_not_compiled_queries_are_executed_by_graphql_core():
+    result = _execute("{ people { slow } }", compiled=True)
+
+    assert result.errors is None
+    assert result.data == {"people": [{"slow": "Luke"}, {"slow": "Leia"}]}
+
+
+def test_compiled_queries_are_cached_with_parsed_documents():
+    query = "{ people { name } }"
+    document_cache = DocumentCache()
+    asyncio.run(
+        execute_query(SCHEMA, query, document_cache=document_cache, compiled=True)
+    )
+
+    parsed = document_cache.get(SCHEMA, query)
+    compiled_query = parsed.compiled_queries[None]
+    assert compiled_query is not None
+    assert not hasattr(parsed.document, "_gqltype_compiled_queries")
+    cached = get_compiled_query(
+        SCHEMA, parsed.document, compiled_queries=parsed.compiled_queries
+    )
+    assert cached is compiled_query
+
+
+def test_resolvers_are_not_called_again_for_unexpected_awaitables():
+    calls = []
+
+    async def get_name():
+        return "Luke"
+
+    @dataclass
+    class Hidden:
+        def resolve_name(self) -> str:
+            calls.append("name")
+            return get_name()  # not detected as async when compiled
+
+    def hidden() -> Hidden:
+        calls.append("hidden")
+        return Hidden()
+
+    schema = Schema(queries=[hidden]).build()
+    document_cache = DocumentCache()
+
+    def execute():
+        query = "{ hidden { name } }"
+        return asyncio.run(
+            execute_query(schema, query, document_cache=document_cache, compiled=True)
+        )
+
+    result = execute()
+    assert calls == ["hidden", "name"]
+    assert result.data is None  # non-null fields
+    assert "returned an awaitable" in result.errors[0].message
+
+    # the plan is disabled, the query is executed by graphql-core
+    result = execute()
+    assert result.errors is None
+    assert result.data == {"hidden": {"name": "Luke"}}
+
+
+def test_mutable_arguments_are_not_shared_between_requests():
+    @dataclass
+    class Tagged:
+        def resolve_tags(self, tags: List[str]) -> List[str]:
+            tags.append("seen")
+            return tags
+
+    def tagged() -> List[Tagged]:
+        return [Tagged(), Tagged()]
+
+    schema = Schema(queries=[tagged]).build()
+    document_cache = DocumentCache()
+
+    for query, variables in (
+        ('{ tagged { tags(tags: ["a"]) } }', None),
+        ("query($t: [String!]!) { tagged { tags(tags: $t) } }", {"t": ["a"]}),
+    ):
+        assert get_compiled_query(schema, graphql.parse(query)) is not None
+        # values of variables are shared within an execution by graphql-core too
+        expected = asyncio.run(
+            execute_query(schema, query, variable_values=variables)
+        ).data
+        for _ in range(2):
+            result = asyncio.run(
+                execute_query(
+                    schema,
+                    query,
+                    document_cache=document_cache,
+                    variable_values=variables,
+                    compiled=True,
+                )
+            )
+            assert result.errors is None
+            assert result.data == expected
+
+    assert expected["tagged"][0] == {"tags": ["a", "seen"]}
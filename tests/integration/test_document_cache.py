@@ -0,0 +1,40 @@
+import asyncio
+
+from tests.utils import *
+from gqltype import Schema
+from gqltype.execution import DocumentCache, execute_query
+
+
+def test_documents_are_parsed_and_validated_once():
+    def hello(name: str) -> str:
+        return f"Hello, {name}!"
+
+    schema = Schema(queries=[hello]).build()
+    cache = DocumentCache(max_size=2)
+
+    def execute(query, **kw):
+        return asyncio.run(execute_query(schema, query, document_cache=cache, **kw))
+
+    query = "query($name: String!) { hello(name: $name) }"
+    for name in ("A", "B"):
+        result = execute(query, variable_values={"name": name})
+        assert result.errors is None
+        assert result.data == {"hello": f"Hello, {name}!"}
+
+    first_result = execute("{ hello }")
+    result = execute("{ hello }")
+    assert result.data is None
+    assert result.errors == first_result.errors
+    assert "argument 'name'" in result.errors[0].message
+
+    result = execute("{ hello(")
+    assert result.errors[0].message.startswith("Syntax Error")
+
+    for invalid_query in (["{ hello }"], 1):  # not cached
+        result = execute(invalid_query)
+        assert result.data is None
+        assert [e.message for e in result.errors] == ["Query must be a string"]
+
+    assert len(cache) == 2
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (2, 3, 1)
+    assert cache.stats.hit_rate == 0.4
@@ -0,0 +1,45 @@
+from tests.utils import *
+
+import gqltype
+from gqltype.profiling import BuildStats
+
+
+@dataclass
+class Planet:
+    name: str
+
+
+@dataclass
+class Person:
+    name: str
+    homeworld: Planet
+    friends: List["Person"]
+
+
+def get_people() -> List[Person]:
+    ...
+
+
+def test_build_profile():
+    schema = gqltype.Schema(queries=[get_people])
+    schema.build(profile=True)
+
+    stats = schema.build_stats
+    assert isinstance(stats, BuildStats)
+
+    person = f"{__name__}.Person"
+    assert stats.types[person].calls >= 2
+    assert stats.introspection[person].calls == 1
+    assert stats.transformations["gqltype.transform.transform_class"].calls >= 3
+    assert stats.cache_hits["types_cache"] >= 1
+    assert stats.cache_misses["_transform_class_to_output_type"] == 3
+    assert stats.context_clones > 0
+    assert {"build", "transform", "graphql schema"} <= set(stats.phases)
+
+    report = stats.report(limit=5)
+    assert "Types (top 5 by own)" in report
+    assert person in report
+
+    # profiling is switched off after the build
+    assert schema.transformer.stats is None
+    assert schema.transformer.ctx.build_stats is None
@@ -0,0 +1,129 @@
+import asyncio
+from time import perf_counter
+
+from tests.utils import *
+from gqltype import Schema, T
+from gqltype.contrib.connection import (
+    Connection,
+    prepare_connection_slice,
+    with_connection_pagination,
+)
+from gqltype.execution import ComplexityLimits, analyze_query, execute_query
+from gqltype.execution.complexity import FieldCost
+
+
+@dataclass
+class Planet:
+    name: str
+
+
+@dataclass
+class Person:
+    name: str
+    homeworld: Planet
+
+    def resolve_visited(
+        self, page_size: int = 5
+    ) -> T(List[Planet], cost=3, multiplier_arg="page_size"):
+        return [self.homeworld] * page_size
+
+
+@with_connection_pagination
+def people(**params) -> Connection(Person):
+    data = [Person(name="Luke", homeworld=Planet(name="Tatooine"))]
+    return prepare_connection_slice(data, params, limit=10)
+
+
+SCHEMA = Schema(queries=[people]).build()
+
+
+def _analyze(query, variables=None):
+    return analyze_query(SCHEMA, graphql.parse(query), variables)._asdict()
+
+
+def test_cost_hints_are_stored_in_field_extensions():
+    person_type = SCHEMA.get_type("Person")
+    assert person_type.fields["visited"].extensions["cost"] == FieldCost(
+        cost=3, multiplier_args=("pageSize",)
+    )
+    assert SCHEMA.query_type.fields["people"].extensions["cost"] == FieldCost(
+        cost=None, multiplier_args=("first", "last")
+    )
+
+
+@pytest.mark.parametrize(
+    "query, variables, expected",
+    [
+        ("{ __typename }", None, (0, 0, 0, 0)),
+        (
+            "{ people(first: 2) { edges { node { name } } } }",
+            None,
+            (4, 4, 0, 1 + 2 * 3),
+        ),
+        (
+            # default multiplier (no `first`/`last`), default page size of visited
+            """
+            query {
+                people { edges { node { ...Visited } } }
+                p: people(last: $last) { pageInfo { hasNextPage } }
+            }
+            fragment Visited on Person { v: visited { name } }
+            """,
+            {"last": 3},
+            (5, 8, 2, (1 + 10 * (1 + 1 + 3 + 5 * 1)) + (1 + 3 * 2)),
+        ),
+    ],
+)
+def test_query_complexity_is_analyzed(query, variables, expected):
+    assert tuple(_analyze(query, variables).values()) == expected
+
+
+def test_complex_queries_are_rejected_or_reported():
+    query = "{ people(first: 100) { edges { node { name } } } }"
+
+    def execute(limits):
+        return asyncio.run(execute_query(SCHEMA, query, complexity_limits=limits))
+
+    result = execute(ComplexityLimits(max_depth=3, max_cost=300))
+    assert result.data is None
+    assert [e.message for e in result.errors] == [
+        "Query depth 4 exceeds the maximum of 3",
+        "Query cost 301 exceeds the maximum of 300",
+    ]
+    assert result.errors[0].extensions["code"] == "QUERY_TOO_COMPLEX"
+
+    result = execute(ComplexityLimits(max_depth=3, report_only=True))
+    assert result.errors is None
+    assert result.data == {"people": {"edges": [{"node": {"name": "Luke"}}]}}
+    assert result.extensions == {
+        "complexity": {"depth": 4, "fields": 4, "aliases": 0, "cost": 301}
+    }
+
+    document = graphql.parse(query)
+    rule = ComplexityLimits(max_fields=3).rule()
+    errors = graphql.validate(SCHEMA, document, [*graphql.specified_rules, rule])
+    assert [e.message for e in errors] == [
+        "Query number of fields 4 exceeds the maximum of 3"
+    ]
+
+
+def test_nested_fragments_are_measured_once():
+    # every fragment doubles the fields of the previous one (2 ** 20 fields)
+    fragments = ["fragment F0 on Person { name }"] + [
+        f"fragment F{i} on Person {{ ...F{i - 1} ... on Person {{ ...F{i - 1} }} }}"
+        for i in range(1, 21)
+    ]
+    query = "{ people(first: 1) { edges { node { ...F20 } } } }\n" + "\n".join(
+        fragments
+    )
+    document = graphql.parse(query)
+
+    started = perf_counter()
+    complexity = analyze_query(SCHEMA, document)
+    assert complexity == (4, 3 + 2 ** 20, 0, 3 + 2 ** 20)
+
+    limits = ComplexityLimits(max_cost=1000)
+    complexity = limits.analyze(SCHEMA, document)
+    assert 1000 < complexity.cost < 2000  # stopped right after the threshold
+    assert len(limits.check(complexity)) == 1
+    assert perf_counter() - started < 1
@@ -0,0 +1,92 @@
+from datetime import time, timedelta
+
+from tests.utils import *
+from gqltype import Schema
+from gqltype.execution import ExecutionContext
+from gqltype.graphql_types import Date, DateTime, Duration, Time
+from gqltype.graphql_types import date as date_module
+from gqltype.graphql_types import datetime as datetime_module
+from gqltype.graphql_types import time as time_module
+
+
+def test_parse_iso_formats():
+    assert Date.parse_value("2020-02-29") == date(2020, 2, 29)
+    # not supported by `date.fromisoformat`, handled by aniso8601
+    assert Date.parse_value("2020-W01-1") == date(2019, 12, 30)
+
+    assert DateTime.parse_value("2020-01-02T03:04:05") == datetime(2020, 1, 2, 3, 4, 5)
+    assert DateTime.serialize("2020-01-02T03:04:05Z") == "2020-01-02T03:04:05+00:00"
+    assert Time.parse_value("03:04:05.123") == time(3, 4, 5, 123000)
+
+    assert Duration.parse_value("P1DT2H3M4S") == timedelta(1, 2 * 3600 + 3 * 60 + 4)
+    assert Duration.parse_value("PT1.5S") == timedelta(seconds=1.5)
+    assert Duration.parse_value("P1W") == timedelta(days=7)
+
+
+@pytest.mark.parametrize(
+    "scalar, value",
+    [
+        # accepted by `fromisoformat` of Python 3.11+, but not by aniso8601
+        (DateTime, "2020-01-02"),
+        (DateTime, "2020-01-02 03:04:05"),
+        (DateTime, "2020-01-02T03:04:05+01:00:30"),
+        (Time, "03:04:05+01:00:30"),
+    ],
+)
+def test_formats_are_the_same_on_all_python_versions(scalar, value):
+    with pytest.raises(ValueError):
+        scalar.parse_value(value)
+
+
+def test_parse_iso_formats_without_fromisoformat(monkeypatch):
+    # Python 3.6 has no `fromisoformat`, values are parsed by aniso8601
+    for module in (date_module, datetime_module, time_module):
+        monkeypatch.setattr(module, "_fromisoformat", None)
+
+    assert Date.parse_value("2020-02-29") == date(2020, 2, 29)
+    assert DateTime.parse_value("2020-01-02T03:04:05") == datetime(2020, 1, 2, 3, 4, 5)
+    assert Time.parse_value("03:04:05") == time(3, 4, 5)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (timedelta(days=1, hours=2, minutes=3, seconds=4), "P1DT2H3M4S"),
+        (timedelta(hours=1), "T1H"),
+        (timedelta(seconds=1, microseconds=500000), "T1.5S"),
+        (timedelta(seconds=-1), "P-1DT23H59M59S"),
+        (timedelta(days=2), "P2D"),
+    ],
+)
+def test_duration_serialization(value, expected):
+    assert Duration.serialize(value) == expected
+
+
+def test_scalar_lists_are_serialized_at_once():
+    def dates() -> List[date]:
+        return [date(2020, 1, 1), "2020-01-02"]
+
+    def optional_dates() -> List[Optional[date]]:
+        return [None, date(2020, 1, 1)]
+
+    def broken_dates() -> List[date]:
+        return [date(2020, 1, 1), None]
+
+    schema = Schema(queries=[dates, optional_dates, broken_dates]).build()
+
+    result = graphql.graphql_sync(
+        schema,
+        "{ dates optionalDates }",
+        execution_context_class=ExecutionContext,
+    )
+    assert result.errors is None
+    assert result.data == {
+        "dates": ["2020-01-01", "2020-01-02"],
+        "optionalDates": [None, "2020-01-01"],
+    }
+
+    result = graphql.graphql_sync(
+        schema, "{ brokenDates }", execution_context_class=ExecutionContext
+    )
+    assert result.data is None
+    assert result.errors[0].path == ["brokenDates", 1]
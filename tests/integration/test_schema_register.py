@@ -0,0 +1,71 @@
+from tests.utils import *
+
+import gqltype
+
+
+@dataclass
+class Planet:
+    name: str
+
+
+@dataclass
+class Person:
+    name: str
+    homeworld: Planet
+
+
+def get_person() -> Person:
+    return Person(name="Luke", homeworld=Planet(name="Tatooine"))
+
+
+def get_planet() -> Planet:
+    return Planet(name="Tatooine")
+
+
+def add_person(name: str) -> Person:
+    ...
+
+
+def test_register_after_build_transforms_only_new_objects():
+    schema = gqltype.Schema(queries=[get_person])
+    first = schema.build()
+
+    schema.register(gqltype.query(get_planet), gqltype.mutation(add_person))
+    second = schema.build(profile=True)
+
+    assert set(second.query_type.fields) == {"getPerson", "getPlanet"}
+    assert set(second.mutation_type.fields) == {"addPerson"}
+
+    # already built fields and types are reused
+    assert second.query_type.fields["getPerson"] is first.query_type.fields["getPerson"]
+    assert second.get_type("Person") is first.get_type("Person")
+    assert set(schema.build_stats.introspection) == {
+        "gqltype.schema.Query",
+        "gqltype.schema.Mutation",
+    }
+
+    result = graphql.graphql_sync(second, "{ getPlanet { name } getPerson { name } }")
+    assert result.errors is None
+    assert result.data == {
+        "getPlanet": {"name": "Tatooine"},
+        "getPerson": {"name": "Luke"},
+    }
+
+
+def test_build_without_changes_reuses_root_types():
+    schema = gqltype.Schema(queries=[get_person])
+
+    assert schema.build().query_type is schema.build().query_type
+
+
+def test_update_schema_of_graphql_app():
+    from gqltype.contrib.starlette import GraphQLApp
+
+    schema = gqltype.Schema(queries=[get_person])
+    app = GraphQLApp(schema)
+    assert set(app.graphql_schema.query_type.fields) == {"getPerson"}
+
+    schema.register(gqltype.query(get_planet))
+    app.update_schema()
+
+    assert set(app.graphql_schema.query_type.fields) == {"getPerson", "getPlanet"}
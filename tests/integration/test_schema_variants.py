@@ -0,0 +1,124 @@
+from tests.utils import *
+from graphql.utilities import print_schema
+
+import gqltype
+
+
+@dataclass
+class Planet:
+    name: str
+    population: gqltype.T(int, extensions={"internal": True})
+
+
+@dataclass
+class Audit:
+    changed_by: str
+
+
+@dataclass
+class Person:
+    name: str
+    homeworld: Planet
+    audit: Audit
+
+
+def get_person() -> Person:
+    return Person(
+        name="Luke",
+        homeworld=Planet(name="Tatooine", population=200000),
+        audit=Audit(changed_by="admin"),
+    )
+
+
+def get_planet() -> Planet:
+    ...
+
+
+def get_audit_log() -> List[Audit]:
+    ...
+
+
+def is_public_field(gql_type, name, field):
+    return not (field.extensions or {}).get("internal")
+
+
+def is_public_type(gql_type):
+    return gql_type.name != "Audit"
+
+
+def test_variants_share_transformed_types():
+    schema = gqltype.Schema(queries=[get_person, get_planet, get_audit_log])
+
+    internal = schema.variant().build()
+    public = schema.variant(
+        queries=[get_person, get_planet],
+        type_filter=is_public_type,
+        field_filter=is_public_field,
+    ).build()
+
+    assert set(internal.query_type.fields) == {"getPerson", "getPlanet", "getAuditLog"}
+    assert set(public.query_type.fields) == {"getPerson", "getPlanet"}
+
+    assert public.get_type("Audit") is None
+    assert set(public.get_type("Person").fields) == {"name", "homeworld"}
+    assert set(public.get_type("Planet").fields) == {"name"}
+    assert set(internal.get_type("Planet").fields) == {"name", "population"}
+
+    # types are transformed once, filtered types (and their referrers) are copied
+    assert public.get_type("Planet") is not internal.get_type("Planet")
+    assert public.get_type("Person") is not internal.get_type("Person")
+    assert public.get_type("Person").fields["homeworld"].type.of_type is (
+        public.get_type("Planet")
+    )
+
+    result = graphql.graphql_sync(public, "{ getPerson { name homeworld { name } } }")
+    assert result.errors is None
+    assert result.data == {
+        "getPerson": {"name": "Luke", "homeworld": {"name": "Tatooine"}}
+    }
+
+
+def test_not_filtered_types_are_shared():
+    @dataclass
+    class Shared:
+        value: int
+
+    @dataclass
+    class Holder:
+        shared: Shared
+        secret: gqltype.T(str, extensions={"internal": True})
+
+    def get_holder() -> Holder:
+        ...
+
+    schema = gqltype.Schema(queries=[get_holder])
+    internal = schema.variant().build()
+    public = schema.variant(field_filter=is_public_field).build()
+
+    assert public.get_type("Shared") is internal.get_type("Shared")
+    assert public.get_type("Holder") is not internal.get_type("Holder")
+    assert set(public.get_type("Holder").fields) == {"shared"}
+
+
+def test_extensions_of_fields_are_not_inherited_by_their_types():
+    @dataclass
+    class Moon:
+        name: str
+        radius: int
+
+    @dataclass
+    class Orbit:
+        moon: gqltype.T(Moon, extensions={"internal": True})
+        nearest_moon: Moon
+
+    def get_orbit() -> Orbit:
+        ...
+
+    schema = gqltype.Schema(queries=[get_orbit])
+    internal = schema.variant().build()
+    public = schema.variant(field_filter=is_public_field).build()
+
+    assert internal.get_type("Orbit").fields["moon"].extensions == {"internal": True}
+    assert internal.get_type("Moon").fields["name"].extensions is None
+    assert set(public.get_type("Orbit").fields) == {"nearestMoon"}
+    assert set(public.get_type("Moon").fields) == {"name", "radius"}
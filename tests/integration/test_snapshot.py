@@ -0,0 +1,94 @@
+import importlib
+import sys
+import textwrap
+
+from tests.utils import *
+from graphql.utilities import print_schema
+
+import gqltype
+from gqltype.cache import InMemoryCache
+from gqltype.utils import clear_class_introspection_cache
+from gqltype.utils.cls import iter_introspected_classes
+
+MODULE_SOURCE = """
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class Planet:
+    name: str
+    population: Optional[int]
+
+
+@dataclass
+class Person:
+    name: str
+
+    def resolve_homeworld(self, info, index: int = 0) -> Planet:
+        ...
+
+
+def get_people(first: int = 10) -> List[Person]:
+    ...
+"""
+
+
+@pytest.fixture
+def module(tmp_path, monkeypatch):
+    (tmp_path / "snapshot_example.py").write_text(textwrap.dedent(MODULE_SOURCE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("snapshot_example")
+    sys.modules.pop("snapshot_example", None)
+
+
+def test_build_with_snapshot(module, tmp_path):
+    snapshot = str(tmp_path / "schema.snapshot")
+
+    schema = gqltype.Schema(queries=[module.get_people])
+    printed = print_schema(schema.build(snapshot=snapshot))
+
+    clear_class_introspection_cache()
+
+    schema = gqltype.Schema(queries=[module.get_people])
+    assert schema.load_snapshot(snapshot)
+
+    restored = {info.cls: info for info in iter_introspected_classes()}
+    assert module.Person in restored and module.Planet in restored
+    assert (
+        restored[module.Person].definitions["resolve_homeworld"].annotation
+        is module.Planet
+    )
+    assert print_schema(schema.build(snapshot=snapshot)) == printed
+
+
+def test_snapshot_is_bound_to_options(module, tmp_path):
+    snapshot = str(tmp_path / "schema.snapshot")
+
+    gqltype.Schema(queries=[module.get_people]).build(snapshot=snapshot)
+
+    schema = gqltype.Schema(queries=[module.get_people], preset__camel_case=False)
+    assert not schema.load_snapshot(snapshot)
+
+
+def test_objects_in_options_do_not_invalidate_snapshots(module, tmp_path):
+    class Backend(InMemoryCache):
+        def __repr__(self):
+            return object.__repr__(self)  # differs in every process
+
+    snapshot = str(tmp_path / "schema.snapshot")
+    gqltype.Schema(queries=[module.get_people], field_cache=Backend()).build(
+        snapshot=snapshot
+    )
+
+    schema = gqltype.Schema(queries=[module.get_people], field_cache=Backend())
+    assert schema.load_snapshot(snapshot)
+
+    schema = gqltype.Schema(
+        queries=[module.get_people], field_cache=Backend(), auto_graphql_id=False
+    )
+    assert not schema.load_snapshot(snapshot)
+
+
+def test_missing_snapshot(tmp_path):
+    assert not gqltype.Schema().load_snapshot(str(tmp_path / "missing"))
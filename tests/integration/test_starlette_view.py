@@ -0,0 +1,75 @@
+import json
+from urllib.parse import urlencode
+
+from tests.utils import *
+from gqltype import Schema, T
+
+pytest.importorskip("starlette")
+
+from gqltype.contrib.starlette import GraphQLApp
+
+
+def hello(name: str = "World") -> str:
+    return f"Hello, {name}!"
+
+
+def test_get_requests_with_invalid_variables_are_rejected():
+    app = GraphQLApp(Schema(queries=[hello]))
+    query = "query($n: String) { hello(name: $n) }"
+
+    params = {"query": query, "variables": "{"}
+    status, _headers, body = call_asgi(
+        app, method="GET", query_string=urlencode(params).encode()
+    )
+    assert (status, b"".join(body)) == (400, b"Invalid JSON")
+
+    params = {"query": query, "variables": '{"n": "A"}'}
+    status, _headers, body = call_asgi(
+        app, method="GET", query_string=urlencode(params).encode()
+    )
+    assert status == 200
+    assert json.loads(b"".join(body)) == {"data": {"hello": "Hello, A!"}}
+
+
+def test_responses_are_streamed():
+    app = GraphQLApp(Schema(queries=[hello]), max_batch_size=200, stream_chunk_size=256)
+    operations = [{"query": f'{{ hello(name: "{i}") }}'} for i in range(150)]
+
+    status, headers, body = call_asgi(
+        app,
+        body=json.dumps(operations).encode(),
+        headers=[("content-type", "application/json")],
+    )
+
+    assert status == 200
+    assert b"content-length" not in headers
+    assert len([chunk for chunk in body if chunk]) > 10
+    assert json.loads(b"".join(body)) == [
+        {"data": {"hello": f"Hello, {i}!"}} for i in range(150)
+    ]
+
+    # encoding errors are raised before the response is started
+    with pytest.raises(TypeError):
+        app.json_response({"data": {"value": object()}})
+
+
+def test_private_values_are_cached_per_user():
+    calls = []
+
+    def secret() -> T(str, cache_ttl=60, cache_scope="private"):
+        calls.append("secret")
+        return "secret"
+
+    app = GraphQLApp(
+        Schema(queries=[secret]), get_user=lambda request: request.headers.get("user")
+    )
+
+    for user in ("1", "1", "2", None):
+        headers = [("content-type", "application/graphql")]
+        if user is not None:
+            headers.append(("user", user))
+        status, _headers, body = call_asgi(app, body=b"{ secret }", headers=headers)
+        assert status == 200
+        assert json.loads(b"".join(body)) == {"data": {"secret": "secret"}}
+
+    assert len(calls) == 3
@@ -0,0 +1,129 @@
+from tests.utils import *
+from gqltype import Schema, T, mutation
+from gqltype.cache import CachePolicy, InMemoryCache
+from gqltype.utils import MISSING
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_in_memory_cache_expires_evicts_and_invalidates():
+    clock = Clock()
+    cache = InMemoryCache(max_size=2, clock=clock)
+
+    cache.set("a", 1, ttl=10, tags=["t"])
+    cache.set("b", 2, ttl=20)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3, ttl=10)  # "b" is the least recently used
+    assert cache.get("b") is MISSING
+    assert cache.stats.evictions == 1
+
+    clock.now = 10
+    assert cache.get("c") is MISSING
+
+    cache.set("c", 3, ttl=10, tags=["t"])
+    assert cache.invalidate(["t"]) == 2  # including expired "a"
+    assert len(cache) == 0
+    assert cache.stats.as_dict() == {
+        "hits": 1,
+        "misses": 2,
+        "bypasses": 0,
+        "evictions": 1,
+        "invalidations": 2,
+        "hit_rate": 1 / 3,
+    }
+
+
+def test_field_values_are_cached_and_invalidated_by_mutations():
+    calls = []
+
+    @dataclass
+    class Planet:
+        id: str
+        name: str
+
+    @dataclass
+    class Person:
+        id: str
+
+        def resolve_homeworld(self) -> T(Planet, cache_ttl=60, cache_tags=["pl"]):
+            calls.append(self.id)
+            return Planet(id="1", name=f"Tatooine {len(calls)}")
+
+        def resolve_secret(self) -> T(str, cache_ttl=60, cache_scope="private"):
+            calls.append("secret")
+            return "secret"
+
+    def person(id: str) -> Person:
+        return Person(id=id)
+
+    @mutation
+    def rename_planets() -> T(bool, invalidate_cache_tags=["pl"]):
+        return True
+
+    schema = Schema(queries=[person], mutations=[rename_planets])
+    gql_schema = schema.build()
+
+    def execute(query, **kw):
+        result = graphql.graphql_sync(gql_schema, query, **kw)
+        assert result.errors is None
+        return result.data
+
+    query = """{
+        a: person(id: "1") { homeworld { name } }
+        b: person(id: "2") { homeworld { name } }
+    }"""
+    assert execute(query) == {
+        "a": {"homeworld": {"name": "Tatooine 1"}},
+        "b": {"homeworld": {"name": "Tatooine 2"}},
+    }
+    assert execute(query) == execute(query)
+    assert calls == ["1", "2"]
+
+    execute("mutation { renamePlanets }")
+    assert execute('{ person(id: "1") { homeworld { name } } }') == {
+        "person": {"homeworld": {"name": "Tatooine 3"}}
+    }
+
+    # private values are cached per user, not cached for anonymous users
+    query = '{ person(id: "1") { secret } }'
+    for context in ({}, {}, {"user": 1}, {"user": 1}, {"user": 2}):
+        execute(query, context_value=context)
+    assert calls.count("secret") == 4
+
+    stats = schema.field_cache.stats
+    assert (stats.hits, stats.misses, stats.bypasses) == (5, 5, 2)
+
+    field = gql_schema.get_type("Person").fields["homeworld"]
+    assert field.extensions["cache"] == CachePolicy(60, "public", ["pl"])
+
+
+def test_values_of_sources_without_id_are_not_cached():
+    calls = []
+
+    @dataclass
+    class Greeter:
+        name: str
+
+        def resolve_greeting(self) -> T(str, cache_ttl=60):
+            calls.append(self.name)
+            return f"Hello, {self.name}!"
+
+    def greeter() -> Greeter:
+        return Greeter(name="Luke")
+
+    schema = Schema(queries=[greeter])
+    gql_schema = schema.build()
+
+    for _ in range(2):
+        result = graphql.graphql_sync(gql_schema, "{ greeter { greeting } }")
+        assert result.data == {"greeter": {"greeting": "Hello, Luke!"}}
+
+    assert calls == ["Luke", "Luke"]
+    assert len(schema.field_cache) == 0
+    assert schema.field_cache.stats.bypasses == 2
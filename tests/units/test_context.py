@@ -0,0 +1,59 @@
+import pytest
+
+from gqltype.context import RootContext
+from gqltype.utils.camel_case import to_camel_case
+
+
+def test_derived_context_overrides_options():
+    root = RootContext()
+    ctx = root(explicit_nullability=False, extra=1)
+
+    assert root.explicit_nullability is True
+    assert ctx.explicit_nullability is False
+    assert ctx.extra == 1
+    assert "extra" in ctx and "extra" not in root
+    assert ctx.get("extra") == 1 and root.get("extra", 2) == 2
+    assert ctx["extra"] == 1
+
+    with pytest.raises(KeyError):
+        root["extra"]
+
+
+def test_changes_are_propagated_to_derived_contexts():
+    root = RootContext()
+    ctx = root()
+    overridden = ctx(name_converter=str.upper)
+
+    root.update({"preset__camel_case": True})
+
+    assert ctx.name_converter is to_camel_case
+    assert ctx.hook__convert_name("some_name", for_type=None) == "someName"
+    assert overridden.name_converter is str.upper
+
+
+def test_changes_are_not_propagated_to_parent_context():
+    root = RootContext()
+    ctx = root()
+    ctx.debug = True
+
+    assert ctx.debug is True
+    assert root.debug is False
+
+
+def test_hooks_can_be_overridden_with_options():
+    ctx = RootContext(hook__convert_name=lambda name, for_type: name.upper())
+
+    assert ctx.hook__convert_name("name", for_type=None) == "NAME"
+    # unknown hooks behave as identity function
+    assert ctx.hook__unknown("value") == "value"
+
+
+def test_presets():
+    ctx = RootContext()
+    ctx.register_preset("upper", lambda val: ctx.update({"upper": val}))
+
+    derived = ctx(preset__upper=True)
+    assert derived.upper is True
+
+    with pytest.raises(AttributeError):
+        RootContext(preset__unknown=True)
@@ -0,0 +1,106 @@
+import asyncio
+
+from tests.utils import *
+from gqltype import Schema
+from gqltype.dataloader import DataLoader, Loaders
+
+
+def _batch_load_fn(calls):
+    async def load(keys):
+        calls.append(keys)
+        return [KeyError(key) if key < 0 else key * 10 for key in keys]
+
+    return load
+
+
+def test_keys_of_a_tick_are_loaded_in_batches():
+    calls = []
+
+    async def main():
+        loader = DataLoader(_batch_load_fn(calls), max_batch_size=2)
+        values = await asyncio.gather(*(loader.load(key) for key in [1, 2, 1, 3]))
+        assert values == [10, 20, 10, 30]
+        # cached values are not loaded again
+        assert await loader.load_many([3, 2]) == [30, 20]
+
+        with pytest.raises(KeyError):
+            await loader.load(-1)
+
+        loader.clear(1)
+        loader.prime(4, 40)
+        assert await loader.load_many([1, 4]) == [10, 40]
+
+    asyncio.run(main())
+    assert calls == [[1, 2], [3], [-1], [1]]
+
+
+def test_failed_batches_are_not_cached():
+    calls = []
+
+    def load(keys):
+        calls.append(keys)
+        return []
+
+    async def main():
+        loader = DataLoader(load)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await loader.load(1)
+
+    asyncio.run(main())
+    assert calls == [[1], [1]]
+
+
+def test_errors_of_batches_are_set_on_every_future():
+    async def load(keys):
+        raise RuntimeError("storage is down")
+
+    async def slow_load(keys):
+        await asyncio.sleep(10)
+
+    async def main():
+        loader = DataLoader(load, max_batch_size=2)
+        results = await asyncio.gather(
+            *(loader.load(key) for key in [1, 2, 3]), return_exceptions=True
+        )
+        assert [str(result) for result in results] == ["storage is down"] * 3
+        assert not loader._tasks
+
+        loader = DataLoader(slow_load)
+        future = loader.load(1)
+        await asyncio.sleep(0)
+        (task,) = loader._tasks
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await future
+        assert not loader._tasks
+
+    asyncio.run(main())
+
+
+def test_resolvers_receive_loaders_of_the_request():
+    calls = []
+    load = _batch_load_fn(calls)
+
+    @dataclass
+    class Item:
+        id: int
+
+        async def resolve_value(self, loaders) -> int:
+            return await loaders[load].load(self.id)
+
+    def items() -> List[Item]:
+        return [Item(id=1), Item(id=2), Item(id=1)]
+
+    schema = Schema(queries=[items]).build()
+    context = {}
+    result = asyncio.run(
+        graphql.graphql(schema, "{ items { value } }", context_value=context)
+    )
+
+    assert result.errors is None
+    assert result.data == {"items": [{"value": 10}, {"value": 20}, {"value": 10}]}
+    assert calls == [[1, 2]]
+    # loaders are created on the first use
+    assert isinstance(context["loaders"], Loaders)
+    assert load in context["loaders"]
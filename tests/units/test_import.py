@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+import pytest
+
+import gqltype
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="imported eagerly on 3.6")
+def test_import_does_not_load_graphql():
+    code = (
+        "import sys, gqltype; "
+        "print(' '.join(m for m in ('graphql', 'aniso8601') if m in sys.modules))"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], universal_newlines=True
+    )
+
+    assert output.strip() == ""
+
+
+def test_lazy_attributes():
+    from gqltype.schema import Schema
+    from gqltype.graphql_types import ID
+
+    assert gqltype.Schema is Schema
+    assert gqltype.ID.type_ is ID
+    assert gqltype.ID is gqltype.ID
+    assert {"Schema", "ID", "Duration"} <= set(dir(gqltype))
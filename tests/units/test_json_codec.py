@@ -0,0 +1,90 @@
+from datetime import date, datetime
+from decimal import Decimal
+import sys
+from types import SimpleNamespace
+from uuid import UUID
+
+from tests.utils import *
+from gqltype.contrib.json_codec import (
+    CODECS,
+    JSONCodec,
+    get_json_codec,
+    iter_json_chunks,
+)
+
+
+def _available_codecs():
+    codecs = []
+    for codec_cls in CODECS:
+        try:
+            codecs.append(codec_cls())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=repr)
+def test_codecs_encode_to_bytes(codec):
+    data = {
+        "data": {"items": [{"id": 1, "name": "Łuk", "price": 1.5, "ok": None}]},
+        "extensions": {
+            "amount": Decimal("1.10"),
+            "uuid": UUID(int=1),
+            "day": date(2020, 1, 2),
+            "at": datetime(2020, 1, 2, 3, 4, 5),
+            "colors": {"red"},
+        },
+    }
+
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {
+        "data": data["data"],
+        "extensions": {
+            "amount": "1.10",
+            "uuid": "00000000-0000-0000-0000-000000000001",
+            "day": "2020-01-02",
+            "at": "2020-01-02T03:04:05",
+            "colors": ["red"],
+        },
+    }
+    with pytest.raises(ValueError):
+        codec.loads(b"{")
+    with pytest.raises(TypeError):
+        codec.dumps({"obj": object()})
+
+
+def test_json_codec_is_chosen_by_name():
+    assert type(get_json_codec("json")) is JSONCodec
+    assert get_json_codec().name == _available_codecs()[0].name
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")
+
+
+def test_old_ujson_is_not_used(monkeypatch):
+    # `default` of `dumps` is not supported before ujson 5
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "ujson", SimpleNamespace(__version__="4.3.0"))
+
+    assert type(get_json_codec()) is JSONCodec
+    with pytest.raises(ImportError):
+        get_json_codec("ujson")
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=repr)
+def test_large_responses_are_encoded_in_chunks(codec):
+    data = {
+        "data": {
+            "rows": [{"id": i, "tags": ["a"] * 3} for i in range(1000)],
+            "nested": [{"rows": list(range(200))}],
+            "small": [1, 2],
+        },
+        "errors": None,
+    }
+
+    chunks = list(iter_json_chunks(data, codec, chunk_size=1024))
+
+    assert len(chunks) > 10
+    assert max(len(chunk) for chunk in chunks) < 1024 + 100
+    assert codec.loads(b"".join(chunks)) == data
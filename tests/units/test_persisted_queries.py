@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from tests.utils import call_asgi
+from gqltype import Schema
+from gqltype.contrib.persisted_queries import PersistedQueries, get_query_hash
+from gqltype.exceptions import (
+    PersistedQueryInvalid,
+    PersistedQueryNotAllowed,
+    PersistedQueryNotFound,
+)
+
+QUERY = "{ hello }"
+HASH = get_query_hash(QUERY)
+
+
+def _extensions(query_hash=HASH):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+def test_queries_are_registered_on_miss(tmp_path):
+    path = tmp_path / "queries.json"
+    queries = PersistedQueries(max_size=1, path=path)
+
+    assert queries.resolve(QUERY, None) == QUERY
+    with pytest.raises(PersistedQueryNotFound):
+        queries.resolve(None, _extensions())
+    with pytest.raises(PersistedQueryInvalid):
+        queries.resolve("{ other }", _extensions())
+
+    assert queries.resolve(QUERY, _extensions()) == QUERY
+    # query params of GET requests are JSON encoded
+    assert queries.resolve(None, json.dumps(_extensions())) == QUERY
+
+    # registered queries are written by explicit `save()` only
+    assert not path.exists()
+    queries.save()
+    assert json.loads(path.read_text()) == {HASH: QUERY}
+    # and survive restarts
+    assert PersistedQueries(path=path).resolve(None, _extensions()) == QUERY
+
+
+def test_only_recently_used_registered_queries_are_kept():
+    queries = PersistedQueries(max_size=2, queries={"hello": QUERY})
+
+    other_queries = [f"{{ f{i} }}" for i in range(3)]
+    for query in other_queries:
+        queries.resolve(query, _extensions(get_query_hash(query)))
+
+    assert [queries.get(get_query_hash(query)) for query in other_queries] == [
+        None,
+        *other_queries[1:],
+    ]
+    # pre-registered queries are never evicted
+    assert queries.get(HASH) == QUERY
+
+
+def test_allowlist_mode_executes_only_registered_queries():
+    queries = PersistedQueries(allowlist=True, queries={"hello": QUERY})
+
+    assert queries.resolve(None, _extensions()) == QUERY
+
+    other = "{ other }"
+    with pytest.raises(PersistedQueryNotAllowed):
+        queries.resolve(other, _extensions(get_query_hash(other)))
+    with pytest.raises(PersistedQueryNotAllowed):
+        queries.resolve(other, None)
+
+
+def test_persisted_queries_in_starlette_view():
+    pytest.importorskip("starlette")
+    from gqltype.contrib.starlette import GraphQLApp
+
+    def hello() -> str:
+        return "Hello!"
+
+    app = GraphQLApp(Schema(queries=[hello]), persisted_queries=PersistedQueries())
+
+    def post(data):
+        status, _headers, body = call_asgi(
+            app,
+            body=json.dumps(data).encode(),
+            headers=[("content-type", "application/json")],
+        )
+        return status, json.loads(b"".join(body))
+
+    # clients send the query text after "not found" errors with 200
+    status, data = post({"extensions": _extensions()})
+    assert status == 200
+    assert data["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+    assert post({"query": QUERY, "extensions": _extensions()}) == (
+        200,
+        {"data": {"hello": "Hello!"}},
+    )
+    assert post({"extensions": _extensions()}) == (
+        200,
+        {"data": {"hello": "Hello!"}},
+    )
+
+    status, data = post({"query": "{ other }", "extensions": _extensions("0" * 64)})
+    assert status == 400
+    assert data["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_INVALID"
@@ -0,0 +1,39 @@
+from tests.utils import *
+from gqltype.context import RootContext
+from gqltype.transform.transformer import Transformer
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "GREEN_VALUE"
+    BLUE = "RED"
+
+
+def _transform(enum_cls):
+    return Transformer(RootContext()).transform(enum_cls, allow_null=True)
+
+
+def test_enum_serializes_members_values_and_names():
+    gql_t = _transform(Color)
+
+    assert gql_t.serialize(Color.RED) == "RED"
+    assert gql_t.serialize("red") == "RED"
+    assert gql_t.serialize("GREEN_VALUE") == "GREEN"
+    assert gql_t.serialize("GREEN") == "GREEN"
+    # raw values take precedence over names
+    assert gql_t.serialize("RED") == "BLUE"
+
+    with pytest.raises(ValueError):
+        gql_t.serialize("unknown")
+
+
+def test_enum_parses_names():
+    gql_t = _transform(Color)
+
+    assert gql_t.parse_value("BLUE") is Color.BLUE
+    assert gql_t.parse_literal(graphql.parse_value("GREEN")) is Color.GREEN
+
+    with pytest.raises(graphql.GraphQLError):
+        gql_t.parse_value("red")
+    with pytest.raises(graphql.GraphQLError):
+        gql_t.parse_literal(graphql.parse_value('"RED"'))
@@ -0,0 +1,72 @@
+from tests.utils import *
+from gqltype.context import RootContext
+from gqltype.transform.transformer import Transformer
+from gqltype.utils import resolve_thunk
+
+
+class CustomType:
+    pass
+
+
+class custom_transformation:
+    GraphQLCustom = graphql.GraphQLScalarType(name="Custom")
+
+    @staticmethod
+    def can_transform(t, ctx):
+        return t is CustomType
+
+    @classmethod
+    def transform(cls, t, ctx):
+        return cls.GraphQLCustom
+
+
+def test_transform_uses_types_cache_before_thunk_resolution():
+    transformer = Transformer(RootContext())
+
+    @dataclass
+    class ExampleType:
+        attr: int
+
+    gql_t = transformer.transform(ExampleType, allow_null=True)
+    assert ExampleType in transformer.types_cache
+
+    assert transformer.transform(ExampleType, allow_null=True) is gql_t
+    assert_that(transformer.transform(ExampleType), is_graphql_type("ExampleType!"))
+    assert_that(
+        transformer.transform(lambda: ExampleType), is_graphql_type("ExampleType!")
+    )
+
+
+def test_classification_is_cached_per_type():
+    transformer = Transformer(RootContext())
+
+    assert_that(transformer.transform(List[int]), is_graphql_type("[Int!]!"))
+    assert List[int] in transformer._dispatch_cache
+    assert_that(transformer.transform(List[int]), is_graphql_type("[Int!]!"))
+
+
+def test_custom_transformation_invalidates_classification_cache():
+    transformer = Transformer(RootContext())
+
+    # `CustomType` is classified as a regular class first
+    transformer._classify(CustomType, transformer.ctx)
+
+    transformer.transformations.insert(0, custom_transformation)
+
+    assert_that(
+        transformer.transform(CustomType, allow_null=True), is_graphql_type("Custom")
+    )
+
+
+def test_resolve_thunk():
+    class ExampleType:
+        pass
+
+    assert resolve_thunk(lambda: ExampleType) is ExampleType
+    assert resolve_thunk(ExampleType) is ExampleType
+
+    fn = lambda *args: ExampleType
+    assert resolve_thunk(fn) is fn
+
+    fn = lambda a: ExampleType
+    assert resolve_thunk(fn) is fn
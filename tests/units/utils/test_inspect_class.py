@@ -0,0 +1,80 @@
+from tests.utils import *
+from gqltype.utils import inspect_class, get_attr_definitions
+from gqltype.utils.func import inspect_function
+
+
+def test_inspect_class_is_cached():
+    class ExampleType:
+        attr: int
+
+    assert inspect_class(ExampleType) is inspect_class(ExampleType)
+
+
+def test_inspect_class_collects_attributes_over_mro():
+    class Base:
+        attr: int
+        value = 1
+
+        def resolve_attr(self) -> int:
+            ...
+
+    class ExampleType(Base):
+        value = 2
+
+        @staticmethod
+        def resolve_static() -> str:
+            ...
+
+    info = inspect_class(ExampleType)
+
+    assert info.attributes["value"] == 2
+    assert info.attributes["resolve_attr"] is Base.resolve_attr
+    assert info.attributes["resolve_static"] is ExampleType.resolve_static
+
+    assert [d.name for d in info.props] == ["attr", "value"]
+    assert [d.name for d in info.funcs] == ["resolve_attr", "resolve_static"]
+    assert info.definitions["resolve_static"].annotation is str
+
+
+def test_inspect_class_does_not_trigger_descriptors():
+    calls = []
+
+    class Descriptor:
+        def __get__(self, obj, owner):
+            calls.append(owner)
+            return self
+
+    class ExampleType:
+        attr: int
+        descr = Descriptor()
+
+    inspect_class(ExampleType)
+
+    assert calls == []
+
+
+def test_get_attr_definitions():
+    @dataclass
+    class ExampleType:
+        attr: int
+        skipped: int
+
+        __graphql_fields__ = ("attr", "resolve_x")
+
+        def resolve_x(self) -> str:
+            ...
+
+    assert list(get_attr_definitions(ExampleType)) == ["attr", "resolve_x"]
+    assert list(get_attr_definitions(ExampleType, only_props=True)) == ["attr"]
+    assert list(get_attr_definitions(ExampleType, only_funcs=True)) == ["resolve_x"]
+    assert set(inspect_class(ExampleType).dataclass_fields) == {"attr", "skipped"}
+
+
+def test_inspect_function_is_cached():
+    def fn(a: int, b: str = "b") -> bool:
+        ...
+
+    params = inspect_function(fn)
+
+    assert params == (["a", "b"], {"b": "b"}, {"a": int, "b": str, "return": bool})
+    assert inspect_function(fn) is params
@@ -0,0 +1,207 @@
+import asyncio
+from dataclasses import dataclass
+import inspect
+from typing import List, NamedTuple
+
+import graphql
+import pytest
+
+from gqltype import Schema, batch_resolver
+from gqltype.context import RootContext
+from gqltype.dataloader import Loaders
+from gqltype.execution import DocumentCache, execute_query
+from gqltype.utils.resolver import (
+    prepare_default_field_resolver,
+    prepare_field_resolver,
+    prepare_resolver_with_value_converters,
+)
+
+
+def _prepare(fn, compile_resolver_wrappers, converters=None):
+    ctx = RootContext(
+        compile_resolver_wrappers=compile_resolver_wrappers,
+        extra_special_params={
+            "request": lambda call_ctx: ("request", dict(call_ctx.params))
+        },
+        hook__prepare_resolver_param_value_converter=(
+            lambda arg_name, **kw: (converters or {}).get(arg_name)
+        ),
+    )
+    resolve_fn, arguments = prepare_field_resolver(ctx, "field", None, fn)
+    resolve_fn = prepare_resolver_with_value_converters(
+        ctx,
+        resolve_fn,
+        [(name, type_, default, None) for name, type_, default in arguments],
+    )
+    return resolve_fn, arguments
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_resolver_wrapper_passes_special_params(compiled):
+    def resolve(self, info, value: int, request, *, flag: bool = False):
+        return self, info, value, request, flag
+
+    resolve_fn, arguments = _prepare(resolve, compiled, {"value": str})
+
+    assert [arg[0] for arg in arguments] == ["value", "flag"]
+    assert inspect.unwrap(resolve_fn) is resolve
+    assert resolve_fn("source", "info", value=1) == (
+        "source",
+        "info",
+        "1",
+        ("request", {"value": "1"}),
+        False,
+    )
+    assert resolve_fn("source", "info", value=1, flag=True)[-1] is True
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_resolver_wrapper_without_special_params(compiled):
+    def resolve(a: int = 1, b: int = 2, **rest):
+        return a, b, rest
+
+    resolve_fn, _ = _prepare(resolve, compiled, {"a": lambda v: v * 10})
+
+    assert resolve_fn(None, None) == (1, 2, {})
+    assert resolve_fn(None, None, a=2, c=3) == (20, 2, {"c": 3})
+
+
+def test_compiled_wrapper_converts_values_of_custom_resolvers():
+    ctx = RootContext(
+        hook__prepare_resolver_param_value_converter=lambda **kw: str,
+    )
+
+    def resolve(source, info, **kwargs):
+        return source, info, kwargs
+
+    resolve_fn = prepare_resolver_with_value_converters(
+        ctx, resolve, [("a", int, None, None)]
+    )
+
+    assert resolve_fn(1, 2, a=3, b=4) == (1, 2, {"a": "3", "b": 4})
+
+
+def test_default_resolver_is_not_needed_for_unchanged_names():
+    ctx = RootContext(preset__camel_case=True)
+
+    assert prepare_default_field_resolver(ctx, "name", None) == (None, ())
+    assert prepare_default_field_resolver(RootContext(), "some_name", None) == (
+        None,
+        (),
+    )
+
+
+def test_default_resolver_reads_values_by_original_name():
+    class Point(NamedTuple):
+        x: int
+        some_value: int
+
+    @dataclass
+    class Data:
+        some_value: int
+
+    class Slotted:
+        __slots__ = ("some_value",)
+
+    ctx = RootContext(preset__camel_case=True)
+    resolve, _ = prepare_default_field_resolver(ctx, "some_value", None)
+
+    slotted = Slotted()
+    assert resolve(slotted, None) is None
+    slotted.some_value = 4
+
+    assert resolve({"some_value": 1}, None) == 1
+    assert resolve({}, None) is None
+    assert resolve(Point(x=0, some_value=2), None) == 2
+    assert resolve(Data(some_value=3), None) == 3
+    assert resolve(slotted, None) == 4
+    assert resolve(object(), None) is None
+
+
+def test_batch_resolver_is_called_once_per_field_node():
+    calls = []
+
+    @dataclass
+    class Item:
+        id: int
+
+        @batch_resolver
+        async def resolve_double(sources, info, factor: int = 2) -> List[int]:
+            calls.append(([source.id for source in sources], factor))
+            return [source.id * factor for source in sources]
+
+        @batch_resolver
+        def resolve_broken(sources) -> List[int]:
+            return []
+
+    def items() -> List[Item]:
+        return [Item(id=1), Item(id=2)]
+
+    schema = Schema(queries=[items]).build()
+    query = "{ items { double triple: double(factor: 3) } }"
+    result = asyncio.run(graphql.graphql(schema, query, context_value={}))
+
+    assert result.errors is None
+    assert result.data == {
+        "items": [{"double": 2, "triple": 3}, {"double": 4, "triple": 6}]
+    }
+    assert sorted(calls) == [([1, 2], 2), ([1, 2], 3)]
+
+    query = "{ items { broken } }"
+    result = asyncio.run(graphql.graphql(schema, query, context_value={}))
+    assert result.data is None
+    assert "same length as the sources" in result.errors[0].message
+
+
+def test_batch_resolver_is_not_shared_by_operations_with_the_same_document():
+    calls = []
+
+    @dataclass
+    class Item:
+        id: int
+
+        @batch_resolver
+        def resolve_label(sources, prefix: str) -> List[str]:
+            calls.append(([source.id for source in sources], prefix))
+            return [f"{prefix} {source.id}" for source in sources]
+
+    def items() -> List[Item]:
+        return [Item(id=1), Item(id=2)]
+
+    schema = Schema(queries=[items]).build()
+    query = "query($p: String!) { items { label(prefix: $p) } }"
+    document_cache = DocumentCache()
+
+    async def main():
+        context = {"loaders": Loaders()}
+        return await asyncio.gather(
+            *(
+                execute_query(
+                    schema,
+                    query,
+                    document_cache=document_cache,
+                    variable_values={"p": prefix},
+                    context_value=context,
+                )
+                for prefix in ("hi", "bye")
+            )
+        )
+
+    hi, bye = asyncio.run(main())
+
+    assert hi.data == {"items": [{"label": "hi 1"}, {"label": "hi 2"}]}
+    assert bye.data == {"items": [{"label": "bye 1"}, {"label": "bye 2"}]}
+    assert sorted(calls) == [([1, 2], "bye"), ([1, 2], "hi")]
+
+
+def test_batch_resolver_must_return_list():
+    class Item:
+        @batch_resolver
+        def resolve_value(sources) -> int:
+            ...
+
+    def item() -> Item:
+        ...
+
+    with pytest.raises(TypeError, match="must return List"):
+        Schema(queries=[item]).build()
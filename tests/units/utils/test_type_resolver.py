@@ -0,0 +1,138 @@
+from abc import ABC
+from unittest.mock import Mock
+
+from tests.utils import *
+from gqltype import Schema
+from gqltype.utils.type_resolver import (
+    TypeResolver,
+    by_attribute,
+    by_id_prefix,
+    by_key,
+)
+
+
+@dataclass
+class Cat:
+    name: str
+
+
+@dataclass
+class Dog:
+    name: str
+
+
+class Puppy(Dog):
+    pass
+
+
+CatType = graphql.GraphQLObjectType("Cat", {})
+DogType = graphql.GraphQLObjectType("Dog", {})
+TYPES_MAP = {Cat: CatType, Dog: DogType}
+
+
+def test_resolves_subclasses_and_proxies():
+    class DogProxy:
+        __class__ = property(lambda self: Puppy)
+
+    resolve = TypeResolver(TYPES_MAP)
+
+    assert resolve(Cat(name="Tom"), None, None) is CatType
+    assert resolve(Puppy(name="Rex"), None, None) is DogType
+    assert resolve(DogProxy(), None, None) is DogType
+    assert resolve({"__typename": "Dog"}, None, None) is None
+
+
+@pytest.mark.parametrize(
+    "discriminator, value",
+    [
+        (by_key(), {"__typename": "Dog"}),
+        (by_key("kind", tags={"dog": Dog}), {"kind": "dog"}),
+        (by_attribute("kind", tags={"dog": Dog}), Mock(kind="dog")),
+        (by_id_prefix({"dogs": Dog}), {"id": "dogs:1"}),
+    ],
+)
+def test_resolves_values_by_discriminator(discriminator, value):
+    resolve = TypeResolver(TYPES_MAP, discriminator=discriminator)
+
+    assert resolve(value, None, None) is DogType
+    assert resolve({}, None, None) is None
+
+
+def test_union_values_are_resolved_by_typename():
+    def pets() -> List[Union[Cat, Dog]]:
+        return [Puppy(name="Rex"), {"__typename": "Cat", "name": "Tom"}]
+
+    schema = Schema(queries=[pets]).build()
+    result = graphql.graphql_sync(
+        schema, "{ pets { __typename ... on Cat { name } ... on Dog { name } } }"
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "pets": [
+            {"__typename": "Dog", "name": "Rex"},
+            {"__typename": "Cat", "name": "Tom"},
+        ]
+    }
+
+
+def _interface_schema(**options):
+    @dataclass
+    class Animal(ABC):
+        name: str
+
+    @dataclass
+    class Bird(Animal):
+        wings: int
+
+    @dataclass
+    class Fish(Animal):
+        fins: int
+
+    class Shark(Fish):
+        pass
+
+    def animals() -> List[Animal]:
+        return [Bird(name="Tweety", wings=2), Shark(name="Bruce", fins=5)]
+
+    def birds() -> List[Bird]:
+        ...
+
+    def fishes() -> List[Fish]:
+        ...
+
+    schema = Schema(queries=[animals, birds, fishes], **options)
+    return schema, schema.build(), Shark
+
+
+QUERY = "{ animals { __typename name } }"
+
+
+def test_interface_implementations_are_discovered_lazily():
+    schema, gql_schema, shark = _interface_schema()
+
+    # not used in the schema, so not transformed during build
+    assert shark not in schema.transformer.types_cache
+
+    result = graphql.graphql_sync(gql_schema, QUERY)
+
+    # leaf implementations are transformed on the first resolution
+    assert shark in schema.transformer.types_cache
+    assert "'Shark' that does not exist inside the schema" in str(result.errors)
+
+
+def test_interface_implementations_can_be_restricted_to_schema():
+    schema, gql_schema, shark = _interface_schema(
+        restrict_implementations_to_schema=True
+    )
+
+    result = graphql.graphql_sync(gql_schema, QUERY)
+
+    assert result.errors is None
+    assert result.data == {
+        "animals": [
+            {"__typename": "Bird", "name": "Tweety"},
+            {"__typename": "Fish", "name": "Bruce"},
+        ]
+    }
+    assert shark not in schema.transformer.types_cache
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date, datetime
 from dataclasses import dataclass, field, InitVar
 from decimal import Decimal
@@ -84,3 +85,30 @@ def is_graphql_argument(
     matchers = [instance_of(graphql.GraphQLArgument), has_properties(**_matchers)]
 
     return all_of(*matchers)
+
+
+def call_asgi(app, method="POST", body=b"", headers=(), query_string=b""):
+    """Calls an ASGI app, returns status, headers and body messages of the response"""
+    scope = {
+        "type": "http",
+        "asgi": {"spec_version": "2.4"},
+        "method": method,
+        "path": "/graphql",
+        "query_string": query_string,
+        "headers": [(name.encode(), value.encode()) for name, value in headers],
+    }
+    received = []
+    messages = []
+
+    async def receive():
+        if not received:
+            received.append(body)
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.Event().wait()  # the client never disconnects
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, *body_messages = messages
+    return start["status"], dict(start["headers"]), [m["body"] for m in body_messages]